@@ -0,0 +1,66 @@
+"""
+Particle Render Benchmark
+Compares the Numba splat renderer with the sprite-blit fallback for the weather particle pool
+
+Run from the mikamon_1.3 folder:
+    python benchmarks/particle_render.py
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+import pygame
+
+from python.weather import BatchParticleSystem
+
+PARTICLE_COUNTS = [1000, 5000, 15000]
+SCREEN_SIZE = (1920, 1080)
+FRAMES = 60
+
+
+def fill_system(count, seed=1234):
+    """Build a particle pool with a rain/mist-like mix of sizes and lifetimes"""
+    rng = np.random.default_rng(seed)
+    system = BatchParticleSystem(max_particles=count)
+    system.positions[:count, 0] = rng.uniform(0, SCREEN_SIZE[0], count)
+    system.positions[:count, 1] = rng.uniform(0, SCREEN_SIZE[1], count)
+    system.colors[:count] = rng.integers(0, 256, (count, 3))
+    system.sizes[:count] = rng.uniform(1, 6, count)
+    system.max_lifetimes[:count] = 2000
+    system.lifetimes[:count] = rng.uniform(1, 2000, count)
+    system.active_count = count
+    return system
+
+
+def time_draw(draw, screen):
+    """Average milliseconds per draw call over FRAMES frames"""
+    draw(screen)  # warm-up (JIT compile, atlas fill)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        screen.fill((40, 60, 90))
+        draw(screen)
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+
+    print(f"{'particles':>10} {'blits ms':>10} {'splat ms':>10} {'speedup':>8}")
+    for count in PARTICLE_COUNTS:
+        system = fill_system(count)
+        blit_ms = time_draw(system.draw_blits, screen)
+        splat_ms = time_draw(system.draw_splat, screen)
+        print(f"{count:>10} {blit_ms:>10.2f} {splat_ms:>10.2f} {blit_ms / splat_ms:>7.1f}x")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
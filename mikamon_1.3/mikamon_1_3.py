@@ -1,4 +1,6 @@
 import sys, random, os, math
+from python.startup_profiler import startup_profiler
+startup_profiler.start()
 os.environ['SDL_VIDEO_ALLOW_SCREENSAVER'] = '1'
 os.environ['SDL_VIDEO_WINDOW_POS'] = 'centered'
 if sys.platform == "win32":
@@ -19,8 +21,9 @@ from python.main_menu import main_menu
 from python.pygame1 import FONT, SMALL_FONT, BIG_FONT, CLOCK
 
 # Initialize mixer BEFORE importing music functions
-pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=512)
-pygame.mixer.init()
+with startup_profiler.phase("mixer init"):
+    pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=512)
+    pygame.mixer.init()
 
 # Verify mixer initialization
 if not pygame.mixer.get_init():
@@ -41,29 +44,9 @@ from python.fullscreen_toggle import (
     draw_fullscreen_button, get_scaled_coordinates, scale_background_for_resolution
 )
 
-def setup_music_system():
-    """Setup the music system with proper initialization order"""
-    print("Setting up music system...")
-    
-    # Step 1: Initialize the music file search system
-    if not initialize_music_system():
-        print("Failed to initialize music system")
-        return False
-    
-    # Step 2: Load music files
-    title_loaded = load_title_music()
-    fight_loaded = load_fight_music()
-    
-    # Step 3: Get status
-    status = get_music_status()
-    
-    print(f"Music system status:")
-    print(f"  Mixer initialized: {status['mixer_initialized']}")
-    print(f"  Title music loaded: {status['title_loaded']}")
-    print(f"  Fight music loaded: {status['fight_loaded']}")
-    
-    # Step 4: Start title music if available
-    if title_loaded:
+def start_title_music():
+    """Start the title music once it has loaded (a main-thread loading job)"""
+    if get_music_status()["title_loaded"]:
         if play_title_music():
             print("Title music started successfully")
         else:
@@ -71,15 +54,6 @@ def setup_music_system():
     else:
         print("Could not load title music - check file location")
         print("Expected location: music/Title_Screen_music.wav")
-    
-    if not fight_loaded:
-        print("Could not load fight music - check file location")
-        print("Expected location: music/fight_music.wav")
-    
-    return title_loaded or fight_loaded
-
-# Call the setup function instead of individual calls
-music_system_working = setup_music_system()
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -101,76 +75,46 @@ from python.character_select_inventory import (
     handle_char_select_inv_scroll, 
     reset_char_select_inv_scroll
 )
-def load_sprite(filename, size=(80, 80), fallback_color=GRAY):
-    """Load sprite image with fallback to colored rectangle with border"""
-    try:
-        if os.path.exists(filename):
-            image = pygame.image.load(filename)
-            return pygame.transform.scale(image, size)
-    except:
-        pass
-    
-    # Fallback with gradient effect
-    surface = pygame.Surface(size)
-    # Simple gradient
-    for y in range(size[1]):
-        shade = int(fallback_color[0] * (0.7 + 0.3 * y / size[1]))
-        color = (shade, shade, shade) if fallback_color == GRAY else fallback_color
-        pygame.draw.line(surface, color, (0, y), (size[0], y))
-    
-    pygame.draw.rect(surface, BLACK, (0, 0, size[0], size[1]), 2)
-    return surface
-
-def load_background():
-    """Load background image with animated fallback"""
-    try:
-        if os.path.exists("mikamon_background.png"):
-            image = pygame.image.load("mikamon_background.png")
-            return pygame.transform.scale(image, (1920, 1080))
-    except:
-        pass
-    
-    # Animated background
-    background = pygame.Surface((1920, 1080))
-    
-    for y in range(1080):
-        # Blue to purple gradient with some variation
-        t = y / 1080
-        r = int(135 + math.sin(t * math.pi) * 50)
-        g = int(206 - t * 50)
-        b = int(250 - t * 50)
-        color = (max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b)))
-        pygame.draw.line(background, color, (0, y), (1920, y))
-
-    for i in range(20):
-        x = random.randint(0, 1920)
-        y = random.randint(0, 1080)
-        size = random.randint(5, 15)
-        alpha = random.randint(30, 80)
-        color = (255, 255, 255, alpha)
-        # Draw stars
-        star_surface = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-        pygame.draw.circle(star_surface, (255, 255, 255, alpha), (size, size), size)
-        background.blit(star_surface, (x, y))
-    
-    return background
-
 # Character data
 from python.character_data import characters
+from python.asset_manager import asset_manager, card_sprite_size, read_background, SELECT_SPRITE_SIZE, BATTLE_SPRITE_SIZE
+from python.texture_cache import texture_cache
+from python.loading_screen import LoadingPipeline, run_loading_screen
 
-def load_all_assets():
-    sprites = {}
-    battle_sprites = {}
-    for name, char in characters.items():
-        # Character button box
-        sprites[name] = load_sprite(char["sprite_file"], (120, 120), char["color"])
-        battle_sprites[name] = load_sprite(char["sprite_file"], (80, 80), char["color"])
+def build_loading_pipeline():
+    """Startup jobs: the critical ones gate the main menu, the rest finish behind it"""
+    pipeline = LoadingPipeline()
+    
+    # Music: the title track is playing by the time the menu opens
+    pipeline.add("music scan", initialize_music_system)
+    pipeline.add("title music", load_title_music, requires=["music scan"])
+    pipeline.add("start title music", start_title_music, main_thread=True, requires=["title music"])
+    pipeline.add("fight music", load_fight_music, critical=False, requires=["music scan"])
+    
+    # Sprites and background are read on workers and converted on the main thread
+    # (every sprite size lives in one display-format atlas, rebuilt on fullscreen toggle)
+    pipeline.add("sprite images", lambda: asset_manager.load_images(characters))
+    pipeline.add("sprite atlas", asset_manager.rebuild, main_thread=True, requires=["sprite images"])
+    pipeline.add("background image", read_background)
+    pipeline.add("background", lambda: pipeline.result("background image").convert(),
+                 main_thread=True, requires=["background image"])
     
-    background = load_background()
-    return sprites, battle_sprites, background   
+    # Only needed once a battle starts
+    pipeline.add("time of day textures", lambda: texture_cache.prewarm(["time_icon", "sky_column"]),
+                 critical=False)
+    pipeline.add("weather effects", weather_loader.load, critical=False)
+    return pipeline
+
+def loading_subtitle(pipeline):
+    """Loading screen subtitle, warning once the title music turns out to be missing"""
+    if pipeline.is_finished("title music") and not get_music_status()["title_loaded"]:
+        return "Loading Mikamon (Music files not found)", ORANGE
+    return "Loading Mikamon", WHITE
 
 # Shadowed text and buttons
 from python.shadowed_text_and_buttons import draw_text_with_shadow, draw_gradient_button
+from python.surface_pool import surface_pool
+from python.frame_pacer import frame_pacer, IDLE_FRAME_MS
 
 def settings_menu(background):
     """Settings menu for volume and difficulty"""
@@ -185,9 +129,7 @@ def settings_menu(background):
         SCREEN.blit(scaled_background, (0, 0))
         
         # Settings overlay
-        overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        SCREEN.blit(overlay, (0, 0))
+        surface_pool.blit_fill(SCREEN, (0, 0, 0, 150))
         
         # Responsive settings panel
         panel_width = int(screen_width * 0.521)  # About 1000px at 1920px
@@ -252,7 +194,7 @@ def settings_menu(background):
                 draw_gradient_button(diff, diff_rect, GREEN, DARK_GREEN, False, SMALL_FONT)
             else:
                 draw_gradient_button(diff, diff_rect, GRAY, DARK_GRAY, 
-                                   diff_rect.collidepoint(pygame.mouse.get_pos()), SMALL_FONT)
+                                   diff_rect.collidepoint(display_manager.get_mouse_pos()), SMALL_FONT)
         
         # Difficulty description
         diff_descriptions = {
@@ -281,7 +223,7 @@ def settings_menu(background):
         back_y = panel_y + panel_height - back_height - int(panel_height * 0.044)
         back_rect = pygame.Rect(back_x, back_y, back_width, back_height)
         draw_gradient_button("BACK", back_rect, DARK_BLUE, BLUE, 
-                           back_rect.collidepoint(pygame.mouse.get_pos()), FONT)
+                           back_rect.collidepoint(display_manager.get_mouse_pos()), FONT)
         
         # Event handling
         for event in pygame.event.get():
@@ -297,7 +239,7 @@ def settings_menu(background):
                 if event.key == pygame.K_ESCAPE:
                     settings_running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                mx, my = pygame.mouse.get_pos()
+                mx, my = display_manager.get_mouse_pos()
                 if back_rect.collidepoint((mx, my)):
                     settings_running = False
                 
@@ -306,7 +248,7 @@ def settings_menu(background):
                     if diff_rect.collidepoint((mx, my)):
                         game_settings["difficulty"] = diff
             elif event.type == pygame.MOUSEMOTION:
-                mx, my = pygame.mouse.get_pos()
+                mx, my = display_manager.get_mouse_pos()
                 if pygame.mouse.get_pressed()[0]:
                     # Title Music volume slider
                     if music_slider.colliderect(pygame.Rect(mx-10, my-10, 20, 20)):
@@ -322,11 +264,12 @@ def settings_menu(background):
                             update_music_volumes()
         if game_settings.get("show_clock", True):
             draw_real_time_clock(game_settings.get("show_clock", True))
-        pygame.display.flip()
+        display_manager.present()
         CLOCK.tick(60)
 
 # Battle system
 from python.battle_system import battle
+from python.weather_loader import weather_loader
 
 # Settings menu with fight music controls
 from python.settings import game_settings, title_music_loaded, fight_music_loaded, update_music_volumes, settings_menu
@@ -367,9 +310,7 @@ def character_select(sprites, battle_sprites, background):
 
         # Dynamic overlay with breathing effect
         overlay_alpha = int(120 + 30 * math.sin(select_timer * 0.002))
-        overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-        overlay.fill((*WHITE[:3], overlay_alpha))
-        SCREEN.blit(overlay, (0, 0))
+        surface_pool.blit_fill(SCREEN, (*WHITE[:3], overlay_alpha))
 
         # Responsive title positioning
         title_x = int(screen_width * 0.0365)  # About 70px at 1920px width
@@ -394,7 +335,7 @@ def character_select(sprites, battle_sprites, background):
         fs_button_height = int(screen_height * 0.032)  # About 35px at 1080px
         fullscreen_button = create_fullscreen_button(fs_button_x, fs_button_y, fs_button_width, fs_button_height)
         
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = display_manager.get_mouse_pos()
         draw_fullscreen_button(SCREEN, fullscreen_button, SMALL_FONT, mouse_pos)
 
         # Character grid with responsive positioning
@@ -458,9 +399,8 @@ def character_select(sprites, battle_sprites, background):
             # Character sprite with bounce animation (scale sprite for resolution)
             if name in sprites:
                 bounce = int(hover_effects[name] * 8 * math.sin(select_timer * 0.01))
-                # Scale sprite size based on button size
-                sprite_scale = min(button_width // 3, button_height // 4)
-                scaled_sprite = pygame.transform.scale(sprites[name], (sprite_scale, sprite_scale))
+                # Pre-built card-size sprite from the atlas
+                scaled_sprite = asset_manager.get(name, card_sprite_size(screen_width, screen_height))
                 sprite_rect = scaled_sprite.get_rect()
                 sprite_x = x + (button_width - sprite_rect.width) // 2
                 sprite_y = y + int(button_height * 0.06) - bounce  # 6% from top of button
@@ -583,11 +523,9 @@ def character_select(sprites, battle_sprites, background):
         if show_exit_menu:
             menu_width = int(screen_width * 0.3125)  # About 600px at 1920px
             menu_height = int(screen_height * 0.37)   # About 400px at 1080px
-            menu_surface = pygame.Surface((menu_width, menu_height), pygame.SRCALPHA)
-            menu_surface.fill((0, 0, 0, 220))
             menu_x = (screen_width - menu_width) // 2
             menu_y = (screen_height - menu_height) // 2
-            SCREEN.blit(menu_surface, (menu_x, menu_y))
+            surface_pool.blit_fill(SCREEN, (0, 0, 0, 220), (menu_x, menu_y, menu_width, menu_height))
             
             pygame.draw.rect(SCREEN, GOLD, (menu_x, menu_y, menu_width, menu_height), 4)
             draw_text_with_shadow("MAIN MENU", menu_x + menu_width//3, menu_y + 40, GOLD, BIG_FONT, 2)
@@ -636,7 +574,7 @@ def character_select(sprites, battle_sprites, background):
                         show_exit_menu = not show_exit_menu
                         
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                mx, my = pygame.mouse.get_pos()
+                mx, my = display_manager.get_mouse_pos()
                 
                 # Fullscreen button click
                 if fullscreen_button.collidepoint((mx, my)):
@@ -676,54 +614,21 @@ def character_select(sprites, battle_sprites, background):
         
         if game_settings.get("show_clock", True):
             draw_real_time_clock(game_settings.get("show_clock", True))
-        pygame.display.flip()
-        CLOCK.tick(60)
+        display_manager.present()
+        
+        # With no card hovered or selected only the slow breathing overlay and title glow move
+        animating = selected_char is not None or any(effect > 0 for effect in hover_effects.values())
+        frame_pacer.tick(animating=animating, wake_after=IDLE_FRAME_MS)
 
 def main():
     """Main game function with save system and main menu"""
     print("Loading Mikamon...")
-    print("Initializing audio systems...")
-    
-    # Display music system status
-    status = get_music_status()
-    if status['mixer_initialized']:
-        print("Audio mixer: OK")
-    else:
-        print("Audio mixer: FAILED")
+    pipeline = build_loading_pipeline()
+    run_loading_screen(pipeline, lambda: loading_subtitle(pipeline))
     
-    if status['title_loaded']:
-        print("Title music: Loaded")
-    else:
-        print("Title music: Missing")
-    
-    if status['fight_loaded']:
-        print("Fight music: Loaded") 
-    else:
-        print("Fight music: Missing")
-    
-    print("Loading sprites and assets...")
-    sprites, battle_sprites, background = load_all_assets()
-    
-    # Show loading screen
-    SCREEN = display_manager.get_screen()
-    screen_width, screen_height = display_manager.get_size()
-    
-    SCREEN.fill(BLACK)
-    loading_text = BIG_FONT.render("MIKAMON: CATGIRL CHRONICLES", True, GOLD)
-    loading_rect = loading_text.get_rect(center=(screen_width//2, screen_height//2 - 50))
-    SCREEN.blit(loading_text, loading_rect)
-    
-    if music_system_working:
-        subtitle_text = FONT.render("Loading Mikamon", True, WHITE)
-    else:
-        subtitle_text = FONT.render("Loading Mikamon (Music files not found)", True, ORANGE)
-    subtitle_rect = subtitle_text.get_rect(center=(screen_width//2, screen_height//2))
-    SCREEN.blit(subtitle_text, subtitle_rect)
-
-    if game_settings.get("show_clock", True):
-        draw_real_time_clock(game_settings.get("show_clock", True))
-    pygame.display.flip()
-    pygame.time.wait(2000)
+    sprites = asset_manager.sprite_set(SELECT_SPRITE_SIZE)
+    battle_sprites = asset_manager.sprite_set(BATTLE_SPRITE_SIZE)
+    background = pipeline.result("background")
     
     # Main menu loop
     while True:
@@ -6,33 +6,8 @@ Adds the missing AttackAnimationManager class and create_animation_for_move func
 import pygame
 import random
 import math
-
-# Simple particle class for animations
-class AnimationParticle:
-    """Simple particle for attack animations"""
-    def __init__(self, x, y, color, vx, vy, life=1000):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.vx = vx
-        self.vy = vy
-        self.life = life
-        self.max_life = life
-    
-    def update(self, dt):
-        self.x += self.vx * dt * 0.06
-        self.y += self.vy * dt * 0.06
-        self.vy += 0.2  # Gravity
-        self.life -= dt
-        return self.life > 0
-    
-    def draw(self, surface):
-        alpha = int(255 * (self.life / self.max_life))
-        size = max(2, int(5 * (self.life / self.max_life)))
-        
-        particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(particle_surf, (*self.color, alpha), (size, size), size)
-        surface.blit(particle_surf, (int(self.x - size), int(self.y - size)))
+from python.glow_atlas import glow_atlas
+from python.particle_pool import particle_pool
 
 
 class BaseAnimation:
@@ -45,26 +20,32 @@ class BaseAnimation:
         self.duration = duration
         self.elapsed = 0
         self.finished = False
-        self.particles = []
+        self.render_ahead_ms = 0.0  # set by the manager: draw this far past the last update
+        self.particles = particle_pool.view("anim")
     
     def update(self, dt):
+        # Particles are stepped by particle_pool.update in the owning loop
         self.elapsed += dt
         if self.elapsed >= self.duration:
             self.finished = True
         
-        # Update particles
-        self.particles = [p for p in self.particles if p.update(dt)]
-        
         return not self.finished
     
+    def emit_particle(self, x, y, vx, vy, life):
+        """Spawn a trail/impact particle in the animation color"""
+        self.particles.emit(x, y, vx, vy, self.color, life, size=5)
+    
     def draw(self, surface):
         # Draw particles
-        for particle in self.particles:
-            particle.draw(surface)
+        self.particles.draw(surface)
     
     def get_progress(self):
         """Returns animation progress from 0.0 to 1.0"""
         return min(1.0, self.elapsed / self.duration)
+    
+    def get_render_progress(self):
+        """Progress to draw at (render_ahead_ms past the last update)"""
+        return min(1.0, (self.elapsed + self.render_ahead_ms) / self.duration)
 
 
 class ProjectileAnimation(BaseAnimation):
@@ -84,35 +65,33 @@ class ProjectileAnimation(BaseAnimation):
             current_x = self.start_x + (self.target_x - self.start_x) * progress
             current_y = self.start_y + (self.target_y - self.start_y) * progress
             
-            self.particles.append(AnimationParticle(
+            self.emit_particle(
                 current_x + random.uniform(-10, 10),
                 current_y + random.uniform(-10, 10),
-                self.color,
                 random.uniform(-1, 1),
                 random.uniform(-1, 1),
                 400
-            ))
+            )
         
         # Impact explosion
         if progress >= 0.8 and progress < 0.85:
             for _ in range(15):
                 angle = random.uniform(0, 2 * math.pi)
                 speed = random.uniform(2, 8)
-                self.particles.append(AnimationParticle(
+                self.emit_particle(
                     self.target_x,
                     self.target_y,
-                    self.color,
                     math.cos(angle) * speed,
                     math.sin(angle) * speed,
                     600
-                ))
+                )
         
         return result
     
     def draw(self, surface):
         super().draw(surface)
         
-        progress = self.get_progress()
+        progress = self.get_render_progress()
         
         if progress < 0.8:
             # Draw projectile
@@ -120,12 +99,8 @@ class ProjectileAnimation(BaseAnimation):
             current_y = self.start_y + (self.target_y - self.start_y) * (progress / 0.8)
             
             # Glow effect
-            for i in range(3):
-                size = 15 - i * 4
-                alpha = 150 - i * 40
-                glow_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (*self.color, alpha), (size, size), size)
-                surface.blit(glow_surf, (int(current_x - size), int(current_y - size)))
+            surface.blits([glow_atlas.get_blit(self.color, current_x, current_y, 15 - i * 4, 150 - i * 40)
+                           for i in range(3)], doreturn=False)
             
             # Core
             pygame.draw.circle(surface, self.color, (int(current_x), int(current_y)), 8)
@@ -150,21 +125,20 @@ class MeleeAnimation(BaseAnimation):
         # Impact particles
         if 0.4 < progress < 0.6 and random.random() < 0.7:
             offset_x = 30 if self.direction == 'right' else -30
-            self.particles.append(AnimationParticle(
+            self.emit_particle(
                 self.x + offset_x + random.uniform(-20, 20),
                 self.y + random.uniform(-20, 20),
-                self.color,
                 random.uniform(-3, 3),
                 random.uniform(-4, -1),
                 500
-            ))
+            )
         
         return result
     
     def draw(self, surface):
         super().draw(surface)
         
-        progress = self.get_progress()
+        progress = self.get_render_progress()
         
         if progress < 0.6:
             # Draw swing arc
@@ -202,6 +176,7 @@ class AttackAnimationManager:
     """Manages all active attack animations"""
     def __init__(self):
         self.animations = []
+        self.render_ahead_ms = 0.0  # leftover time of the fixed-timestep loop
     
     def add_animation(self, animation):
         """Add a new animation"""
@@ -209,11 +184,20 @@ class AttackAnimationManager:
     
     def update(self, dt):
         """Update all animations"""
-        self.animations = [anim for anim in self.animations if anim.update(dt)]
+        self.render_ahead_ms = 0.0
+        active = []
+        for anim in self.animations:
+            if anim.update(dt):
+                active.append(anim)
+            else:
+                # Finished animations take their particles with them
+                anim.particles.clear()
+        self.animations = active
     
     def draw(self, surface):
         """Draw all animations"""
         for anim in self.animations:
+            anim.render_ahead_ms = self.render_ahead_ms
             anim.draw(surface)
     
     def has_active_animations(self):
@@ -222,6 +206,8 @@ class AttackAnimationManager:
     
     def clear(self):
         """Clear all animations"""
+        for anim in self.animations:
+            anim.particles.clear()
         self.animations.clear()
 
 
@@ -0,0 +1,94 @@
+"""
+Layer Compositor
+Parts of the battle screen that rarely change (the weather and time panels, button faces,
+the screen tint and sky overlay) are kept as named layers. Each layer is a cached surface
+with a key made of everything it is drawn from (weather, phase, text, hover, MP, size);
+it is only re-rendered when the key changes, so a normal frame just blits the layers.
+Every layer is dropped when the display mode changes.
+"""
+
+import numpy as np
+import pygame
+from python.fullscreen_toggle import display_manager
+
+
+class Layer:
+    """One cached surface and the key it was rendered with"""
+    __slots__ = ("surface", "key")
+
+    def __init__(self, surface):
+        self.surface = surface
+        self.key = None
+
+
+class Compositor:
+    """Named layers that are only re-rendered when their inputs change"""
+    def __init__(self):
+        self.layers = {}
+        self.renders = 0  # layer re-renders since the last take_renders()
+
+    def get(self, name, key, size, render, alpha=False):
+        """
+        Surface of the named layer
+        render(surface) repaints the layer when key or size differ from last time; the
+        surface is reused, so it has to paint all of it. alpha layers have per-pixel alpha.
+        """
+        size = (int(size[0]), int(size[1]))
+        layer = self.layers.get(name)
+        if layer is None or layer.surface.get_size() != size:
+            layer = Layer(pygame.Surface(size, pygame.SRCALPHA if alpha else 0))
+            self.layers[name] = layer
+        if layer.key != key:
+            render(layer.surface)
+            layer.key = key
+            self.renders += 1
+        return layer.surface
+
+    def blit(self, target, name, key, size, render, position=(0, 0), alpha=False):
+        """Draw the named layer onto target, re-rendering it first if needed"""
+        target.blit(self.get(name, key, size, render, alpha), position)
+
+    def invalidate(self, name=None):
+        """Re-render one layer (or all of them) the next time it is drawn"""
+        for layer_name, layer in self.layers.items():
+            if name is None or layer_name == name:
+                layer.key = None
+
+    def take_renders(self):
+        """Layer re-renders since the last call (for the frame profiler)"""
+        renders, self.renders = self.renders, 0
+        return renders
+
+    def clear(self):
+        self.layers.clear()
+
+
+def stack_row_overlays(height, overlays):
+    """
+    Collapse translucent overlays that only vary from row to row into one (1, height) column
+    overlays are (color, alpha) pairs from bottom to top: color is an RGB tuple or a
+    (height, 3) array, alpha 0-255 as a number or a (height,) array. Stretching the column
+    over the screen and blitting it once looks the same as blitting every overlay in turn.
+    """
+    color = np.zeros((height, 3))  # premultiplied by alpha
+    coverage = np.zeros(height)
+    for overlay_color, overlay_alpha in overlays:
+        a = np.broadcast_to(np.asarray(overlay_alpha, dtype=np.float64) / 255.0, (height,))
+        color = np.asarray(overlay_color, dtype=np.float64) * a[:, None] + color * (1.0 - a[:, None])
+        coverage = a + coverage * (1.0 - a)
+
+    column = pygame.Surface((1, height), pygame.SRCALPHA)
+    pixels = pygame.surfarray.pixels3d(column)
+    pixels[0] = np.clip(color / np.maximum(coverage, 1e-6)[:, None] + 0.5, 0, 255).astype(np.uint8)
+    del pixels
+    alpha = pygame.surfarray.pixels_alpha(column)
+    alpha[0] = np.clip(coverage * 255.0 + 0.5, 0, 255).astype(np.uint8)
+    del alpha
+    return column
+
+
+# Global compositor instance
+compositor = Compositor()
+
+# Cached layers are sized for the old display mode
+display_manager.add_mode_change_callback(lambda size: compositor.clear())
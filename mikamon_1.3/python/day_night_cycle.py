@@ -11,6 +11,15 @@ import numpy as np
 from PIL import Image, ImageFilter, ImageDraw, ImageEnhance
 import pytweening
 from python.color import YELLOW, ORANGE, PURPLE, DARK_BLUE, CYAN, PINK, WHITE, BLACK, RED
+from python.texture_cache import texture_cache, register_generator
+
+TIME_PHASES = ["Morning", "Afternoon", "Evening", "Night"]
+TIME_ICON_KINDS = ["sunrise", "sun", "sunset", "moon"]
+
+# The sky overlay only changes from row to row, so it is generated as one column of this
+# height (the battle's scene overlay stacks and stretches it); its pixels have this opacity
+SKY_OVERLAY_HEIGHT = 1080
+SKY_OVERLAY_ALPHA = 60
 
 class TimeIconRenderer:
     """Renders custom time-of-day icons without using emojis"""
@@ -18,11 +27,32 @@ class TimeIconRenderer:
     def __init__(self):
         self.icon_cache = {}
     
+    def get_icon(self, kind, size=40):
+        """Get an icon surface (generated once, then loaded from the texture cache)"""
+        icon = self.icon_cache.get((kind, size))
+        if icon is None:
+            icon = texture_cache.get_surface("time_icon", kind, size)
+            self.icon_cache[(kind, size)] = icon
+        return icon
+    
     def create_sunrise_icon(self, size=40):
-        """Create a sunrise icon (morning)"""
-        if ('sunrise', size) in self.icon_cache:
-            return self.icon_cache[('sunrise', size)]
-        
+        """Get the sunrise icon (morning)"""
+        return self.get_icon("sunrise", size)
+    
+    def create_sun_icon(self, size=40):
+        """Get the sun icon (afternoon)"""
+        return self.get_icon("sun", size)
+    
+    def create_sunset_icon(self, size=40):
+        """Get the sunset icon (evening)"""
+        return self.get_icon("sunset", size)
+    
+    def create_moon_icon(self, size=40):
+        """Get the moon icon (night)"""
+        return self.get_icon("moon", size)
+    
+    def draw_sunrise_icon(self, size=40):
+        """Draw a sunrise icon (morning)"""
         # Create PIL image
         img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
@@ -57,20 +87,10 @@ class TimeIconRenderer:
         horizon_y = int(size * 0.7)
         draw.rectangle([0, horizon_y, size, size], fill=(255, 150, 50, 180))
         
-        # Convert to pygame surface
-        mode = img.mode
-        surf_size = img.size
-        data = img.tobytes()
-        py_surface = pygame.image.fromstring(data, surf_size, mode)
-        
-        self.icon_cache[('sunrise', size)] = py_surface
-        return py_surface
+        return img
     
-    def create_sun_icon(self, size=40):
-        """Create a sun icon (afternoon)"""
-        if ('sun', size) in self.icon_cache:
-            return self.icon_cache[('sun', size)]
-        
+    def draw_sun_icon(self, size=40):
+        """Draw a sun icon (afternoon)"""
         img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
         
@@ -108,19 +128,10 @@ class TimeIconRenderer:
             end_y = center[1] + math.sin(rad) * (sun_radius + 12)
             draw.line([(start_x, start_y), (end_x, end_y)], fill=(255, 220, 0, 255), width=3)
         
-        mode = img.mode
-        surf_size = img.size
-        data = img.tobytes()
-        py_surface = pygame.image.fromstring(data, surf_size, mode)
-        
-        self.icon_cache[('sun', size)] = py_surface
-        return py_surface
+        return img
     
-    def create_sunset_icon(self, size=40):
-        """Create a sunset icon (evening)"""
-        if ('sunset', size) in self.icon_cache:
-            return self.icon_cache[('sunset', size)]
-        
+    def draw_sunset_icon(self, size=40):
+        """Draw a sunset icon (evening)"""
         img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
         
@@ -158,19 +169,10 @@ class TimeIconRenderer:
         horizon_y = int(size * 0.75)
         draw.rectangle([0, horizon_y, size, size], fill=(180, 100, 180, 150))
         
-        mode = img.mode
-        surf_size = img.size
-        data = img.tobytes()
-        py_surface = pygame.image.fromstring(data, surf_size, mode)
-        
-        self.icon_cache[('sunset', size)] = py_surface
-        return py_surface
+        return img
     
-    def create_moon_icon(self, size=40):
-        """Create a moon icon (night)"""
-        if ('moon', size) in self.icon_cache:
-            return self.icon_cache[('moon', size)]
-        
+    def draw_moon_icon(self, size=40):
+        """Draw a moon icon (night)"""
         img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
         
@@ -211,14 +213,46 @@ class TimeIconRenderer:
                 points.append((px, py))
             draw.polygon(points, fill=(255, 255, 255, 255))
         
-        mode = img.mode
-        surf_size = img.size
-        data = img.tobytes()
-        py_surface = pygame.image.fromstring(data, surf_size, mode)
-        
-        self.icon_cache[('moon', size)] = py_surface
-        return py_surface
+        return img
+
 
+@register_generator("time_icon", prewarm=[(kind, size) for kind in TIME_ICON_KINDS for size in (40, 45)])
+def generate_time_icon(kind, size):
+    """Render a time-of-day icon to an RGBA array"""
+    img = getattr(TimeIconRenderer(), f"draw_{kind}_icon")(size)
+    return np.asarray(img, dtype=np.uint8)
+
+@register_generator("sky_column", prewarm=[(phase,) for phase in TIME_PHASES])
+def generate_sky_column(phase):
+    """Create the atmospheric sky overlay's gradient column using PIL"""
+    phase_colors = {
+        "Morning": [(255, 240, 200), (255, 220, 150)],
+        "Afternoon": [(255, 250, 220), (255, 240, 180)],
+        "Evening": [(200, 120, 180), (150, 80, 150)],
+        "Night": [(20, 30, 80), (10, 20, 60)]
+    }
+    
+    colors = phase_colors.get(phase, [(255, 255, 255), (200, 200, 200)])
+    
+    # Create gradient
+    height = SKY_OVERLAY_HEIGHT
+    img = Image.new('RGBA', (1, height), (0, 0, 0, 0))
+    
+    for y in range(height):
+        t = y / height
+        # Use pytweening for smooth color transition
+        eased_t = pytweening.easeInOutQuad(t)
+        
+        r = int(colors[0][0] + (colors[1][0] - colors[0][0]) * eased_t)
+        g = int(colors[0][1] + (colors[1][1] - colors[0][1]) * eased_t)
+        b = int(colors[0][2] + (colors[1][2] - colors[0][2]) * eased_t)
+        
+        img.putpixel((0, y), (r, g, b, SKY_OVERLAY_ALPHA))
+    
+    # Apply subtle blur for atmospheric effect
+    img = img.filter(ImageFilter.GaussianBlur(radius=3))
+    
+    return np.asarray(img, dtype=np.uint8)
 
 class EnhancedDayNightCycle:
     """Enhanced day/night cycle with smooth transitions and visual effects"""
@@ -227,8 +261,9 @@ class EnhancedDayNightCycle:
         self.current_phase = None
         self.icon_renderer = TimeIconRenderer()
         self.animation_timer = 0
+        self.render_ahead_ms = 0.0  # drawn this far past the last update (fixed-timestep leftover)
         self.phase_transition_progress = 0
-        self.sky_overlay = None
+        self.sky_columns = {}
         self.update_phase()
     
     def update_phase(self):
@@ -255,40 +290,16 @@ class EnhancedDayNightCycle:
         else:  # Night
             return self.icon_renderer.create_moon_icon(size)
     
-    def create_sky_overlay(self, width, height, phase, alpha=80):
-        """Create atmospheric sky overlay using PIL"""
-        phase_colors = {
-            "Morning": [(255, 240, 200), (255, 220, 150)],
-            "Afternoon": [(255, 250, 220), (255, 240, 180)],
-            "Evening": [(200, 120, 180), (150, 80, 150)],
-            "Night": [(20, 30, 80), (10, 20, 60)]
-        }
-        
-        colors = phase_colors.get(phase, [(255, 255, 255), (200, 200, 200)])
-        
-        # Create gradient
-        img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        
-        for y in range(height):
-            t = y / height
-            # Use pytweening for smooth color transition
-            eased_t = pytweening.easeInOutQuad(t)
-            
-            r = int(colors[0][0] + (colors[1][0] - colors[0][0]) * eased_t)
-            g = int(colors[0][1] + (colors[1][1] - colors[0][1]) * eased_t)
-            b = int(colors[0][2] + (colors[1][2] - colors[0][2]) * eased_t)
-            
-            for x in range(width):
-                img.putpixel((x, y), (r, g, b, alpha))
-        
-        # Apply subtle blur for atmospheric effect
-        img = img.filter(ImageFilter.GaussianBlur(radius=3))
-        
-        # Convert to pygame surface
-        mode = img.mode
-        size = img.size
-        data = img.tobytes()
-        return pygame.image.fromstring(data, size, mode)
+    def get_sky_column(self, height):
+        """The current phase's sky column at this height (rescaled from the generated one)"""
+        key = (height, self.current_phase)
+        column = self.sky_columns.get(key)
+        if column is None:
+            column = texture_cache.get_surface("sky_column", self.current_phase)
+            if height != SKY_OVERLAY_HEIGHT:
+                column = pygame.transform.smoothscale(column, (1, height))
+            self.sky_columns[key] = column
+        return column
     
     def get_phase_info(self):
         """Get information about current time phase"""
@@ -371,25 +382,25 @@ class EnhancedDayNightCycle:
     def update_animation(self, dt):
         """Update animation timers for smooth effects"""
         self.animation_timer += dt
+        self.render_ahead_ms = 0.0
     
-    def draw_sky_overlay(self, screen, alpha=80):
-        """Draw atmospheric overlay on screen"""
-        width, height = screen.get_size()
-        
-        # Create or update overlay
-        if self.sky_overlay is None or self.sky_overlay.get_size() != (width, height):
-            self.sky_overlay = self.create_sky_overlay(width, height, self.current_phase, alpha)
-        
-        # Pulsing effect using pytweening
-        time_normalized = (self.animation_timer % 3000) / 3000.0
+    def get_animation_time(self):
+        """Animation time to draw at (the timer plus render_ahead_ms)"""
+        return self.animation_timer + self.render_ahead_ms
+    
+    def get_sky_overlay_alpha(self, alpha=80):
+        """Overlay opacity for this frame (pulsing effect using pytweening)"""
+        time_normalized = (self.get_animation_time() % 3000) / 3000.0
         pulse = pytweening.easeInOutSine(time_normalized)
-        current_alpha = int(alpha * (0.8 + 0.2 * pulse))
-        
-        self.sky_overlay.set_alpha(current_alpha)
-        screen.blit(self.sky_overlay, (0, 0))
+        return int(alpha * (0.8 + 0.2 * pulse))
     
     def draw_time_panel_enhanced(self, screen, x, y, width, height, font, small_font):
         """Draw enhanced time panel with custom icon and effects"""
+        self.draw_time_panel_static(screen, x, y, width, height, font, small_font)
+        self.draw_time_panel_animated(screen, x, y, width, height)
+    
+    def draw_time_panel_static(self, screen, x, y, width, height, font, small_font):
+        """Gradient and text of the time panel (they only change with the phase)"""
         phase_info = self.get_phase_info()
         
         # Create gradient background
@@ -405,21 +416,9 @@ class EnhancedDayNightCycle:
         
         screen.blit(panel_surface, (x, y))
         
-        # Animated border pulse
-        time_normalized = (self.animation_timer % 2000) / 2000.0
-        pulse = pytweening.easeInOutSine(time_normalized)
-        border_width = int(3 + pulse * 2)
-        pygame.draw.rect(screen, BLACK, (x, y, width, height), border_width)
-        
-        # Draw custom icon with bounce animation
+        # Time phase text with shadow (right of the icon)
         icon = self.get_phase_icon(size=45)
-        bounce = int(3 * math.sin(self.animation_timer * 0.003))
-        icon_x = x + 10
-        icon_y = y + (height - icon.get_height()) // 2 + bounce
-        screen.blit(icon, (icon_x, icon_y))
-        
-        # Time phase text with shadow
-        text_x = icon_x + icon.get_width() + 15
+        text_x = x + 10 + icon.get_width() + 15
         text_y = y + 8
         
         # Shadow
@@ -437,6 +436,22 @@ class EnhancedDayNightCycle:
         
         desc_text = small_font.render(phase_info['description'], True, BLACK)
         screen.blit(desc_text, (text_x, desc_y))
+    
+    def draw_time_panel_animated(self, screen, x, y, width, height):
+        """Pulsing border and bouncing icon of the time panel"""
+        # Animated border pulse
+        animation_time = self.get_animation_time()
+        time_normalized = (animation_time % 2000) / 2000.0
+        pulse = pytweening.easeInOutSine(time_normalized)
+        border_width = int(3 + pulse * 2)
+        pygame.draw.rect(screen, BLACK, (x, y, width, height), border_width)
+        
+        # Draw custom icon with bounce animation
+        icon = self.get_phase_icon(size=45)
+        bounce = int(3 * math.sin(animation_time * 0.003))
+        icon_x = x + 10
+        icon_y = y + (height - icon.get_height()) // 2 + bounce
+        screen.blit(icon, (icon_x, icon_y))
 
 
 # Global enhanced day/night cycle instance
@@ -0,0 +1,95 @@
+"""
+Bitmap Digit Atlas
+Pre-renders digits and a few symbols once per font/color so numbers that
+change every frame (damage, HP/MP readouts, timers) never hit the font rasterizer
+"""
+
+import pygame
+
+# Characters that get their own glyph in the atlas
+ATLAS_CHARS = "0123456789+-/:%"
+
+# Static text runs ("MP: ", " turns left") are cached as whole labels
+MAX_CACHED_LABELS = 512
+
+
+class DigitAtlas:
+    """Glyph atlas that composes numeric text with a single Surface.blits call"""
+
+    def __init__(self):
+        self.glyph_cache = {}
+        self.label_cache = {}
+
+    def get_glyphs(self, font, color):
+        """Get (and build on first use) the glyph table for a font/color pair"""
+        key = (font, tuple(color[:3]))
+        glyphs = self.glyph_cache.get(key)
+        if glyphs is None:
+            glyphs = {char: font.render(char, True, color) for char in ATLAS_CHARS}
+            self.glyph_cache[key] = glyphs
+        return glyphs
+
+    def get_label(self, text, font, color):
+        """Get a cached render of a non-numeric text run"""
+        key = (font, tuple(color[:3]), text)
+        label = self.label_cache.get(key)
+        if label is None:
+            if len(self.label_cache) >= MAX_CACHED_LABELS:
+                self.label_cache.clear()
+            label = font.render(text, True, color)
+            self.label_cache[key] = label
+        return label
+
+    def layout(self, text, font, color, x=0, y=0):
+        """
+        Build the blit sequence for text starting at (x, y)
+        Returns: (sequence, width, height)
+        """
+        glyphs = self.get_glyphs(font, color)
+        sequence = []
+        cursor = x
+        run_start = None
+
+        for i, char in enumerate(text):
+            glyph = glyphs.get(char)
+            if glyph is None:
+                if run_start is None:
+                    run_start = i
+                continue
+
+            if run_start is not None:
+                label = self.get_label(text[run_start:i], font, color)
+                sequence.append((label, (cursor, y)))
+                cursor += label.get_width()
+                run_start = None
+
+            sequence.append((glyph, (cursor, y)))
+            cursor += glyph.get_width()
+
+        if run_start is not None:
+            label = self.get_label(text[run_start:], font, color)
+            sequence.append((label, (cursor, y)))
+            cursor += label.get_width()
+
+        return sequence, cursor - x, font.get_height()
+
+    def measure(self, text, font):
+        """Width of text as composed by the atlas"""
+        return self.layout(text, font, (255, 255, 255))[1]
+
+    def draw(self, surface, text, x, y, font, color):
+        """Draw text onto surface and return its rect"""
+        sequence, width, height = self.layout(text, font, color, x, y)
+        surface.blits(sequence, doreturn=False)
+        return pygame.Rect(x, y, width, height)
+
+    def render(self, text, font, color):
+        """Compose text into a new transparent surface (for text that is reused, e.g. with set_alpha)"""
+        sequence, width, height = self.layout(text, font, color)
+        surface = pygame.Surface((max(1, width), height), pygame.SRCALPHA)
+        surface.blits(sequence, doreturn=False)
+        return surface
+
+
+# Global digit atlas instance
+digit_atlas = DigitAtlas()
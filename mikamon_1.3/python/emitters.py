@@ -0,0 +1,216 @@
+"""
+Data-Driven Particle Emitters
+Effects are described as plain dictionaries (rate, burst size, spawn area, velocity,
+lifetime, size and color palette). Every burst is sampled with a handful of vectorized
+NumPy draws and written straight into the particle arrays.
+"""
+
+import math
+import numpy as np
+from python.color import GREEN, CYAN, GOLD, PURPLE, WHITE, RED, BLUE, YELLOW
+from python.particle_pool import ParticleView
+
+# ============= EMITTER DEFINITIONS =============
+# interval: ms between bursts for continuous emitters (None = one-shot bursts only)
+# burst:    particles per burst
+# spawn:    ((x_min, x_max), (y_min, y_max)) relative to the emit origin
+# mirror_x: optional (left_x, right_x); each particle enters from a random side, moving inwards
+# velocity: ("uniform", (vx_min, vx_max), (vy_min, vy_max)) or
+#           ("radial", (speed_min, speed_max), (bias_x, bias_y))
+# lifetime / size: (min, max) ms / pixels
+# palette:  colors picked per particle (callers may override it)
+# shape:    atlas sprite for pooled particles (defaults to the view kind's shape)
+# system:   which weather particle system receives the burst ("batch" or "kinematic")
+EMITTER_DEFINITIONS = {
+    # ----- Weather -----
+    "sunny_sparkles": {
+        "interval": 80, "burst": 10,
+        "spawn": ((0, 1920), (0, 600)),
+        "velocity": ("uniform", (-20, 20), (-20, 20)),
+        "lifetime": (4000, 4000), "size": (6, 12),
+        "palette": [(255, 240, 100)],
+        "system": "batch"
+    },
+    "clear_motes": {
+        "interval": 200, "burst": 5,
+        "spawn": ((0, 1920), (0, 1080)),
+        "velocity": ("uniform", (-1, 1), (-1, 1)),
+        "lifetime": (3000, 3000), "size": (2, 4),
+        "palette": [(240, 240, 255)],
+        "system": "batch"
+    },
+    "misty_wisps": {
+        "interval": 100, "burst": 10,
+        "spawn": ((-100, 2020), (300, 1080)),
+        "velocity": ("uniform", (-10, 10), (-5, 5)),
+        "lifetime": (8000, 8000), "size": (30, 60),
+        "palette": [(220, 230, 240)],
+        "system": "batch"
+    },
+    "rain": {
+        "interval": 30, "burst": 50,
+        "spawn": ((-200, 2120), (-400, 0)),
+        "velocity": ("uniform", (-50, 50), (400, 600)),
+        "lifetime": (2000, 2000), "size": (2, 2),
+        "palette": [(150, 180, 220)],
+        "system": "kinematic"
+    },
+    "storm_rain": {
+        "interval": 20, "burst": 80,
+        "spawn": ((-200, 2120), (-400, 0)),
+        "velocity": ("uniform", (-50, 50), (400, 600)),
+        "lifetime": (2000, 2000), "size": (2, 2),
+        "palette": [(150, 180, 220)],
+        "system": "kinematic"
+    },
+    "wind_leaves": {
+        "interval": 150, "burst": 1,
+        "spawn": ((0, 0), (200, 800)),
+        "mirror_x": (-50, 1970),
+        "velocity": ("uniform", (400, 600), (-100, 100)),
+        "lifetime": (2000, 2000), "size": (8, 8),
+        "palette": [(255, 200, 0), (255, 150, 0), (200, 100, 0)],
+        "system": "kinematic"
+    },
+    "lightning_sparks": {
+        "interval": None, "burst": 100,
+        "spawn": ((0, 0), (0, 0)),
+        "velocity": ("radial", (100, 400), (0, -200)),
+        "lifetime": (800, 800), "size": (4, 10),
+        "palette": [(255, 255, 255)],
+        "system": "batch"
+    },
+
+    # ----- Battle (pooled "spark" particles) -----
+    "hit_sparks": {
+        "interval": None, "burst": 15,
+        "spawn": ((-20, 20), (-20, 20)),
+        "velocity": ("uniform", (-3, 3), (-3, 3)),
+        "lifetime": (800, 800), "size": (3, 3),
+        "palette": [WHITE]
+    },
+    "mp_sparkles": {
+        "interval": None, "burst": 10,
+        "spawn": ((-30, 30), (-30, 30)),
+        "velocity": ("uniform", (-2, 2), (-4, -1)),
+        "lifetime": (1000, 1000), "size": (3, 3),
+        "palette": [CYAN]
+    },
+    "victory_confetti": {
+        "interval": None, "burst": 30,
+        "spawn": ((0, 1920), (0, 1080)),
+        "velocity": ("uniform", (-2, 2), (-2, 2)),
+        "lifetime": (2000, 2000), "size": (3, 3),
+        "palette": [GOLD]
+    },
+
+    # ----- Items (pooled "item" particles) -----
+    "item_heal": {
+        "interval": None, "burst": 15,
+        "spawn": ((-60, 30), (-20, 20)),
+        "velocity": ("uniform", (-1, 1), (-3, -1)),
+        "lifetime": (2000, 2000), "size": (3, 6),
+        "palette": [GREEN],
+        "shape": "cross"
+    },
+    "item_mp_restore": {
+        "interval": None, "burst": 12,
+        "spawn": ((-25, 25), (-15, 15)),
+        "velocity": ("uniform", (-2, 2), (-2, 2)),
+        "lifetime": (2000, 2000), "size": (2, 4),
+        "palette": [CYAN]
+    },
+    "item_stat_boost": {
+        "interval": None, "burst": 10,
+        "spawn": ((-20, 20), (-10, 10)),
+        "velocity": ("uniform", (-0.5, 0.5), (-4, -2)),
+        "lifetime": (2000, 2000), "size": (4, 8),
+        "palette": [GOLD]
+    },
+    "item_full_restore": {
+        "interval": None, "burst": 25,
+        "spawn": ((-50, 50), (-40, 40)),
+        "velocity": ("uniform", (-1.5, 1.5), (-2, -0.5)),
+        "lifetime": (2000, 2000), "size": (3, 5),
+        "palette": [RED, GREEN, BLUE, YELLOW, PURPLE, CYAN]
+    },
+    "item_permanent": {
+        "interval": None, "burst": 30,
+        "spawn": ((-60, 60), (-40, 40)),
+        "velocity": ("uniform", (-1.5, 1.5), (-2, -0.5)),
+        "lifetime": (2000, 2000), "size": (3, 5),
+        "palette": [GOLD, PURPLE, CYAN, WHITE]
+    }
+}
+
+
+class Emitter:
+    """Samples bursts for one emitter definition"""
+
+    def __init__(self, name, definition):
+        self.name = name
+        self.definition = definition
+        self.interval = definition.get("interval")
+        self.burst_count = definition["burst"]
+        self.system = definition.get("system", "batch")
+        self.shape = definition.get("shape")
+        self.palette = np.array([color[:3] for color in definition["palette"]], dtype=np.uint8)
+
+    def sample(self, count, origin=(0, 0), spawn=None, palette=None):
+        """Draw positions, velocities, colors, sizes and lifetimes for count particles"""
+        definition = self.definition
+        (x_min, x_max), (y_min, y_max) = spawn or definition["spawn"]
+        xs = origin[0] + np.random.uniform(x_min, x_max, count)
+        ys = origin[1] + np.random.uniform(y_min, y_max, count)
+
+        velocity = definition["velocity"]
+        if velocity[0] == "radial":
+            (speed_min, speed_max), (bias_x, bias_y) = velocity[1], velocity[2]
+            angles = np.random.uniform(0, 2 * math.pi, count)
+            speeds = np.random.uniform(speed_min, speed_max, count)
+            vxs = np.cos(angles) * speeds + bias_x
+            vys = np.sin(angles) * speeds + bias_y
+        else:
+            (vx_min, vx_max), (vy_min, vy_max) = velocity[1], velocity[2]
+            vxs = np.random.uniform(vx_min, vx_max, count)
+            vys = np.random.uniform(vy_min, vy_max, count)
+
+        if "mirror_x" in definition:
+            left_x, right_x = definition["mirror_x"]
+            from_right = np.random.random(count) < 0.5
+            xs = np.where(from_right, right_x, left_x) + xs
+            vxs = np.where(from_right, -vxs, vxs)
+
+        palette = self.palette if palette is None else np.array([c[:3] for c in palette], dtype=np.uint8)
+        colors = palette[np.random.randint(0, len(palette), count)]
+        sizes = np.random.uniform(*definition["size"], count)
+        lifetimes = np.random.uniform(*definition["lifetime"], count)
+        return xs, ys, vxs, vys, colors, sizes, lifetimes
+
+    def emit(self, target, origin=(0, 0), count=None, spawn=None, palette=None):
+        """
+        Spawn one burst into a ParticleView or a weather particle system
+        Returns the number of particles spawned
+        """
+        xs, ys, vxs, vys, colors, sizes, lifetimes = self.sample(
+            self.burst_count if count is None else count, origin, spawn, palette)
+
+        if isinstance(target, ParticleView):
+            return target.emit(xs, ys, vxs, vys, colors, lifetimes, size=sizes, shape=self.shape)
+        return target.add_particles_batch(xs, ys, vxs, vys, colors, sizes, lifetimes)
+
+
+# Emitters are built once per definition and reused
+emitter_cache = {}
+
+def get_emitter(name):
+    """Get the emitter for a definition name"""
+    emitter = emitter_cache.get(name)
+    if emitter is None:
+        emitter = Emitter(name, EMITTER_DEFINITIONS[name])
+        emitter_cache[name] = emitter
+    return emitter
+
+def burst(name, target, origin=(0, 0), count=None, spawn=None, palette=None):
+    """Spawn one burst of a named emitter into target"""
+    return get_emitter(name).emit(target, origin, count, spawn, palette)
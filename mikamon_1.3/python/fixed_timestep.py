@@ -0,0 +1,49 @@
+"""
+Fixed Timestep
+The battle simulation (weather, particles, attack animations, floating texts, timers) is
+advanced in fixed SIM_STEP_MS steps instead of by the frame time, so effects behave the
+same at any frame rate. Frame time is collected in an accumulator and spent a step at a
+time; the leftover (less than one step) is handed to the particle systems, which draw
+their particles that far ahead along their velocity so motion stays smooth when the
+display runs faster or slower than the simulation.
+
+After a long stall (loading, dragging the window) at most MAX_STEPS_PER_FRAME steps are
+run and the rest of the backlog is dropped, so the simulation slows down for a moment
+instead of freezing the game while it catches up.
+"""
+
+SIM_STEP_MS = 1000 / 60
+MAX_STEPS_PER_FRAME = 5
+
+
+class FixedTimestep:
+    """Accumulator that turns variable frame times into fixed simulation steps"""
+    def __init__(self, step_ms=SIM_STEP_MS, max_steps=MAX_STEPS_PER_FRAME):
+        self.step_ms = step_ms
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_ms = 0.0  # frame time thrown away by the catch-up cap
+
+    def reset(self):
+        """Start from an empty accumulator (e.g. at the start of a battle)"""
+        self.accumulator = 0.0
+        self.dropped_ms = 0.0
+
+    def advance(self, frame_ms):
+        """Add a frame's time and return how many steps to simulate this frame"""
+        self.accumulator += frame_ms
+        steps = min(int(self.accumulator // self.step_ms), self.max_steps)
+        self.accumulator -= steps * self.step_ms
+        if self.accumulator >= self.step_ms:
+            backlog = self.accumulator - self.accumulator % self.step_ms
+            self.dropped_ms += backlog
+            self.accumulator -= backlog
+        return steps
+
+    def get_lag(self):
+        """Time (ms, under one step) the frame is ahead of the last simulated step"""
+        return self.accumulator
+
+
+# Global fixed timestep instance
+fixed_timestep = FixedTimestep()
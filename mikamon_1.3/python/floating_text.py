@@ -1,5 +1,6 @@
 from python.pygame1 import FONT
 from python.color import BLACK
+from python.digit_atlas import digit_atlas
 class FloatingText:
     def __init__(self, text, x, y, color=BLACK, duration=2000):
         self.text = text
@@ -10,6 +11,8 @@ class FloatingText:
         self.duration = duration
         self.timer = 0
         self.alpha = 255
+        # Composed once from the digit atlas; only the alpha changes per frame
+        self.surface = digit_atlas.render(text, FONT, color)
         
     def update(self, dt):
         self.timer += dt
@@ -21,7 +24,12 @@ class FloatingText:
         self.alpha = int(255 * (1 - progress))
         return True
     
-    def draw(self, screen):
-        text_surface = FONT.render(self.text, True, self.color)
-        text_surface.set_alpha(self.alpha)
-        screen.blit(text_surface, (self.x, self.y))
\ No newline at end of file
+    def draw(self, screen, ahead_ms=0):
+        """Draw the text ahead_ms past its last update"""
+        if ahead_ms:
+            progress = min(1.0, (self.timer + ahead_ms) / self.duration)
+            self.surface.set_alpha(int(255 * (1 - progress)))
+            screen.blit(self.surface, (self.x, self.start_y - (progress * 50)))
+            return
+        self.surface.set_alpha(self.alpha)
+        screen.blit(self.surface, (self.x, self.y))
\ No newline at end of file
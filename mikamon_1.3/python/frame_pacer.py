@@ -0,0 +1,67 @@
+"""
+Frame Pacer
+Screen loops end their frames with frame_pacer.tick() instead of CLOCK.tick(60). While
+something is animating the loop runs at the full frame rate. When the screen reports that
+nothing is animating (and there was no input for a moment), or the window is minimized,
+the pacer sleeps in pygame.event.wait instead: the loop only wakes for input or for the
+screen's next timer (a blinking prompt, the clock's next second), and any input brings
+back the full rate at once. The event that woke the pacer is put back on the queue for
+the loop's own event handling.
+"""
+
+import pygame
+from python.pygame1 import CLOCK
+
+ACTIVE_FPS = 60
+IDLE_FRAME_MS = 1000 // 15    # slow ambient animation (breathing overlays) while idle
+MAX_IDLE_WAIT_MS = 500        # idle screens still wake this often to pick up background changes
+HIDDEN_FRAME_MS = 100         # minimized window
+INPUT_GRACE_MS = 500          # full rate for this long after input, so hover effects start smoothly
+
+# Battle frame rate settings, cycled in this order (0 = uncapped); the simulation stays at 60 Hz
+FRAME_RATE_OPTIONS = [60, 120, 144, 0]
+
+INPUT_EVENTS = {pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN,
+                pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL, pygame.TEXTINPUT,
+                pygame.WINDOWFOCUSGAINED, pygame.WINDOWRESTORED, pygame.WINDOWENTER}
+
+
+def get_frame_rate_label(fps):
+    return f"{fps} FPS" if fps else "Uncapped"
+
+
+class FramePacer:
+    """Full frame rate while animating, event-driven sleeping while idle or minimized"""
+    def __init__(self):
+        self.last_input = 0
+        self.idle = False         # the last frame was paced as idle
+        self.idle_frames = 0
+
+    def is_hidden(self):
+        """True while the window is minimized (or otherwise not shown)"""
+        return not pygame.display.get_active()
+
+    def tick(self, animating=True, wake_after=MAX_IDLE_WAIT_MS, fps=ACTIVE_FPS):
+        """
+        End the frame and return its time in ms (like CLOCK.tick(fps))
+        Pass animating=False when the screen only changes on input or timers, with
+        wake_after set to the ms until its next timer fires.
+        """
+        hidden = self.is_hidden()
+        if not hidden and (animating or pygame.time.get_ticks() - self.last_input < INPUT_GRACE_MS):
+            self.idle = False
+            return CLOCK.tick(fps)
+
+        self.idle = True
+        self.idle_frames += 1
+        timeout = HIDDEN_FRAME_MS if hidden else min(wake_after, MAX_IDLE_WAIT_MS)
+        event = pygame.event.wait(max(1, int(timeout)))
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+            if event.type in INPUT_EVENTS:
+                self.last_input = pygame.time.get_ticks()
+        return CLOCK.tick()
+
+
+# Global frame pacer instance
+frame_pacer = FramePacer()
@@ -0,0 +1,120 @@
+"""
+Glow Sprite Atlas
+Pre-rendered circle and glow sprites keyed by (color, radius bucket, alpha bucket)
+so particle drawing never allocates a Surface per particle per frame
+"""
+
+import pygame
+
+# Alpha is quantized to this many levels (0 and 255 are always exact)
+ALPHA_LEVELS = 16
+ALPHA_STEP = 255 / (ALPHA_LEVELS - 1)
+
+# Radii up to this value are exact, larger ones are rounded to RADIUS_STEP
+EXACT_RADIUS_LIMIT = 16
+RADIUS_STEP = 4
+MAX_RADIUS = 160
+
+# Safety valve so unusual palettes can't grow the atlas forever
+MAX_CACHED_SPRITES = 8192
+
+
+def radius_bucket(radius):
+    """Round a radius to its atlas bucket"""
+    radius = max(1, int(radius))
+    if radius > EXACT_RADIUS_LIMIT:
+        radius = min(MAX_RADIUS, int(round(radius / RADIUS_STEP)) * RADIUS_STEP)
+    return radius
+
+
+def alpha_bucket(alpha):
+    """Round an alpha value to its atlas bucket"""
+    alpha = max(0, min(255, alpha))
+    return int(round(int(alpha / ALPHA_STEP + 0.5) * ALPHA_STEP))
+
+
+class GlowAtlas:
+    """Cache of pre-rendered particle sprites"""
+
+    def __init__(self):
+        self.sprite_cache = {}
+        self.sprites_built = 0
+
+    def _build_circle(self, color, radius, alpha):
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*color, alpha), (radius, radius), radius)
+        return surface
+
+    def _build_halo(self, color, radius, alpha):
+        """Soft outer ring (2x radius, clipped to a 3x box) at a third of the alpha plus a bright core"""
+        center = radius * 3 // 2
+        surface = pygame.Surface((radius * 3, radius * 3), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*color, alpha // 3), (center, center), radius * 2)
+        pygame.draw.circle(surface, (*color, alpha), (center, center), radius)
+        return surface
+
+    def _build_glow(self, color, radius, alpha, rings=3):
+        """Fading glow rings (three by default) plus the particle core"""
+        outer = radius + rings * 8
+        surface = pygame.Surface((outer * 2, outer * 2), pygame.SRCALPHA)
+        for i in range(3 - rings, 3):
+            glow_radius = radius + (3 - i) * 8
+            layer = self._build_circle(color, glow_radius, alpha // (i + 2))
+            surface.blit(layer, (outer - glow_radius, outer - glow_radius))
+        surface.blit(self._build_circle(color, radius, alpha), (outer - radius, outer - radius))
+        return surface
+
+    def _build_cross(self, color, radius, alpha):
+        """Disc with a white plus sign (healing)"""
+        surface = self._build_circle(color, radius, alpha)
+        half = radius // 2
+        pygame.draw.line(surface, (255, 255, 255), (radius - half, radius), (radius + half, radius), 2)
+        pygame.draw.line(surface, (255, 255, 255), (radius, radius - half), (radius, radius + half), 2)
+        return surface
+
+    def get_sprite(self, color, radius, alpha, kind="circle", rings=3):
+        """
+        Get a sprite for the given look
+        kind: 'circle' (flat disc), 'halo' (disc with 2x soft ring), 'glow' (three glow rings)
+              or 'cross' (disc with a white plus)
+        rings: how many of the glow rings to draw (0-3, innermost kept; 'glow' only)
+        The sprite is centered, so blit it at (x - w/2, y - h/2)
+        """
+        color = (int(color[0]), int(color[1]), int(color[2]))
+        key = (kind, color, radius_bucket(radius), alpha_bucket(alpha))
+        if kind == "glow" and rings != 3:
+            key += (rings,)
+        sprite = self.sprite_cache.get(key)
+        if sprite is None:
+            if len(self.sprite_cache) >= MAX_CACHED_SPRITES:
+                self.sprite_cache.clear()
+            builder = {
+                "circle": self._build_circle,
+                "halo": self._build_halo,
+                "glow": self._build_glow,
+                "cross": self._build_cross
+            }[kind]
+            if kind == "glow":
+                sprite = builder(color, key[2], key[3], rings)
+            else:
+                sprite = builder(color, key[2], key[3])
+            self.sprite_cache[key] = sprite
+            self.sprites_built += 1
+        return sprite
+
+    def get_blit(self, color, x, y, radius, alpha, kind="circle", rings=3):
+        """Get a (sprite, position) pair centered on (x, y) for Surface.blits"""
+        sprite = self.get_sprite(color, radius, alpha, kind, rings)
+        half_w, half_h = sprite.get_width() // 2, sprite.get_height() // 2
+        return sprite, (int(x) - half_w, int(y) - half_h)
+
+    def prewarm(self, colors, radii, kind="circle"):
+        """Render every alpha bucket for the given colors and radii up front"""
+        for color in colors:
+            for radius in radii:
+                for level in range(ALPHA_LEVELS):
+                    self.get_sprite(color, radius, level * ALPHA_STEP, kind)
+
+
+# Global glow atlas instance
+glow_atlas = GlowAtlas()
@@ -0,0 +1,78 @@
+"""
+Numba Kernel Registry
+Every JIT kernel (particle physics, compaction, splatting, lightning paths) is declared
+with @kernel and its typed signatures. compile_kernels() compiles them all up front while
+the game is loading and records how long each took; the machine code is cached on disk
+(in __pycache__), so later runs only load it. Without Numba the kernels run as plain
+Python, or as a NumPy fallback where one is registered.
+"""
+
+import time
+try:
+    import numba
+    from numba import prange
+    NUMBA_AVAILABLE = True
+    # Kernels are first launched from the background weather loader thread; TBB's worker
+    # pool then hangs interpreter exit once that thread has finished, so prefer OpenMP
+    numba.config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+except ImportError:
+    numba = None
+    prange = range
+    NUMBA_AVAILABLE = False
+
+# name -> {"dispatcher", "signatures", "parallel", "compile_time"}
+kernels = {}
+
+
+def kernel(signatures, parallel=False, fallback=None):
+    """
+    Register a nopython kernel with the argument types it is called with
+    signatures are Numba signature strings, e.g. "(float32[:, ::1], int64)". Call sites
+    have to stick to these types, or Numba compiles another specialization mid-game.
+    fallback (same arguments) replaces the plain Python body when Numba is missing.
+    """
+    def decorator(function):
+        if NUMBA_AVAILABLE:
+            dispatcher = numba.njit(parallel=parallel, cache=True)(function)
+        else:
+            dispatcher = fallback or function
+        kernels[function.__name__] = {
+            "dispatcher": dispatcher,
+            "signatures": list(signatures),
+            "parallel": parallel,
+            "compile_time": None
+        }
+        return dispatcher
+    return decorator
+
+
+def compile_kernels():
+    """Compile (or load from the disk cache) every registered signature; returns seconds spent"""
+    total = 0.0
+    if not NUMBA_AVAILABLE:
+        return total
+
+    for name, entry in kernels.items():
+        if entry["compile_time"] is not None:
+            continue
+        start = time.perf_counter()
+        for signature in entry["signatures"]:
+            entry["dispatcher"].compile(signature)
+        entry["compile_time"] = time.perf_counter() - start
+        total += entry["compile_time"]
+    return total
+
+
+def get_kernel_report():
+    """One line per kernel: compile time and specializations (more than registered = a missed type)"""
+    if not NUMBA_AVAILABLE:
+        return ["Numba not available: kernels run as Python/NumPy"]
+
+    lines = []
+    for name, entry in kernels.items():
+        compiled = len(entry["dispatcher"].signatures)
+        registered = len(entry["signatures"])
+        compile_time = "not compiled" if entry["compile_time"] is None else f"{entry['compile_time'] * 1000:.0f} ms"
+        extra = f" ({compiled - registered} unregistered!)" if compiled > registered else ""
+        lines.append(f"{name}: {compile_time}, {compiled}/{registered} signatures{extra}")
+    return lines
@@ -0,0 +1,239 @@
+"""
+Loading Screen
+Startup work is split into jobs (reading sprites and textures, decoding music, compiling
+the weather kernels). Worker threads run the jobs that never touch the display; jobs that
+convert surfaces or start playback run on the main thread between loading-screen frames.
+The main menu opens as soon as every critical job is done and the rest finish behind it.
+"""
+
+import os
+import sys
+import math
+import time
+import queue
+import threading
+import pygame
+from python.color import BLACK, WHITE, GOLD, DARK_GRAY, GRAY
+from python.pygame1 import FONT, SMALL_FONT, BIG_FONT, CLOCK
+from python.fullscreen_toggle import display_manager
+from python.clock import draw_real_time_clock
+from python.settings import game_settings
+from python.startup_profiler import startup_profiler
+
+LOADING_WORKERS = max(2, min(4, os.cpu_count() or 1))
+
+# Progress bar and spinner layout (relative to the screen center)
+BAR_WIDTH = 600
+BAR_HEIGHT = 18
+SPINNER_DOTS = 8
+SPINNER_RADIUS = 14
+
+
+class LoadingJob:
+    """One unit of startup work"""
+    def __init__(self, name, function, critical=True, main_thread=False, requires=()):
+        self.name = name
+        self.function = function
+        self.critical = critical
+        self.main_thread = main_thread
+        self.requires = list(requires)
+        self.state = "waiting"  # waiting -> queued -> running -> done / failed
+        self.result = None
+        self.error = None
+        self.duration = None
+
+    @property
+    def finished(self):
+        return self.state in ("done", "failed")
+
+
+class LoadingPipeline:
+    """
+    Dependency-ordered startup jobs on a pool of daemon worker threads
+    Main-thread jobs only run while the loading screen is up, so they should be critical.
+    A failed job still counts as finished; jobs that require it run anyway.
+    """
+    def __init__(self, workers=LOADING_WORKERS):
+        self.jobs = {}
+        self.workers = workers
+        # Critical jobs jump ahead of background ones: (priority, order, job)
+        self.queue = queue.PriorityQueue()
+        self.order = 0
+        self.lock = threading.Lock()
+        self.started = False
+        self.stopped = False
+
+    def add(self, name, function, critical=True, main_thread=False, requires=()):
+        """Add a job; requires lists jobs that have to finish first"""
+        self.jobs[name] = LoadingJob(name, function, critical, main_thread, requires)
+
+    def result(self, name):
+        return self.jobs[name].result
+
+    def is_finished(self, name):
+        return self.jobs[name].finished
+
+    def start(self):
+        """Start the workers and queue every job that is ready"""
+        if self.started:
+            return
+        self.started = True
+        for i in range(self.workers):
+            threading.Thread(target=self._worker, name=f"loader-{i}", daemon=True).start()
+        self.schedule()
+
+    def _requirements_met(self, job):
+        return all(self.jobs[name].finished for name in job.requires)
+
+    def schedule(self):
+        """Queue worker jobs whose requirements have finished; stop the workers when all are done"""
+        with self.lock:
+            for job in self.jobs.values():
+                if job.state == "waiting" and not job.main_thread and self._requirements_met(job):
+                    job.state = "queued"
+                    self.put(0 if job.critical else 1, job)
+
+            if not self.stopped and all(job.finished for job in self.jobs.values()):
+                self.stopped = True
+                for i in range(self.workers):
+                    self.put(2, None)
+
+    def put(self, priority, job):
+        self.order += 1
+        self.queue.put((priority, self.order, job))
+
+    def _run(self, job):
+        job.state = "running"
+        start = time.perf_counter()
+        try:
+            with startup_profiler.phase(job.name, "job"):
+                job.result = job.function()
+            job.state = "done"
+        except Exception as e:
+            job.error = e
+            job.state = "failed"
+            print(f"Loading job '{job.name}' failed: {e}")
+        job.duration = time.perf_counter() - start
+
+    def _worker(self):
+        while True:
+            priority, order, job = self.queue.get()
+            if job is None:
+                return
+            self._run(job)
+            self.schedule()
+
+    def run_main_thread_jobs(self):
+        """Run every main-thread job whose requirements have finished"""
+        for job in list(self.jobs.values()):
+            if job.state == "waiting" and job.main_thread and self._requirements_met(job):
+                self._run(job)
+        self.schedule()
+
+    def critical_ready(self):
+        return all(job.finished for job in self.jobs.values() if job.critical)
+
+    def get_progress(self):
+        """Fraction of critical jobs finished"""
+        critical = [job for job in self.jobs.values() if job.critical]
+        if not critical:
+            return 1.0
+        return sum(job.finished for job in critical) / len(critical)
+
+    def get_running(self):
+        """Names of the critical jobs currently running"""
+        return [job.name for job in self.jobs.values() if job.critical and job.state == "running"]
+
+    def get_pending_count(self):
+        """Jobs that have not finished yet"""
+        return sum(not job.finished for job in self.jobs.values())
+
+
+class LoadingScreen:
+    """Title, progress bar and spinner, animated by frame time"""
+    def __init__(self, pipeline, get_subtitle=None):
+        self.pipeline = pipeline
+        self.get_subtitle = get_subtitle or (lambda: ("Loading Mikamon", WHITE))
+        self.title_text = BIG_FONT.render("MIKAMON: CATGIRL CHRONICLES", True, GOLD)
+        self.text_cache = {}  # (text, color, font) -> Surface
+        self.shown_progress = 0.0
+        self.time = 0
+
+    def render_text(self, text, color, font):
+        key = (text, color, font)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self.text_cache[key] = surface
+        return surface
+
+    def update(self, dt):
+        self.time += dt
+        # Ease the bar towards the real progress so finished jobs don't make it jump
+        target = self.pipeline.get_progress()
+        self.shown_progress += (target - self.shown_progress) * min(1.0, dt / 120.0)
+
+    def draw(self, screen):
+        screen_width, screen_height = display_manager.get_size()
+        center_x, center_y = screen_width // 2, screen_height // 2
+        screen.fill(BLACK)
+
+        screen.blit(self.title_text, self.title_text.get_rect(center=(center_x, center_y - 50)))
+        subtitle, color = self.get_subtitle()
+        subtitle_text = self.render_text(subtitle, color, FONT)
+        screen.blit(subtitle_text, subtitle_text.get_rect(center=(center_x, center_y)))
+
+        # Progress bar
+        bar_rect = pygame.Rect(center_x - BAR_WIDTH // 2, center_y + 40, BAR_WIDTH, BAR_HEIGHT)
+        pygame.draw.rect(screen, DARK_GRAY, bar_rect, border_radius=BAR_HEIGHT // 2)
+        fill_width = int(BAR_WIDTH * self.shown_progress)
+        if fill_width > 0:
+            pygame.draw.rect(screen, GOLD, (bar_rect.x, bar_rect.y, fill_width, BAR_HEIGHT),
+                             border_radius=BAR_HEIGHT // 2)
+
+        # Spinner: dots chasing around a circle, brightest at the head
+        spinner_x = bar_rect.right + 20 + SPINNER_RADIUS
+        spinner_y = bar_rect.centery
+        head = (self.time / 100.0) % SPINNER_DOTS
+        for i in range(SPINNER_DOTS):
+            angle = 2 * math.pi * i / SPINNER_DOTS - math.pi / 2
+            fade = 1.0 - ((head - i) % SPINNER_DOTS) / SPINNER_DOTS
+            shade = int(60 + 195 * fade)
+            pygame.draw.circle(screen, (shade, shade, int(shade * 0.6)),
+                               (int(spinner_x + math.cos(angle) * SPINNER_RADIUS),
+                                int(spinner_y + math.sin(angle) * SPINNER_RADIUS)),
+                               max(2, int(2 + 2 * fade)))
+
+        running = self.pipeline.get_running()
+        label = f"{', '.join(running)}..." if running else "Starting..."
+        label_text = self.render_text(label, GRAY, SMALL_FONT)
+        screen.blit(label_text, label_text.get_rect(center=(center_x, bar_rect.bottom + 25)))
+
+        draw_real_time_clock(game_settings.get("show_clock", True))
+
+
+def run_loading_screen(pipeline, get_subtitle=None):
+    """Run the pipeline behind an animated loading screen until the critical jobs are done"""
+    start = time.perf_counter()
+    pipeline.start()
+    loading_screen = LoadingScreen(pipeline, get_subtitle)
+    CLOCK.tick()
+
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+        pipeline.run_main_thread_jobs()
+        if pipeline.critical_ready():
+            break
+
+        loading_screen.update(CLOCK.get_time())
+        loading_screen.draw(display_manager.get_screen())
+        display_manager.present()
+        CLOCK.tick(60)
+
+    pending = pipeline.get_pending_count()
+    print(f"Critical assets ready in {time.perf_counter() - start:.2f}s"
+          + (f"; {pending} jobs still loading in the background" if pending else ""))
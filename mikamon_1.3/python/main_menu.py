@@ -13,37 +13,35 @@ from python.pygame1 import FONT, SMALL_FONT, BIG_FONT, CLOCK
 from python.shadowed_text_and_buttons import draw_text_with_shadow, draw_gradient_button
 from python.save_system import save_system
 from python.clock import draw_real_time_clock
+from python.glow_atlas import glow_atlas
+from python.particle_pool import particle_pool
+from python.surface_pool import surface_pool
+from python.frame_pacer import frame_pacer
+from python.startup_profiler import startup_profiler
 from python.settings import game_settings
 from python.fullscreen_toggle import (
     display_manager, handle_fullscreen_toggle, scale_background_for_resolution,
     create_fullscreen_button, draw_fullscreen_button
 )
 
-class MenuParticle:
-    """Floating particles for background atmosphere"""
-    def __init__(self, x, y, color, speed):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.speed = speed
-        self.size = random.randint(2, 5)
-        self.alpha = random.randint(100, 255)
-        self.lifetime = random.randint(3000, 6000)
-        self.angle = random.uniform(0, math.pi * 2)
-        
-    def update(self, dt):
-        self.lifetime -= dt
-        self.x += math.cos(self.angle) * self.speed * dt * 0.05
-        self.y += math.sin(self.angle) * self.speed * dt * 0.05
-        self.alpha = max(0, self.alpha - dt * 0.05)
-        return self.lifetime > 0
-    
-    def draw(self, screen):
-        if self.alpha > 0:
-            surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            color_with_alpha = (*self.color[:3], int(self.alpha))
-            pygame.draw.circle(surf, color_with_alpha, (self.size, self.size), self.size)
-            screen.blit(surf, (int(self.x), int(self.y)))
+MENU_PARTICLE_COLORS = [GOLD, CYAN, PINK, PURPLE, YELLOW]
+
+def spawn_menu_particle(particles, screen_width, screen_height):
+    """Spawn a floating background mote into the menu particle view"""
+    size = random.randint(2, 5)
+    angle = random.uniform(0, math.pi * 2)
+    speed = random.uniform(0.5, 2.0) * 0.05 * 16.67  # pixels per 60 FPS frame
+    particles.emit(
+        random.randint(0, screen_width) + size,
+        random.randint(0, screen_height) + size,
+        math.cos(angle) * speed,
+        math.sin(angle) * speed,
+        random.choice(MENU_PARTICLE_COLORS),
+        random.randint(3000, 6000),
+        size=size,
+        alpha=random.randint(100, 255),
+        fade_rate=0.05
+    )
 
 def draw_enhanced_credits(screen, screen_width, screen_height, timer):
     """Draw enhanced credits with animations"""
@@ -162,7 +160,7 @@ def draw_save_info_panel(screen, save_info, button_x, button_y, button_width, ti
     panel_y = button_y + 90
     
     # Animated background
-    panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+    panel_surface = surface_pool.get((panel_width, panel_height), pygame.SRCALPHA, "save_panel")
     alpha = int(200 + 30 * math.sin(timer * 0.003))
     
     # Gradient background
@@ -233,7 +231,8 @@ def draw_menu_button_enhanced(screen, rect, text, color1, color2, hover, font, t
         for i in range(4, 0, -1):
             glow_rect = rect.inflate(i * 4, i * 4)
             glow_alpha = int(60 - i * 12)
-            glow_surface = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
+            glow_surface = surface_pool.get(glow_rect.size, pygame.SRCALPHA)
+            glow_surface.fill((0, 0, 0, 0))
             pygame.draw.rect(glow_surface, (*button_color, glow_alpha), (0, 0, glow_rect.width, glow_rect.height), border_radius=10)
             screen.blit(glow_surface, glow_rect.topleft)
     
@@ -261,7 +260,7 @@ def main_menu(sprites, battle_sprites, background):
     menu_timer = 0
     show_confirmation = False
     confirmation_type = None
-    particles = []
+    particles = particle_pool.view("menu")
     
     # Check if save exists and LOAD SETTINGS
     has_save = save_system.has_save()
@@ -273,14 +272,11 @@ def main_menu(sprites, battle_sprites, background):
         game_settings.update(saved_settings)
         print(f"Main menu loaded settings from save: {game_settings}")
     
-    # Initialize particles
+    # Initialize particles (sprites for every menu color/size are rendered once up front)
+    glow_atlas.prewarm(MENU_PARTICLE_COLORS, range(2, 6))
     screen_width, screen_height = display_manager.get_size()
     for _ in range(30):
-        x = random.randint(0, screen_width)
-        y = random.randint(0, screen_height)
-        color = random.choice([GOLD, CYAN, PINK, PURPLE, YELLOW])
-        speed = random.uniform(0.5, 2.0)
-        particles.append(MenuParticle(x, y, color, speed))
+        spawn_menu_particle(particles, screen_width, screen_height)
     
     while True:
         dt = CLOCK.get_time()
@@ -296,23 +292,16 @@ def main_menu(sprites, battle_sprites, background):
         
         # Animated overlay with breathing effect
         overlay_alpha = int(100 + 40 * math.sin(menu_timer * 0.002))
-        overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-        overlay.fill((*BLACK[:3], overlay_alpha))
-        SCREEN.blit(overlay, (0, 0))
+        surface_pool.blit_fill(SCREEN, (*BLACK[:3], overlay_alpha))
         
         # Update and draw particles
-        particles = [p for p in particles if p.update(dt)]
+        particle_pool.update(dt)
         
         # Add new particles
         if len(particles) < 30 and random.random() < 0.3:
-            x = random.randint(0, screen_width)
-            y = random.randint(0, screen_height)
-            color = random.choice([GOLD, CYAN, PINK, PURPLE, YELLOW])
-            speed = random.uniform(0.5, 2.0)
-            particles.append(MenuParticle(x, y, color, speed))
+            spawn_menu_particle(particles, screen_width, screen_height)
         
-        for particle in particles:
-            particle.draw(SCREEN)
+        particles.draw(SCREEN)
         
         # Draw enhanced credits
         draw_enhanced_credits(SCREEN, screen_width, screen_height, menu_timer)
@@ -327,7 +316,7 @@ def main_menu(sprites, battle_sprites, background):
         button_y_start = int(screen_height * 0.5)
         button_spacing = int(screen_height * 0.11)
         
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = display_manager.get_mouse_pos()
         
         # Continue button (only if save exists)
         continue_rect = None
@@ -393,9 +382,7 @@ def main_menu(sprites, battle_sprites, background):
         # Draw confirmation dialog
         if show_confirmation:
             # Darken background more
-            confirm_overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-            confirm_overlay.fill((0, 0, 0, 200))
-            SCREEN.blit(confirm_overlay, (0, 0))
+            surface_pool.blit_fill(SCREEN, (0, 0, 0, 200))
             
             # Animated confirmation panel
             panel_width = int(screen_width * 0.45)
@@ -407,13 +394,12 @@ def main_menu(sprites, battle_sprites, background):
             for i in range(6, 0, -1):
                 glow_rect = pygame.Rect(panel_x - i*2, panel_y - i*2, panel_width + i*4, panel_height + i*4)
                 glow_alpha = int(40 - i * 5)
-                glow_surf = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
+                glow_surf = surface_pool.get(glow_rect.size, pygame.SRCALPHA)
+                glow_surf.fill((0, 0, 0, 0))
                 pygame.draw.rect(glow_surf, (*RED[:3], glow_alpha), (0, 0, glow_rect.width, glow_rect.height), border_radius=15)
                 SCREEN.blit(glow_surf, glow_rect.topleft)
             
-            panel_surface = pygame.Surface((panel_width, panel_height))
-            panel_surface.fill(LIGHT_GRAY)
-            SCREEN.blit(panel_surface, (panel_x, panel_y))
+            SCREEN.fill(LIGHT_GRAY, (panel_x, panel_y, panel_width, panel_height))
             pygame.draw.rect(SCREEN, RED, (panel_x, panel_y, panel_width, panel_height), 5, border_radius=15)
             
             # Warning icon animation (using text instead of emoji)
@@ -476,11 +462,7 @@ def main_menu(sprites, battle_sprites, background):
                 screen_width, screen_height = display_manager.get_size()
                 particles.clear()
                 for _ in range(30):
-                    x = random.randint(0, screen_width)
-                    y = random.randint(0, screen_height)
-                    color = random.choice([GOLD, CYAN, PINK, PURPLE, YELLOW])
-                    speed = random.uniform(0.5, 2.0)
-                    particles.append(MenuParticle(x, y, color, speed))
+                    spawn_menu_particle(particles, screen_width, screen_height)
                 continue
             
             elif event.type == pygame.KEYDOWN:
@@ -491,7 +473,7 @@ def main_menu(sprites, battle_sprites, background):
                         return 'quit'
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                mx, my = pygame.mouse.get_pos()
+                mx, my = display_manager.get_mouse_pos()
                 
                 if show_confirmation:
                     if yes_rect.collidepoint((mx, my)):
@@ -538,5 +520,6 @@ def main_menu(sprites, battle_sprites, background):
         # Draw clock if enabled - NOW USES LOADED SETTING
         draw_real_time_clock(game_settings.get("show_clock", True))
         
-        pygame.display.flip()
-        CLOCK.tick(60)
\ No newline at end of file
+        display_manager.present()
+        startup_profiler.finish()
+        frame_pacer.tick()  # particles are always moving; only throttled while minimized
\ No newline at end of file
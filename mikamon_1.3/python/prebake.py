@@ -0,0 +1,80 @@
+"""
+Texture Pre-bake
+Regenerates every procedurally produced texture (backgrounds, fallback sprites, time icons,
+sky overlays, fog tiles, lightning variants, plus anything recorded in the cache manifest)
+across a process pool and writes it into the texture cache, so players never pay the
+generation cost on first launch.
+
+Run from the mikamon_1.3 folder after installing or updating:
+    python -m python.prebake              # bake whatever is missing
+    python -m python.prebake --force      # rebake everything
+    python -m python.prebake --workers 4
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Generators only need off-screen surfaces; never open a window (parent or workers)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def init_worker():
+    """Register the generators in each worker process"""
+    from python.texture_cache import load_generator_modules
+    load_generator_modules()
+
+
+def bake(name, params):
+    """Generate one texture and write it to the cache; returns (name, params, bytes, seconds)"""
+    from python.texture_cache import texture_cache
+    start = time.perf_counter()
+    array = texture_cache.generate(name, params)
+    texture_cache.save(texture_cache.get_path(name, params), array)
+    return name, params, array.nbytes, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-bake procedural textures into the texture cache")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="regenerate textures that are already cached")
+    args = parser.parse_args(argv)
+
+    from python.texture_cache import texture_cache, load_generator_modules
+    load_generator_modules()
+
+    jobs = texture_cache.get_jobs()
+    if not args.force:
+        jobs = [(name, params) for name, params in jobs
+                if not os.path.exists(texture_cache.get_path(name, params))]
+    if not jobs:
+        print("Texture cache is up to date")
+        return 0
+
+    print(f"Baking {len(jobs)} textures on {args.workers} workers into {texture_cache.cache_dir}")
+    start = time.perf_counter()
+    total_bytes = 0
+    failures = 0
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker) as pool:
+        futures = {pool.submit(bake, name, params): (name, params) for name, params in jobs}
+        for future in as_completed(futures):
+            name, params = futures[future]
+            try:
+                _, _, nbytes, seconds = future.result()
+            except Exception as e:
+                failures += 1
+                print(f"  FAILED {name}{params}: {e}")
+                continue
+            total_bytes += nbytes
+            print(f"  {name}{params}: {seconds * 1000:.0f} ms")
+
+    elapsed = time.perf_counter() - start
+    print(f"Baked {len(jobs) - failures} textures ({total_bytes / 1e6:.1f} MB) in {elapsed:.1f} s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
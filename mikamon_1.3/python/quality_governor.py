@@ -0,0 +1,103 @@
+"""
+Adaptive Quality Governor
+Watches how long the battle loop takes to build each frame (CLOCK.get_rawtime, so the
+time spent waiting in CLOCK.tick doesn't count) and steps effect quality down while the
+loop is clearly over its 60 FPS budget, then back up once there is clear headroom again.
+Effects read their settings with quality_governor.get(key) every frame.
+
+Hysteresis keeps it from flapping between two levels: quality drops when the average is
+15% over budget but only comes back after a few seconds well under it, and if a restored level
+is over budget again straight away, the next restore waits twice as long.
+"""
+
+from collections import deque
+
+FRAME_BUDGET_MS = 1000 / 60
+SAMPLE_FRAMES = 30              # rolling window the decisions are based on
+DOWNGRADE_RATIO = 1.15          # average work time above budget * this -> lower quality
+UPGRADE_RATIO = 0.6             # ... below budget * this (for UPGRADE_AFTER_MS) -> raise it
+UPGRADE_AFTER_MS = 3000
+MAX_UPGRADE_AFTER_MS = 30000
+CHANGE_COOLDOWN_MS = 1000       # minimum time between two changes
+REVERTED_WITHIN_MS = 5000       # a drop this soon after a raise doubles the next wait
+
+# Level 0 is full quality; each later level is cheaper to draw
+# (render_scale only applies while the battle render scale setting is "Auto")
+QUALITY_LEVELS = [
+    {"name": "High", "particle_cap": 1.0, "spawn_scale": 1.0, "glow_layers": 3,
+     "fog_layers": 2, "sky_layers": 2, "render_scale": 1.0},
+    {"name": "Medium", "particle_cap": 0.6, "spawn_scale": 0.7, "glow_layers": 2,
+     "fog_layers": 2, "sky_layers": 1, "render_scale": 1.0},
+    {"name": "Low", "particle_cap": 0.35, "spawn_scale": 0.5, "glow_layers": 1,
+     "fog_layers": 1, "sky_layers": 1, "render_scale": 0.75},
+    {"name": "Minimal", "particle_cap": 0.2, "spawn_scale": 0.3, "glow_layers": 0,
+     "fog_layers": 1, "sky_layers": 1, "render_scale": 0.5}
+]
+
+
+class QualityGovernor:
+    """Frame-budget driven effect quality level"""
+    def __init__(self, budget_ms=FRAME_BUDGET_MS):
+        self.budget_ms = budget_ms
+        self.level = 0
+        self.frame_times = deque(maxlen=SAMPLE_FRAMES)
+        self.headroom_ms = 0       # how long the average has been well under budget
+        self.cooldown_ms = 0
+        self.since_upgrade_ms = None
+        self.upgrade_after_ms = UPGRADE_AFTER_MS
+
+    def reset(self):
+        """Forget the recent frame times (e.g. at the start of a battle); the level is kept"""
+        self.frame_times.clear()
+        self.headroom_ms = 0
+        self.cooldown_ms = 0
+
+    def get(self, key):
+        return QUALITY_LEVELS[self.level][key]
+
+    def get_name(self):
+        return QUALITY_LEVELS[self.level]["name"]
+
+    def get_average(self):
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times)
+
+    def set_level(self, level, average):
+        old_name = self.get_name()
+        self.level = level
+        self.frame_times.clear()
+        self.headroom_ms = 0
+        self.cooldown_ms = CHANGE_COOLDOWN_MS
+        print(f"Effect quality {old_name} -> {self.get_name()} (frames took {average:.1f} ms, "
+              f"budget {self.budget_ms:.1f} ms)")
+
+    def update(self, frame_ms, dt):
+        """Record one frame's work time (ms) and change the level if needed; dt is the frame's game time"""
+        self.frame_times.append(frame_ms)
+        self.cooldown_ms -= dt
+        if self.since_upgrade_ms is not None:
+            self.since_upgrade_ms += dt
+        if len(self.frame_times) < SAMPLE_FRAMES:
+            return
+
+        average = self.get_average()
+        if average > self.budget_ms * DOWNGRADE_RATIO:
+            self.headroom_ms = 0
+            if self.cooldown_ms <= 0 and self.level < len(QUALITY_LEVELS) - 1:
+                # The level that was just restored can't hold the budget: back off before retrying
+                if self.since_upgrade_ms is not None and self.since_upgrade_ms < REVERTED_WITHIN_MS:
+                    self.upgrade_after_ms = min(MAX_UPGRADE_AFTER_MS, self.upgrade_after_ms * 2)
+                self.since_upgrade_ms = None
+                self.set_level(self.level + 1, average)
+        elif average < self.budget_ms * UPGRADE_RATIO:
+            self.headroom_ms += dt
+            if self.headroom_ms >= self.upgrade_after_ms and self.cooldown_ms <= 0 and self.level > 0:
+                self.since_upgrade_ms = 0
+                self.set_level(self.level - 1, average)
+        else:
+            self.headroom_ms = 0
+
+
+# Global quality governor instance
+quality_governor = QualityGovernor()
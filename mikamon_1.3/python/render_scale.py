@@ -0,0 +1,69 @@
+"""
+Battle Render Scale
+The battle scene (background, weather, screen tint and sky overlay) can be drawn into a
+smaller buffer and upscaled onto the canvas once per frame; panels, text, bars, sprites
+and buttons are then drawn on top at full resolution. The fill-rate bound layers cost
+roughly scale^2 as much. "Auto" follows the adaptive quality governor.
+"""
+
+import pygame
+from python.fullscreen_toggle import display_manager
+from python.quality_governor import quality_governor
+
+# Settings menu choices, cycled in this order
+RENDER_SCALE_OPTIONS = ["Auto", 1.0, 0.75, 0.5]
+
+
+def get_option_label(option):
+    return option if option == "Auto" else f"{int(option * 100)}%"
+
+
+class RenderScale:
+    """Reduced-resolution scene buffer for the battle screen"""
+    def __init__(self):
+        self.scale = 1.0
+        self.scene = None
+        self.target = None
+        self.background = None  # (source, size, scaled surface)
+
+    def get_scale(self, option="Auto"):
+        """Scene scale for a settings option ("Auto" asks the quality governor)"""
+        if option == "Auto":
+            return quality_governor.get("render_scale")
+        return float(option)
+
+    def begin_scene(self, screen, option="Auto"):
+        """Surface to draw this frame's scene layers into (screen itself at full scale)"""
+        self.scale = self.get_scale(option)
+        self.target = screen
+        if self.scale >= 1.0:
+            self.scale = 1.0
+            return screen
+
+        width, height = screen.get_size()
+        size = (max(1, int(width * self.scale)), max(1, int(height * self.scale)))
+        if self.scene is None or self.scene.get_size() != size:
+            self.scene = pygame.Surface(size, 0, screen)
+        return self.scene
+
+    def scale_background(self, background):
+        """The battle background at the current scene size (scaled once per size)"""
+        if self.scale == 1.0:
+            return background
+        size = self.scene.get_size()
+        if self.background is None or self.background[0] is not background or self.background[1] != size:
+            self.background = (background, size, pygame.transform.smoothscale(background, size))
+        return self.background[2]
+
+    def end_scene(self):
+        """Upscale the scene buffer onto the screen (nothing to do at full scale)"""
+        if self.scale == 1.0:
+            return
+        if display_manager.smooth_scaling:
+            pygame.transform.smoothscale(self.scene, self.target.get_size(), self.target)
+        else:
+            pygame.transform.scale(self.scene, self.target.get_size(), self.target)
+
+
+# Global render scale instance
+render_scale = RenderScale()
@@ -1,9 +1,13 @@
 import pygame, sys, os
 from python.color import LIGHT_GRAY, DARK_GRAY, BLACK, WHITE, GREEN, DARK_GREEN, RED, DARK_RED, BLUE, DARK_BLUE, PURPLE, PINK, GRAY
-from python.music import (play_title_music, play_fight_music, stop_all_music, update_music_volumes, fight_music_loaded, title_music_loaded, current_music_type, test_fight_volume)
-from python.pygame1 import FONT, SMALL_FONT, BIG_FONT, CLOCK
-from python.clock import draw_real_time_clock
+from python.music import (play_title_music, play_fight_music, stop_all_music, update_music_volumes, fight_music_loaded, title_music_loaded, current_music_type, test_fight_volume, get_music_status)
+from python.pygame1 import FONT, SMALL_FONT, BIG_FONT
+from python.clock import clock_widget, ms_until_next_second
+from python.frame_pacer import frame_pacer, FRAME_RATE_OPTIONS, get_frame_rate_label
 from python.shadowed_text_and_buttons import draw_text_with_shadow, draw_gradient_button
+from python.surface_pool import surface_pool
+from python.render_scale import RENDER_SCALE_OPTIONS, get_option_label
+from python.ui_layer import ui_layer
 from python.fullscreen_toggle import (
     display_manager, handle_fullscreen_toggle, scale_background_for_resolution
 )
@@ -14,7 +18,9 @@ game_settings = {
     "fight_music_volume": 0.1,
     "difficulty": "Normal",
     "show_clock": True,
-    "show_ai_predictions": False
+    "show_ai_predictions": False,
+    "render_scale": "Auto",
+    "battle_fps": 60
 }
 
 # Test volume cooldown tracker
@@ -25,39 +31,59 @@ def settings_menu(sprites, battle_sprites, background):
     global game_settings, test_volume_cooldown
     settings_running = True
     
+    ui_layer.leave()
+    
     while settings_running:
         # Get current screen and scale background
         SCREEN = display_manager.get_screen()
         screen_width, screen_height = display_manager.get_size()
-        scaled_background = scale_background_for_resolution(background)
-        SCREEN.blit(scaled_background, (0, 0))
-        
-        # Settings overlay
-        overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        SCREEN.blit(overlay, (0, 0))
+        mouse_pos = display_manager.get_mouse_pos()
         
         # Responsive panel sizing
         panel_width = int(screen_width * 0.625)
         panel_height = int(screen_height * 0.722)
         panel_x = (screen_width - panel_width) // 2
         panel_y = int(screen_height * 0.139)
-        
         panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        panel_surface = pygame.Surface((panel_width, panel_height))
-        panel_surface.fill(LIGHT_GRAY)
-        SCREEN.blit(panel_surface, panel_rect.topleft)
-        pygame.draw.rect(SCREEN, BLACK, panel_rect, 4)
-        
-        # Title
-        title_x = panel_x + panel_width // 2 - 150
-        title_y = panel_y + int(panel_height * 0.038)
-        draw_text_with_shadow("GAME SETTINGS", title_x, title_y, BLACK, BIG_FONT, 3)
         
         # Content positioning
         content_x = panel_x + int(panel_width * 0.033)
         y_pos = panel_y + int(panel_height * 0.15)
-
+        difficulty_y = y_pos + int(panel_height * 0.15)
+        options_y = difficulty_y + int(panel_height * 0.2)
+        clock_toggle_y = options_y + 35
+        ai_toggle_y = clock_toggle_y + 50
+        status_y = ai_toggle_y + 80
+        
+        def draw_static():
+            """Background, overlay, panel and the labels that never change"""
+            SCREEN.blit(scale_background_for_resolution(background), (0, 0))
+            
+            # Settings overlay
+            surface_pool.blit_fill(SCREEN, (0, 0, 0, 150))
+            
+            panel_surface = pygame.Surface((panel_width, panel_height))
+            panel_surface.fill(LIGHT_GRAY)
+            SCREEN.blit(panel_surface, panel_rect.topleft)
+            pygame.draw.rect(SCREEN, BLACK, panel_rect, 4)
+            
+            # Title
+            title_x = panel_x + panel_width // 2 - 150
+            title_y = panel_y + int(panel_height * 0.038)
+            draw_text_with_shadow("GAME SETTINGS", title_x, title_y, BLACK, BIG_FONT, 3)
+            
+            draw_text_with_shadow("Difficulty:", content_x, difficulty_y, BLACK, FONT)
+            draw_text_with_shadow("Display Options:", content_x, options_y, BLACK, FONT)
+            draw_text_with_shadow("Music System Status:", content_x, status_y, BLACK, FONT)
+        
+        # Only the widgets below are redrawn, and only when their state changes
+        ui_layer.begin("settings", draw_static)
+        
+        def button(name, text, rect, color1, color2, font=SMALL_FONT, enabled=True):
+            hover = enabled and rect.collidepoint(mouse_pos)
+            ui_layer.widget(name, rect, (text, color1, color2, hover),
+                            lambda: draw_gradient_button(text, rect, color1, color2, hover, font))
+        
         # Music control buttons
         button_width = int(panel_width * 0.125)
         button_height = int(panel_height * 0.051)
@@ -71,25 +97,17 @@ def settings_menu(sprites, battle_sprites, background):
         test_available = current_time >= test_volume_cooldown
         test_fight_btn = pygame.Rect(content_x + 3 * (button_width + button_spacing), y_pos, button_width, button_height)
         
-        draw_gradient_button("Play Title", play_title_btn, DARK_GREEN, GREEN, 
-                           play_title_btn.collidepoint(pygame.mouse.get_pos()), SMALL_FONT)
-        draw_gradient_button("Play Fight", play_fight_btn, DARK_BLUE, BLUE, 
-                           play_fight_btn.collidepoint(pygame.mouse.get_pos()), SMALL_FONT)
-        draw_gradient_button("Stop Music", stop_music_btn, DARK_RED, RED, 
-                           stop_music_btn.collidepoint(pygame.mouse.get_pos()), SMALL_FONT)
+        button("play_title", "Play Title", play_title_btn, DARK_GREEN, GREEN)
+        button("play_fight", "Play Fight", play_fight_btn, DARK_BLUE, BLUE)
+        button("stop_music", "Stop Music", stop_music_btn, DARK_RED, RED)
         
         if test_available:
-            draw_gradient_button("Test Fight Vol", test_fight_btn, PURPLE, PINK, 
-                               test_fight_btn.collidepoint(pygame.mouse.get_pos()), SMALL_FONT)
+            button("test_fight", "Test Fight Vol", test_fight_btn, PURPLE, PINK)
         else:
             cooldown_remaining = (test_volume_cooldown - current_time) / 1000.0
-            draw_gradient_button(f"Wait {cooldown_remaining:.1f}s", test_fight_btn, DARK_GRAY, GRAY, 
-                               False, SMALL_FONT)
+            button("test_fight", f"Wait {cooldown_remaining:.1f}s", test_fight_btn, DARK_GRAY, GRAY, enabled=False)
         
         # Difficulty selection
-        y_pos += int(panel_height * 0.15)
-        draw_text_with_shadow("Difficulty:", content_x, y_pos, BLACK, FONT)
-        
         difficulties = ["Easy", "Normal", "Hard"]
         diff_buttons = []
         diff_button_width = int(panel_width * 0.1)
@@ -97,15 +115,14 @@ def settings_menu(sprites, battle_sprites, background):
         
         for i, diff in enumerate(difficulties):
             diff_rect = pygame.Rect(content_x + 150 + i * int(panel_width * 0.117), 
-                                   y_pos, 
+                                   difficulty_y, 
                                    diff_button_width, diff_button_height)
             diff_buttons.append((diff_rect, diff))
             
             if diff == game_settings["difficulty"]:
-                draw_gradient_button(diff, diff_rect, GREEN, DARK_GREEN, False, SMALL_FONT)
+                button(f"difficulty_{diff}", diff, diff_rect, GREEN, DARK_GREEN, enabled=False)
             else:
-                draw_gradient_button(diff, diff_rect, GRAY, DARK_GRAY, 
-                                   diff_rect.collidepoint(pygame.mouse.get_pos()), SMALL_FONT)
+                button(f"difficulty_{diff}", diff, diff_rect, GRAY, DARK_GRAY)
         
         # Difficulty description
         diff_descriptions = {
@@ -113,48 +130,66 @@ def settings_menu(sprites, battle_sprites, background):
             "Normal": "AI considers type effectiveness and weather",
             "Hard": "AI uses advanced strategy and adapts to battle conditions"
         }
-        description_y = y_pos + int(panel_height * 0.1)
-        draw_text_with_shadow(diff_descriptions[game_settings["difficulty"]], content_x, description_y, DARK_GRAY, SMALL_FONT)
-        
-        # Toggle options section
-        y_pos += int(panel_height * 0.2)
-        draw_text_with_shadow("Display Options:", content_x, y_pos, BLACK, FONT)
+        description = diff_descriptions[game_settings["difficulty"]]
+        description_y = difficulty_y + int(panel_height * 0.1)
+        description_rect = pygame.Rect(content_x, description_y, SMALL_FONT.size(description)[0], SMALL_FONT.get_height())
+        ui_layer.widget("difficulty_description", description_rect, description,
+                        lambda: draw_text_with_shadow(description, content_x, description_y, DARK_GRAY, SMALL_FONT))
         
         # Clock toggle
-        clock_toggle_y = y_pos + 35
         clock_toggle_rect = pygame.Rect(content_x + 150, clock_toggle_y, 200, 40)
         clock_enabled = game_settings.get("show_clock", True)
         clock_text = "Clock: ON" if clock_enabled else "Clock: OFF"
         clock_color1 = GREEN if clock_enabled else GRAY
         clock_color2 = DARK_GREEN if clock_enabled else DARK_GRAY
-        draw_gradient_button(clock_text, clock_toggle_rect, clock_color1, clock_color2, 
-                           clock_toggle_rect.collidepoint(pygame.mouse.get_pos()), SMALL_FONT)
+        button("clock_toggle", clock_text, clock_toggle_rect, clock_color1, clock_color2)
+        
+        # Battle render scale (cycles Auto -> 100% -> 75% -> 50%)
+        render_scale_rect = pygame.Rect(content_x + 400, clock_toggle_y, 240, 40)
+        render_scale_option = game_settings.get("render_scale", "Auto")
+        render_scale_text = f"Render Scale: {get_option_label(render_scale_option)}"
+        render_color1 = GREEN if render_scale_option == "Auto" else BLUE
+        render_color2 = DARK_GREEN if render_scale_option == "Auto" else DARK_BLUE
+        button("render_scale", render_scale_text, render_scale_rect, render_color1, render_color2)
         
         # AI predictions toggle
-        ai_toggle_y = clock_toggle_y + 50
         ai_toggle_rect = pygame.Rect(content_x + 150, ai_toggle_y, 200, 40)
         ai_enabled = game_settings.get("show_ai_predictions", False)
         ai_text = "AI Info: ON" if ai_enabled else "AI Info: OFF"
         ai_color1 = PURPLE if ai_enabled else GRAY
         ai_color2 = PINK if ai_enabled else DARK_GRAY
-        draw_gradient_button(ai_text, ai_toggle_rect, ai_color1, ai_color2, 
-                           ai_toggle_rect.collidepoint(pygame.mouse.get_pos()), SMALL_FONT)
+        button("ai_toggle", ai_text, ai_toggle_rect, ai_color1, ai_color2)
         
-        # Music status indicators
-        status_y = ai_toggle_y + 80
-        draw_text_with_shadow("Music System Status:", content_x, status_y, BLACK, FONT)
+        # Battle frame rate (cycles 60 -> 120 -> 144 -> Uncapped)
+        battle_fps_rect = pygame.Rect(content_x + 400, ai_toggle_y, 240, 40)
+        battle_fps = game_settings.get("battle_fps", 60)
+        battle_fps_text = f"Battle: {get_frame_rate_label(battle_fps)}"
+        fps_color1 = GREEN if battle_fps == 60 else BLUE
+        fps_color2 = DARK_GREEN if battle_fps == 60 else DARK_BLUE
+        button("battle_fps", battle_fps_text, battle_fps_rect, fps_color1, fps_color2)
         
-        title_status = "Loaded & Ready" if title_music_loaded else "Not Found"
-        fight_status = "Loaded & Ready" if fight_music_loaded else "Not Found"
+        # Music status indicators
+        # Read the live flags: music finishes loading after this module is imported
+        music_status = get_music_status()
+        title_status = "Loaded & Ready" if music_status["title_loaded"] else "Not Found"
+        fight_status = "Loaded & Ready" if music_status["fight_loaded"] else "Not Found"
         current_status = f"Currently Playing: {current_music_type.title() if current_music_type else 'None'}"
         
-        title_color = GREEN if title_music_loaded else RED
-        fight_color = GREEN if fight_music_loaded else RED
+        title_color = GREEN if music_status["title_loaded"] else RED
+        fight_color = GREEN if music_status["fight_loaded"] else RED
         current_color = BLUE if current_music_type else GRAY
         
-        draw_text_with_shadow(f"Title Music (Title_Screen_music.*): {title_status}", content_x, status_y + 35, title_color, SMALL_FONT)
-        draw_text_with_shadow(f"Fight Music (fight_music.wav): {fight_status}", content_x, status_y + 60, fight_color, SMALL_FONT)
-        draw_text_with_shadow(current_status, content_x, status_y + 85, current_color, SMALL_FONT)
+        status_lines = [
+            (f"Title Music (Title_Screen_music.*): {title_status}", title_color),
+            (f"Fight Music (fight_music.wav): {fight_status}", fight_color),
+            (current_status, current_color)
+        ]
+        status_rect = pygame.Rect(content_x, status_y + 35, panel_width // 2, 25 * len(status_lines))
+        
+        def draw_status():
+            for i, (text, color) in enumerate(status_lines):
+                draw_text_with_shadow(text, content_x, status_y + 35 + i * 25, color, SMALL_FONT)
+        ui_layer.widget("music_status", status_rect, tuple(status_lines), draw_status)
         
         # Back button
         back_button_width = int(panel_width * 0.167)
@@ -163,11 +198,14 @@ def settings_menu(sprites, battle_sprites, background):
         back_y = panel_y + panel_height - back_button_height - int(panel_height * 0.026)
         
         back_rect = pygame.Rect(back_x, back_y, back_button_width, back_button_height)
-        draw_gradient_button("BACK TO MENU", back_rect, DARK_BLUE, BLUE, 
-                           back_rect.collidepoint(pygame.mouse.get_pos()), FONT)
+        button("back", "BACK TO MENU", back_rect, DARK_BLUE, BLUE, FONT)
+        
+        # Clock with toggle support
+        ui_layer.widget("clock", *clock_widget(game_settings.get("show_clock", True)))
         
         # Event handling
         for event in pygame.event.get():
+            ui_layer.handle_event(event)
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -187,7 +225,7 @@ def settings_menu(sprites, battle_sprites, background):
                         pass
                     settings_running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                mx, my = pygame.mouse.get_pos()
+                mx, my = display_manager.get_mouse_pos()
                 
                 if back_rect.collidepoint((mx, my)):
                     # Save settings when exiting
@@ -200,10 +238,10 @@ def settings_menu(sprites, battle_sprites, background):
                     settings_running = False
                 
                 elif play_title_btn.collidepoint((mx, my)):
-                    if title_music_loaded:
+                    if get_music_status()["title_loaded"]:
                         play_title_music()
                 elif play_fight_btn.collidepoint((mx, my)):
-                    if fight_music_loaded:
+                    if get_music_status()["fight_loaded"]:
                         play_fight_music()
                 elif stop_music_btn.collidepoint((mx, my)):
                     stop_all_music()
@@ -216,6 +254,20 @@ def settings_menu(sprites, battle_sprites, background):
                     game_settings["show_clock"] = not game_settings.get("show_clock", True)
                     print(f"Clock display: {'ON' if game_settings['show_clock'] else 'OFF'}")
                 
+                # Render scale
+                elif render_scale_rect.collidepoint((mx, my)):
+                    option = game_settings.get("render_scale", "Auto")
+                    index = RENDER_SCALE_OPTIONS.index(option) if option in RENDER_SCALE_OPTIONS else 0
+                    game_settings["render_scale"] = RENDER_SCALE_OPTIONS[(index + 1) % len(RENDER_SCALE_OPTIONS)]
+                    print(f"Battle render scale: {get_option_label(game_settings['render_scale'])}")
+                
+                # Battle frame rate
+                elif battle_fps_rect.collidepoint((mx, my)):
+                    option = game_settings.get("battle_fps", 60)
+                    index = FRAME_RATE_OPTIONS.index(option) if option in FRAME_RATE_OPTIONS else 0
+                    game_settings["battle_fps"] = FRAME_RATE_OPTIONS[(index + 1) % len(FRAME_RATE_OPTIONS)]
+                    print(f"Battle frame rate: {get_frame_rate_label(game_settings['battle_fps'])}")
+                
                 # AI toggle
                 elif ai_toggle_rect.collidepoint((mx, my)):
                     game_settings["show_ai_predictions"] = not game_settings.get("show_ai_predictions", False)
@@ -232,7 +284,7 @@ def settings_menu(sprites, battle_sprites, background):
                         except:
                             pass
         
-        # Draw clock with toggle support
-        draw_real_time_clock(game_settings.get("show_clock", True))
-        pygame.display.flip()
-        CLOCK.tick(60)
\ No newline at end of file
+        ui_layer.present()
+        
+        # Only the test volume countdown animates; otherwise sleep until input or the next clock second
+        frame_pacer.tick(animating=not test_available, wake_after=ms_until_next_second())
\ No newline at end of file
@@ -8,6 +8,8 @@ import pygame
 import random
 import math
 from python.color import *
+from python.particle_pool import particle_pool, SWIRL
+from python.quality_governor import quality_governor
 
 class SpecialAttackAnimation:
     """Enhanced animation for special and ultimate attacks"""
@@ -21,7 +23,8 @@ class SpecialAttackAnimation:
         self.target_y = target_y
         self.timer = 0
         self.max_duration = 2000  # 2 seconds
-        self.particles = []
+        self.render_ahead_ms = 0.0  # set by the manager: draw this far past the last update
+        self.particles = particle_pool.view("special")
         self.is_ultimate = move_data.get("is_ultimate", False)
         self.is_special = move_data.get("is_special", False)
         self.done = False
@@ -59,55 +62,36 @@ class SpecialAttackAnimation:
             size = random.randint(8, 20) if self.is_ultimate else random.randint(4, 12)
             color = random.choice(colors)
             
-            self.particles.append({
-                'x': self.start_x,
-                'y': self.start_y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'size': size,
-                'color': color,
-                'life': 1.0,
-                'decay': random.uniform(0.003, 0.008)
-            })
+            decay = random.uniform(0.003, 0.008)  # life lost per 60 FPS frame
+            
+            # Particles home in on the target over the animation (ultimates also swirl)
+            self.particles.emit(
+                self.start_x, self.start_y,
+                math.cos(angle) * speed,
+                math.sin(angle) * speed,
+                color,
+                16.67 / decay,
+                size=size,
+                target=(self.target_x, self.target_y),
+                span=self.max_duration,
+                extra_flags=SWIRL if self.is_ultimate else 0
+            )
     
     def update(self, dt):
-        """Update animation state"""
+        """Update animation state (particles are stepped by particle_pool.update)"""
         self.timer += dt
         
         if self.timer >= self.max_duration:
             self.done = True
             return False
         
-        # Update particles
-        for particle in self.particles:
-            # Move toward target
-            progress = self.timer / self.max_duration
-            dx = self.target_x - particle['x']
-            dy = self.target_y - particle['y']
-            
-            # Accelerate toward target over time
-            particle['vx'] += dx * 0.0001 * progress
-            particle['vy'] += dy * 0.0001 * progress
-            
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= particle['decay']
-            
-            # Ultimate attacks have swirling motion
-            if self.is_ultimate:
-                swirl_angle = self.timer * 0.01
-                swirl_radius = 30 * (1 - progress)
-                particle['x'] += math.cos(swirl_angle + particle['vx']) * swirl_radius * 0.1
-                particle['y'] += math.sin(swirl_angle + particle['vy']) * swirl_radius * 0.1
-        
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p['life'] > 0]
-        
         return True
     
     def draw(self, screen):
         """Draw the animation"""
-        progress = self.timer / self.max_duration
+        progress = min(1.0, (self.timer + self.render_ahead_ms) / self.max_duration)
+        # Lower quality levels drop the outer beam layers and lightning glow passes
+        glow_layers = quality_governor.get("glow_layers")
         
         # Draw connecting beam for ultimate attacks
         if self.is_ultimate and progress > 0.3:
@@ -121,7 +105,7 @@ class SpecialAttackAnimation:
                 (255, 215, 0, beam_alpha // 3)
             ]
             
-            for i, color in enumerate(beam_colors):
+            for i, color in enumerate(beam_colors[:max(1, glow_layers)]):
                 beam_surface = pygame.Surface((abs(self.target_x - self.start_x) + beam_width * 2,
                                               abs(self.target_y - self.start_y) + beam_width * 2),
                                              pygame.SRCALPHA)
@@ -153,36 +137,13 @@ class SpecialAttackAnimation:
             
             # Draw lightning with glow
             if len(lightning_points) > 1:
-                for thickness in range(8, 0, -2):
+                for thickness in range(2 * (glow_layers + 1), 0, -2):
                     alpha = int(150 - thickness * 15)
                     color = (150, 200, 255, alpha)
                     pygame.draw.lines(screen, color, False, lightning_points, thickness)
         
-        # Draw particles
-        for particle in self.particles:
-            if particle['life'] > 0:
-                alpha = int(255 * particle['life'])
-                size = int(particle['size'] * particle['life'])
-                
-                if size > 0:
-                    # Draw particle with glow
-                    particle_surface = pygame.Surface((size * 3, size * 3), pygame.SRCALPHA)
-                    
-                    # Outer glow
-                    pygame.draw.circle(particle_surface, 
-                                     (*particle['color'], alpha // 3),
-                                     (size * 3 // 2, size * 3 // 2), 
-                                     size * 2)
-                    
-                    # Inner bright core
-                    pygame.draw.circle(particle_surface,
-                                     (*particle['color'], alpha),
-                                     (size * 3 // 2, size * 3 // 2),
-                                     size)
-                    
-                    screen.blit(particle_surface, 
-                              (int(particle['x'] - size * 1.5), 
-                               int(particle['y'] - size * 1.5)))
+        # Draw particles (outer glow + bright core, pre-rendered in the atlas)
+        self.particles.draw(screen)
         
         # Impact explosion at target
         if progress > 0.7:
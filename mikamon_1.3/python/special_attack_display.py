@@ -75,8 +75,11 @@ def draw_enhanced_move_button(text, rect, move_data, can_use, hover, font, scree
     - screen: Pygame surface to draw on
     - battle_timer: Animation timer for effects
     """
-    import math
-    
+    draw_move_button_face(text, rect, move_data, can_use, hover, font, screen)
+    draw_move_button_glow(rect, move_data, can_use, screen, battle_timer)
+
+def get_button_colors(move_data, can_use):
+    """Returns: (color1, color2, border_color, text_color, glow_color) for a usable or grayed out move"""
     if not can_use:
         # Grayed out button
         color1 = (80, 80, 80)
@@ -84,8 +87,15 @@ def draw_enhanced_move_button(text, rect, move_data, can_use, hover, font, scree
         border_color = (40, 40, 40)
         text_color = (120, 120, 120)
         glow_color = None
-    else:
-        color1, color2, border_color, text_color, glow_color = get_move_display_colors(move_data)
+        return color1, color2, border_color, text_color, glow_color
+    return get_move_display_colors(move_data)
+
+def draw_move_button_face(text, rect, move_data, can_use, hover, font, screen):
+    """
+    Draw everything inside the button rect (gradient, border, badge and text)
+    Nothing here is animated, so the battle screen caches it as a layer.
+    """
+    color1, color2, border_color, text_color, glow_color = get_button_colors(move_data, can_use)
     
     # Gradient background
     button_surface = pygame.Surface((rect.width, rect.height))
@@ -100,21 +110,6 @@ def draw_enhanced_move_button(text, rect, move_data, can_use, hover, font, scree
     
     screen.blit(button_surface, rect.topleft)
     
-    # Animated glow for special/ultimate moves
-    if glow_color and can_use:
-        pulse = math.sin(battle_timer * 0.005) * 0.5 + 0.5  # 0 to 1
-        glow_alpha = int(100 + pulse * 80)
-        
-        # Draw glow layers
-        for thickness in range(8, 0, -2):
-            alpha = int((glow_alpha * thickness) / 8)
-            glow_surface = pygame.Surface((rect.width + thickness*2, rect.height + thickness*2), pygame.SRCALPHA)
-            glow_color_alpha = (*glow_color, alpha)
-            pygame.draw.rect(glow_surface, glow_color_alpha, 
-                           (0, 0, rect.width + thickness*2, rect.height + thickness*2), 
-                           thickness)
-            screen.blit(glow_surface, (rect.x - thickness, rect.y - thickness))
-    
     # Border
     border_width = 3 if (move_data.get("is_ultimate") or move_data.get("is_special")) else 2
     pygame.draw.rect(screen, border_color, rect, border_width)
@@ -148,4 +143,23 @@ def draw_enhanced_move_button(text, rect, move_data, can_use, hover, font, scree
     
     text_surface = font.render(text, True, text_color)
     text_rect = text_surface.get_rect(center=rect.center)
-    screen.blit(text_surface, text_rect)
\ No newline at end of file
+    screen.blit(text_surface, text_rect)
+
+def draw_move_button_glow(rect, move_data, can_use, screen, battle_timer=0):
+    """Animated glow for special/ultimate moves (drawn around the outside of rect)"""
+    import math
+    
+    glow_color = get_button_colors(move_data, can_use)[4]
+    if glow_color and can_use:
+        pulse = math.sin(battle_timer * 0.005) * 0.5 + 0.5  # 0 to 1
+        glow_alpha = int(100 + pulse * 80)
+        
+        # Draw glow layers
+        for thickness in range(8, 0, -2):
+            alpha = int((glow_alpha * thickness) / 8)
+            glow_surface = pygame.Surface((rect.width + thickness*2, rect.height + thickness*2), pygame.SRCALPHA)
+            glow_color_alpha = (*glow_color, alpha)
+            pygame.draw.rect(glow_surface, glow_color_alpha, 
+                           (0, 0, rect.width + thickness*2, rect.height + thickness*2), 
+                           thickness)
+            screen.blit(glow_surface, (rect.x - thickness, rect.y - thickness))
\ No newline at end of file
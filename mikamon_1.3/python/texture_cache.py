@@ -0,0 +1,220 @@
+"""
+Persistent Texture Cache
+Procedural textures (background, fallback sprites, time icons, sky overlays, fog noise)
+come out the same on every run, so they are generated once, saved as raw .npy arrays and
+memory-mapped on later runs. Entries are keyed by generator name, parameters and version.
+
+Command line (run from the mikamon_1.3 folder; python -m python.prebake does the same
+generation across every core):
+    python -m python.texture_cache prewarm   # generate every registered texture (one process)
+    python -m python.texture_cache clear     # delete the cache folder contents
+    python -m python.texture_cache list      # show cached entries
+"""
+
+import os
+import sys
+import json
+import hashlib
+import importlib
+import threading
+import numpy as np
+import pygame
+from python.startup_profiler import startup_profiler
+
+# Bump to invalidate every cached texture at once
+CACHE_VERSION = 1
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "texture_cache")
+
+# Modules that register generators (imported by the CLI before prewarming)
+GENERATOR_MODULES = ["python.asset_manager", "python.day_night_cycle", "python.weather"]
+
+# name -> {"function", "version", "prewarm"}
+generators = {}
+
+MANIFEST_FILE = "manifest.json"
+
+
+def register_generator(name, version=1, prewarm=None):
+    """
+    Register a texture generator
+    The function takes hashable parameters and returns an ndarray: (h, w, 3) or (h, w, 4)
+    uint8 for images, anything else for raw data. Bump version whenever its output changes.
+    prewarm is a list (or a function returning a list) of parameter tuples to pre-generate.
+    """
+    def decorator(function):
+        generators[name] = {"function": function, "version": version, "prewarm": prewarm}
+        return function
+    return decorator
+
+
+def load_generator_modules():
+    """Import every module that registers texture generators"""
+    for module in GENERATOR_MODULES:
+        importlib.import_module(module)
+
+
+def as_params(value):
+    """Turn JSON lists back into the tuples generators were called with"""
+    if isinstance(value, list):
+        return tuple(as_params(item) for item in value)
+    return value
+
+
+def surface_to_array(surface):
+    """Copy a Surface into an (h, w, 3) or (h, w, 4) uint8 array"""
+    mode = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB"
+    width, height = surface.get_size()
+    data = pygame.image.tostring(surface, mode)
+    return np.frombuffer(data, dtype=np.uint8).reshape(height, width, len(mode))
+
+
+class TextureCache:
+    """On-disk cache of generated textures with an in-memory layer on top"""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.memory_cache = {}
+        self.manifest = None  # [name, params] of every texture generated on demand
+        self.manifest_lock = threading.Lock()  # loading jobs generate textures on several threads
+        self.hits = 0
+        self.misses = 0
+
+    def get_path(self, name, params):
+        """Cache file for a generator call"""
+        version = generators[name]["version"]
+        digest = hashlib.sha1(repr((CACHE_VERSION, version, params)).encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{name}-{digest}.npy")
+
+    def get_array(self, name, *params):
+        """Get a generator's output, memory-mapped from disk when cached"""
+        key = (name, params)
+        array = self.memory_cache.get(key)
+        if array is not None:
+            return array
+
+        path = self.get_path(name, params)
+        try:
+            with startup_profiler.phase(f"load {name}", "texture"):
+                array = np.load(path, mmap_mode="r")
+            self.hits += 1
+        except (OSError, ValueError):
+            with startup_profiler.phase(f"generate {name}", "texture"):
+                array = self.generate(name, params)
+            self.misses += 1
+            self.save(path, array)
+            self.record(name, params)
+
+        self.memory_cache[key] = array
+        return array
+
+    def generate(self, name, params):
+        """Run a generator without touching the cache"""
+        return np.ascontiguousarray(generators[name]["function"](*params))
+
+    def get_surface(self, name, *params):
+        """Get a generated image as a Surface (RGBA arrays get per-pixel alpha)"""
+        array = self.get_array(name, *params)
+        height, width, channels = array.shape
+        return pygame.image.fromstring(array.tobytes(), (width, height), "RGBA" if channels == 4 else "RGB")
+
+    def save(self, path, array):
+        """Write atomically so an interrupted run never leaves a truncated entry"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                np.save(f, array)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Texture cache write failed ({e}); continuing without it")
+
+    def load_manifest(self):
+        """Entries generated on demand in earlier runs (kept across cache versions)"""
+        if self.manifest is None:
+            try:
+                with open(os.path.join(self.cache_dir, MANIFEST_FILE)) as f:
+                    self.manifest = [[name, as_params(params)] for name, params in json.load(f)]
+            except (OSError, ValueError):
+                self.manifest = []
+        return self.manifest
+
+    def record(self, name, params):
+        """Remember an on-demand entry so the pre-bake regenerates it after an update"""
+        with self.manifest_lock:
+            manifest = self.load_manifest()
+            if [name, params] in manifest:
+                return
+            manifest.append([name, params])
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(os.path.join(self.cache_dir, MANIFEST_FILE), "w") as f:
+                    json.dump(manifest, f)
+            except OSError as e:
+                print(f"Texture cache manifest write failed ({e})")
+
+    def get_jobs(self, names=None):
+        """Every (name, params) worth pre-generating: registered prewarm lists plus the manifest"""
+        jobs = []
+        for name in names or list(generators):
+            prewarm = generators[name]["prewarm"] or []
+            if callable(prewarm):
+                prewarm = prewarm()
+            jobs.extend((name, tuple(params)) for params in prewarm)
+        for name, params in self.load_manifest():
+            if name in generators and (names is None or name in names):
+                jobs.append((name, params))
+        return list(dict.fromkeys(jobs))
+
+    def prewarm(self, names=None):
+        """Generate (or load) every pre-generation job in this process; returns the number of jobs"""
+        jobs = self.get_jobs(names)
+        for name, params in jobs:
+            self.get_array(name, *params)
+        return len(jobs)
+
+    def clear(self):
+        """Delete every cached texture file (the manifest is kept for the next pre-bake)"""
+        self.memory_cache.clear()
+        removed = 0
+        if os.path.isdir(self.cache_dir):
+            for filename in os.listdir(self.cache_dir):
+                if filename.endswith((".npy", ".tmp")):
+                    os.remove(os.path.join(self.cache_dir, filename))
+                    removed += 1
+        return removed
+
+    def list_entries(self):
+        """(filename, size in bytes) for every cached texture"""
+        if not os.path.isdir(self.cache_dir):
+            return []
+        return sorted((filename, os.path.getsize(os.path.join(self.cache_dir, filename)))
+                      for filename in os.listdir(self.cache_dir) if filename.endswith(".npy"))
+
+
+# Global texture cache instance
+texture_cache = TextureCache()
+
+
+def main(argv):
+    command = argv[1] if len(argv) > 1 else "prewarm"
+    if command == "clear":
+        print(f"Removed {texture_cache.clear()} cached textures from {texture_cache.cache_dir}")
+    elif command == "list":
+        entries = texture_cache.list_entries()
+        for filename, size in entries:
+            print(f"{size / 1024:10.1f} KB  {filename}")
+        print(f"{len(entries)} entries in {texture_cache.cache_dir}")
+    elif command == "prewarm":
+        load_generator_modules()
+        count = texture_cache.prewarm()
+        print(f"Prewarmed {count} textures ({texture_cache.misses} generated, {texture_cache.hits} already cached)")
+    else:
+        print("Usage: python -m python.texture_cache [prewarm|clear|list]")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    # Re-import so generators register with python.texture_cache rather than __main__
+    from python.texture_cache import main as cache_main
+    sys.exit(cache_main(sys.argv))
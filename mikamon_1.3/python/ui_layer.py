@@ -0,0 +1,130 @@
+"""
+Retained UI Layer (dirty rectangles)
+Menu screens register their widgets every frame as (name, rect, state, draw function).
+The static layer (background, dim overlay, panels) is drawn once and kept as a snapshot;
+after that only widgets whose state or rect changed are repainted (the snapshot is
+restored under them first) and only those regions are sent to the window. A frame in
+which nothing changed costs no drawing and no present at all.
+
+Animated elements change their state when they need a repaint (e.g. the clock's time
+string) or call invalidate(rect) for a region of their own.
+"""
+
+import pygame
+from python.fullscreen_toggle import display_manager
+
+# Widget rects grow by this much so shadows and glow edges are repainted too
+WIDGET_PADDING = 6
+
+# Events after which the window contents can't be trusted any more
+REDRAW_EVENTS = {pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED,
+                 pygame.WINDOWSIZECHANGED}
+
+
+class UILayer:
+    """Static layer snapshot plus the widgets drawn over it"""
+    def __init__(self):
+        self.screen_name = None
+        self.background = None
+        self.full_redraw = True
+        self.widgets = {}        # name -> (rect, state) as presented last frame
+        self.frame = {}          # name -> (rect, state, draw) registered this frame
+        self.invalid_rects = []
+        self.presents = 0        # frames actually sent to the window (full or partial)
+        self.skipped = 0         # frames with nothing to redraw
+
+    def invalidate(self, rect=None):
+        """Repaint a region on the next present (rect=None repaints the whole screen)"""
+        if rect is None:
+            self.full_redraw = True
+        else:
+            self.invalid_rects.append(pygame.Rect(rect))
+
+    def handle_event(self, event):
+        """Repaint everything after the window was uncovered or restored"""
+        if event.type in REDRAW_EVENTS:
+            self.invalidate()
+
+    def begin(self, screen_name, draw_static):
+        """
+        Start a frame of the named screen
+        draw_static() paints the static layer onto the canvas; it only runs when the whole
+        screen has to be redrawn (first frame, screen change, display mode change).
+        """
+        if screen_name != self.screen_name:
+            self.screen_name = screen_name
+            self.full_redraw = True
+        if self.full_redraw:
+            draw_static()
+            self.background = display_manager.get_screen().copy()
+        self.frame = {}
+
+    def widget(self, name, rect, state, draw):
+        """Register a widget for this frame; draw() is only called when it needs repainting"""
+        self.frame[name] = (pygame.Rect(rect).inflate(WIDGET_PADDING, WIDGET_PADDING), state, draw)
+
+    def get_dirty_rects(self):
+        """Regions that changed since the last present (overlapping ones merged)"""
+        dirty = list(self.invalid_rects)
+        for name, (rect, state) in self.widgets.items():
+            current = self.frame.get(name)
+            if current is None:
+                dirty.append(rect)  # widget went away: restore what was under it
+            elif current[0] != rect or current[1] != state:
+                dirty.append(rect)
+                dirty.append(current[0])
+        for name, (rect, state, draw) in self.frame.items():
+            if name not in self.widgets:
+                dirty.append(rect)
+
+        merged = []
+        for rect in dirty:
+            rect = rect.copy()
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def present(self):
+        """Draw what changed and send only those regions to the window"""
+        screen = display_manager.get_screen()
+        if self.full_redraw:
+            for rect, state, draw in self.frame.values():
+                draw()
+            display_manager.present()
+            self.full_redraw = False
+            self.presents += 1
+        else:
+            dirty = self.get_dirty_rects()
+            if dirty:
+                for region in dirty:
+                    # Clip so translucent widgets outside the region aren't blended twice
+                    screen.set_clip(region)
+                    screen.blit(self.background, region, region)
+                    for rect, state, draw in self.frame.values():
+                        if rect.colliderect(region):
+                            draw()
+                screen.set_clip(None)
+                display_manager.present(dirty)
+                self.presents += 1
+            else:
+                self.skipped += 1
+
+        self.widgets = {name: (rect, state) for name, (rect, state, draw) in self.frame.items()}
+        self.invalid_rects = []
+
+    def leave(self):
+        """Forget the current screen (the next begin() redraws everything)"""
+        self.screen_name = None
+        self.full_redraw = True
+        self.background = None
+        self.widgets = {}
+
+
+# Global UI layer instance
+ui_layer = UILayer()
+
+# A new window surface has none of the old contents
+display_manager.add_mode_change_callback(lambda size: ui_layer.invalidate())
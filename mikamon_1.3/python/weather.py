@@ -1,11 +1,12 @@
 import random
 import pygame
 import math
+import queue
+import threading
 import numpy as np
-from numba import jit, prange
 import pymunk
 import pymunk.pygame_util
-from PIL import Image, ImageFilter, ImageEnhance, ImageDraw
+from PIL import Image, ImageFilter, ImageDraw
 import pytweening
 try:
     import cv2
@@ -13,16 +14,69 @@ try:
 except ImportError:
     CV2_AVAILABLE = False
     
-from python.color import GRAY, BLUE, PURPLE, LIGHT_GRAY, YELLOW, CYAN, ORANGE, WHITE, GREEN
+from python.weather_rules import Weather  # re-exported for older imports
+from python.glow_atlas import glow_atlas
+from python.fullscreen_toggle import display_manager
+from python.emitters import get_emitter, burst
+from python.surface_pool import surface_pool
+from python.texture_cache import texture_cache, register_generator
+from python.kernels import kernel, prange, compile_kernels, NUMBA_AVAILABLE
+from python.quality_governor import quality_governor
+
+# Particles wrap around this far beyond the left/right screen edges
+WRAP_MARGIN = 100
+
+# Continuous emitter for each weather type (definitions live in python/emitters.py)
+WEATHER_EMITTERS = {
+    "Clear": "clear_motes",
+    "Sunny": "sunny_sparkles",
+    "Rainy": "rain",
+    "Windy": "wind_leaves",
+    "Stormy": "storm_rain",
+    "Misty": "misty_wisps"
+}
 
 # ============= NUMBA-ACCELERATED PARTICLE PHYSICS =============
-@jit(nopython=True, parallel=True)
-def update_particles_batch(positions, velocities, lifetimes, dt, wind_x, wind_y, gravity):
+# Kernel argument types (see python/kernels.py): particle arrays are full C-contiguous
+# float32/uint8 arrays, counts are Python ints and physics values are floats
+PARTICLE_ARRAYS = "float32[:, ::1], float32[:, ::1], float32[::1]"
+
+def update_particles_numpy(positions, velocities, lifetimes, count, dt, wind_x, wind_y, gravity,
+                           wrap_min_x, wrap_max_x):
+    """NumPy version of update_particles_batch for when Numba is missing"""
+    dt_factor = dt / 16.67
+    alive = lifetimes[:count] > 0
+    positions = positions[:count]
+    velocities = velocities[:count]
+    
+    velocities[alive, 1] += gravity * dt_factor
+    positions[alive, 0] += (velocities[alive, 0] + wind_x) * dt_factor
+    positions[alive, 1] += (velocities[alive, 1] + wind_y) * dt_factor
+    lifetimes[:count][alive] -= dt
+    
+    xs = positions[:, 0]
+    too_far_left = alive & (xs < wrap_min_x)
+    too_far_right = alive & (xs > wrap_max_x)
+    xs[too_far_left] = wrap_max_x
+    xs[too_far_right] = wrap_min_x
+    return int(np.count_nonzero(lifetimes[:count] > 0))
+
+def compact_particles_numpy(positions, velocities, lifetimes, colors, sizes, max_lifetimes, count):
+    """NumPy version of compact_particles for when Numba is missing (keeps live particles in order)"""
+    live = np.flatnonzero(lifetimes[:count] > 0)
+    for array in (positions, velocities, lifetimes, colors, sizes, max_lifetimes):
+        array[:len(live)] = array[live]
+    return len(live)
+
+@kernel([f"({PARTICLE_ARRAYS}, int64, float64, float64, float64, float64, float64, float64)"],
+        parallel=True, fallback=update_particles_numpy)
+def update_particles_batch(positions, velocities, lifetimes, count, dt, wind_x, wind_y, gravity,
+                           wrap_min_x, wrap_max_x):
     """Ultra-fast batch particle update with Numba JIT compilation"""
     dt_factor = dt / 16.67
     alive_count = 0
     
-    for i in prange(len(positions)):
+    for i in prange(count):
         if lifetimes[i] > 0:
             # Apply physics
             velocities[i, 1] += gravity * dt_factor
@@ -31,17 +85,46 @@ def update_particles_batch(positions, velocities, lifetimes, dt, wind_x, wind_y,
             lifetimes[i] -= dt
             
             # Wrap around screen edges
-            if positions[i, 0] < -100:
-                positions[i, 0] = 2020
-            elif positions[i, 0] > 2020:
-                positions[i, 0] = -100
+            if positions[i, 0] < wrap_min_x:
+                positions[i, 0] = wrap_max_x
+            elif positions[i, 0] > wrap_max_x:
+                positions[i, 0] = wrap_min_x
             
             if lifetimes[i] > 0:
                 alive_count += 1
     
     return alive_count
 
-@jit(nopython=True)
+@kernel([f"({PARTICLE_ARRAYS}, uint8[:, ::1], float32[::1], float32[::1], int64)"],
+        fallback=compact_particles_numpy)
+def compact_particles(positions, velocities, lifetimes, colors, sizes, max_lifetimes, count):
+    """
+    Swap-remove dead particles in place: each dead slot is filled with the last live
+    particle, so the live ones stay packed at the front without any temporary arrays
+    Returns the new active count
+    """
+    i = 0
+    while i < count:
+        if lifetimes[i] > 0:
+            i += 1
+            continue
+        
+        count -= 1
+        if i != count:
+            positions[i, 0] = positions[count, 0]
+            positions[i, 1] = positions[count, 1]
+            velocities[i, 0] = velocities[count, 0]
+            velocities[i, 1] = velocities[count, 1]
+            lifetimes[i] = lifetimes[count]
+            colors[i, 0] = colors[count, 0]
+            colors[i, 1] = colors[count, 1]
+            colors[i, 2] = colors[count, 2]
+            sizes[i] = sizes[count]
+            max_lifetimes[i] = max_lifetimes[count]
+    
+    return count
+
+@kernel(["(int64, int64, int64, int64)"])
 def calculate_lightning_segment(start_x, start_y, target_y, num_segments):
     """Generate lightning path with Numba optimization"""
     segments = np.zeros((num_segments, 4), dtype=np.float32)
@@ -64,6 +147,65 @@ def calculate_lightning_segment(start_x, start_y, target_y, num_segments):
     
     return segments
 
+# Rows per parallel band in the splat kernel (each band owns its rows, so no write races)
+SPLAT_BAND_HEIGHT = 32
+
+# pixels3d/pixels_alpha views are strided (any layout); opaque targets pass a C-contiguous dummy alpha
+SPLAT_ARGS = ("(uint8[:, :, :], {alpha}, boolean, float32[:, ::1], uint8[:, ::1], float32[::1], "
+              "float32[::1], float32[::1], int64, boolean)")
+
+@kernel([SPLAT_ARGS.format(alpha="uint8[:, :]"), SPLAT_ARGS.format(alpha="uint8[:, ::1]")], parallel=True)
+def splat_particles(pixels, alpha_pixels, has_alpha, positions, colors, sizes,
+                    lifetimes, max_lifetimes, count, shrink):
+    """Alpha-blend every particle as a disc straight into a pixels3d view"""
+    width = pixels.shape[0]
+    height = pixels.shape[1]
+    num_bands = (height + SPLAT_BAND_HEIGHT - 1) // SPLAT_BAND_HEIGHT
+    
+    for band in prange(num_bands):
+        band_top = band * SPLAT_BAND_HEIGHT
+        band_bottom = min(height, band_top + SPLAT_BAND_HEIGHT)
+        
+        for i in range(count):
+            if lifetimes[i] <= 0 or max_lifetimes[i] <= 0:
+                continue
+            
+            # Lifetime falloff for opacity (and radius when shrinking)
+            life_ratio = min(1.0, lifetimes[i] / max_lifetimes[i])
+            alpha = life_ratio
+            radius = max(1, int(sizes[i] * life_ratio)) if shrink else max(1, int(sizes[i]))
+            cx = int(positions[i, 0])
+            cy = int(positions[i, 1])
+            
+            y0 = max(band_top, cy - radius)
+            y1 = min(band_bottom, cy + radius)
+            if y0 >= y1:
+                continue
+            x0 = max(0, cx - radius)
+            x1 = min(width, cx + radius)
+            if x0 >= x1:
+                continue
+            
+            r = float(colors[i, 0])
+            g = float(colors[i, 1])
+            b = float(colors[i, 2])
+            radius_sq = radius * radius
+            
+            for y in range(y0, y1):
+                dy = y - cy
+                for x in range(x0, x1):
+                    dx = x - cx
+                    if dx * dx + dy * dy < radius_sq:
+                        dst_r = float(pixels[x, y, 0])
+                        dst_g = float(pixels[x, y, 1])
+                        dst_b = float(pixels[x, y, 2])
+                        pixels[x, y, 0] = np.uint8(dst_r + (r - dst_r) * alpha)
+                        pixels[x, y, 1] = np.uint8(dst_g + (g - dst_g) * alpha)
+                        pixels[x, y, 2] = np.uint8(dst_b + (b - dst_b) * alpha)
+                        if has_alpha:
+                            dst_a = float(alpha_pixels[x, y])
+                            alpha_pixels[x, y] = np.uint8(dst_a + (255.0 - dst_a) * alpha)
+
 
 # ============= ADVANCED PARTICLE SYSTEM =============
 class PhysicsParticle:
@@ -87,31 +229,29 @@ class PhysicsParticle:
         self.life -= dt
         return self.life > 0
     
+    def get_blit(self, scale=1.0, ahead_ms=0):
+        """Atlas sprite (glow rings baked in) and position for batched drawing (ahead_ms along the velocity)"""
+        alpha = int(255 * (max(0, self.life - ahead_ms) / self.max_life))
+        kind = "glow" if self.glow else "circle"
+        x = self.body.position.x + self.body.velocity.x * ahead_ms / 1000.0
+        y = self.body.position.y + self.body.velocity.y * ahead_ms / 1000.0
+        return glow_atlas.get_blit(self.color, x * scale, y * scale,
+                                   self.radius * scale, alpha, kind, quality_governor.get("glow_layers"))
+    
     def draw(self, screen):
-        alpha = int(255 * (self.life / self.max_life))
-        pos = (int(self.body.position.x), int(self.body.position.y))
-        
-        if self.glow:
-            # Draw glow effect
-            for i in range(3):
-                glow_radius = self.radius + (3 - i) * 8
-                glow_alpha = alpha // (i + 2)
-                glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (*self.color, glow_alpha), 
-                                 (glow_radius, glow_radius), glow_radius)
-                screen.blit(glow_surf, (pos[0] - glow_radius, pos[1] - glow_radius))
-        
-        # Draw particle core
-        particle_surf = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(particle_surf, (*self.color, alpha), 
-                         (self.radius, self.radius), self.radius)
-        screen.blit(particle_surf, (pos[0] - self.radius, pos[1] - self.radius))
+        screen.blit(*self.get_blit())
 
 
 class BatchParticleSystem:
     """High-performance batch particle system using NumPy and Numba"""
-    def __init__(self, max_particles=10000):
+    VELOCITY_MS = 16.67  # velocities are in pixels per 60 FPS frame
+    
+    def __init__(self, max_particles=10000, use_splat=True):
         self.max_particles = max_particles
+        self.particle_cap = max_particles  # soft limit below the array size (lowered by the quality governor)
+        # Splatting is only fast compiled; the pure Python kernel would crawl
+        self.use_splat = use_splat and NUMBA_AVAILABLE
+        self.shrink_with_life = True
         self.positions = np.zeros((max_particles, 2), dtype=np.float32)
         self.velocities = np.zeros((max_particles, 2), dtype=np.float32)
         self.lifetimes = np.zeros(max_particles, dtype=np.float32)
@@ -119,10 +259,13 @@ class BatchParticleSystem:
         self.sizes = np.zeros(max_particles, dtype=np.float32)
         self.max_lifetimes = np.zeros(max_particles, dtype=np.float32)
         self.active_count = 0
+        self.wind = np.zeros(2, dtype=np.float32)
+        # Drawing runs this far (ms) past the last update (set by the fixed-timestep battle loop)
+        self.render_ahead_ms = 0.0
     
     def add_particle(self, x, y, vx, vy, color, size, lifetime):
         """Add a particle to the batch system"""
-        if self.active_count < self.max_particles:
+        if self.active_count < self.particle_cap:
             idx = self.active_count
             self.positions[idx] = [x, y]
             self.velocities[idx] = [vx, vy]
@@ -132,38 +275,161 @@ class BatchParticleSystem:
             self.max_lifetimes[idx] = lifetime
             self.active_count += 1
     
+    def add_particles_batch(self, xs, ys, vxs, vys, colors, sizes, lifetimes):
+        """Add many particles at once; every argument may be an array or a scalar"""
+        count = int(np.broadcast(xs, ys, vxs, vys, sizes, lifetimes).size)
+        count = min(count, self.particle_cap - self.active_count)
+        if count <= 0:
+            return 0
+        
+        def take(value):
+            value = np.asarray(value, dtype=np.float32)
+            return value if value.ndim == 0 else value[:count]
+        
+        start, end = self.active_count, self.active_count + count
+        self.positions[start:end, 0] = take(xs)
+        self.positions[start:end, 1] = take(ys)
+        self.velocities[start:end, 0] = take(vxs)
+        self.velocities[start:end, 1] = take(vys)
+        colors = np.asarray(colors, dtype=np.uint8)
+        self.colors[start:end] = colors[:count] if colors.ndim == 2 else colors[:3]
+        self.sizes[start:end] = take(sizes)
+        self.lifetimes[start:end] = take(lifetimes)
+        self.max_lifetimes[start:end] = take(lifetimes)
+        self.active_count = end
+        return count
+    
+    def compact(self):
+        """Drop dead particles (lifetime <= 0) in place, keeping the live ones packed at the front"""
+        self.active_count = compact_particles(
+            self.positions, self.velocities, self.lifetimes,
+            self.colors, self.sizes, self.max_lifetimes,
+            self.active_count
+        )
+    
     def update(self, dt, wind_x=0, wind_y=0, gravity=0.5):
         """Update all particles using Numba-accelerated batch processing"""
+        self.wind[:] = (wind_x, wind_y)
+        self.render_ahead_ms = 0.0
         if self.active_count > 0:
+            # Floats throughout so the kernel is compiled for one signature only
+            screen_width = display_manager.get_size()[0]
             alive = update_particles_batch(
-                self.positions[:self.active_count],
-                self.velocities[:self.active_count],
-                self.lifetimes[:self.active_count],
-                dt, wind_x, wind_y, gravity
+                self.positions, self.velocities, self.lifetimes, self.active_count,
+                float(dt), float(wind_x), float(wind_y), float(gravity),
+                float(-WRAP_MARGIN), float(screen_width + WRAP_MARGIN)
             )
             
             # Compact dead particles
             if alive < self.active_count:
-                alive_mask = self.lifetimes[:self.active_count] > 0
-                self.positions[:alive] = self.positions[:self.active_count][alive_mask]
-                self.velocities[:alive] = self.velocities[:self.active_count][alive_mask]
-                self.lifetimes[:alive] = self.lifetimes[:self.active_count][alive_mask]
-                self.colors[:alive] = self.colors[:self.active_count][alive_mask]
-                self.sizes[:alive] = self.sizes[:self.active_count][alive_mask]
-                self.max_lifetimes[:alive] = self.max_lifetimes[:self.active_count][alive_mask]
-                self.active_count = alive
+                self.compact()
     
-    def draw(self, screen):
-        """Draw all particles efficiently"""
-        for i in range(self.active_count):
-            alpha = int(255 * (self.lifetimes[i] / self.max_lifetimes[i]))
-            size = max(1, int(self.sizes[i] * (self.lifetimes[i] / self.max_lifetimes[i])))
-            pos = (int(self.positions[i, 0]), int(self.positions[i, 1]))
-            
-            particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            color = (*self.colors[i], alpha)
-            pygame.draw.circle(particle_surf, color, (size, size), size)
-            screen.blit(particle_surf, (pos[0] - size, pos[1] - size))
+    def get_render_positions(self):
+        """Positions to draw the active particles at (moved render_ahead_ms along their velocity)"""
+        count = self.active_count
+        positions = self.positions[:count]
+        if self.render_ahead_ms:
+            ahead = np.float32(self.render_ahead_ms / self.VELOCITY_MS)
+            positions = positions + (self.velocities[:count] + self.wind) * ahead
+        return positions
+    
+    def get_blits(self, scale=1.0):
+        """Atlas sprites and positions for every active particle (scale: target size / logical size)"""
+        count = self.active_count
+        if count == 0:
+            return []
+        positions = self.get_render_positions()
+        
+        # Alpha and size for the whole batch in one NumPy pass
+        life_ratio = self.lifetimes[:count] / self.max_lifetimes[:count]
+        alphas = (255 * life_ratio).astype(np.int32).tolist()
+        sizes = self.sizes[:count] * life_ratio if self.shrink_with_life else self.sizes[:count]
+        sizes = np.maximum(1, (sizes * scale).astype(np.int32)).tolist()
+        xs = (positions[:, 0] * scale).astype(np.int32).tolist()
+        ys = (positions[:, 1] * scale).astype(np.int32).tolist()
+        colors = self.colors[:count].tolist()
+        
+        get_blit = glow_atlas.get_blit
+        return [get_blit(colors[i], xs[i], ys[i], sizes[i], alphas[i]) for i in range(count)]
+    
+    def draw_blits(self, screen, scale=1.0):
+        """Draw all particles with a single blits call (fallback path)"""
+        screen.blits(self.get_blits(scale), doreturn=False)
+    
+    def draw_splat(self, screen, scale=1.0):
+        """Splat all particles straight into the screen pixels with the Numba kernel"""
+        if self.active_count == 0:
+            return
+        
+        positions, sizes = self.get_render_positions(), self.sizes
+        if scale != 1.0:
+            # Reduced render resolution: same particles, fewer pixels each
+            positions = positions * np.float32(scale)
+            sizes = self.sizes[:self.active_count] * np.float32(scale)
+        
+        pixels = pygame.surfarray.pixels3d(screen)
+        has_alpha = bool(screen.get_flags() & pygame.SRCALPHA)
+        alpha_pixels = pygame.surfarray.pixels_alpha(screen) if has_alpha else np.zeros((1, 1), dtype=np.uint8)
+        try:
+            splat_particles(pixels, alpha_pixels, has_alpha,
+                            positions, self.colors, sizes,
+                            self.lifetimes, self.max_lifetimes, self.active_count,
+                            self.shrink_with_life)
+        finally:
+            # Release the pixel views so the surface unlocks
+            del pixels, alpha_pixels
+    
+    def draw(self, screen, scale=1.0):
+        """Draw all particles, splatting when possible and falling back to sprite blits"""
+        if self.use_splat:
+            try:
+                self.draw_splat(screen, scale)
+                return
+            except (ValueError, TypeError, pygame.error) as e:
+                # e.g. 8/16-bit surfaces have no pixels3d view
+                print(f"Particle splat rendering unavailable ({e}), using sprite blits")
+                self.use_splat = False
+        self.draw_blits(screen, scale)
+
+
+class KinematicParticleSystem(BatchParticleSystem):
+    """
+    Rain and leaves: ballistic motion in pixels/second on plain arrays, culled once off-screen
+    (no per-particle physics bodies; these never collide with anything)
+    """
+    VELOCITY_MS = 1000.0  # velocities are in pixels per second
+    
+    def __init__(self, max_particles=10000, gravity=200, bounds=(-250, -500, 2170, 1200)):
+        super().__init__(max_particles)
+        self.gravity = gravity
+        self.bounds = bounds  # (min_x, min_y, max_x, max_y) outside of which particles are culled
+        self.shrink_with_life = False
+    
+    def update(self, dt, wind_x=0, wind_y=0, gravity=None):
+        """Integrate velocities/positions and cull dead or off-screen particles"""
+        self.wind[:] = (wind_x, wind_y)
+        self.render_ahead_ms = 0.0
+        count = self.active_count
+        if count == 0:
+            return
+        
+        dt_seconds = dt / 1000.0
+        positions = self.positions[:count]
+        velocities = self.velocities[:count]
+        lifetimes = self.lifetimes[:count]
+        
+        velocities[:, 1] += (self.gravity if gravity is None else gravity) * dt_seconds
+        positions[:, 0] += (velocities[:, 0] + wind_x) * dt_seconds
+        positions[:, 1] += (velocities[:, 1] + wind_y) * dt_seconds
+        lifetimes -= dt
+        
+        min_x, min_y, max_x, max_y = self.bounds
+        off_screen = ((positions[:, 0] < min_x) | (positions[:, 0] > max_x) |
+                      (positions[:, 1] < min_y) | (positions[:, 1] > max_y))
+        lifetimes[off_screen] = 0
+        
+        if off_screen.any() or lifetimes.min() <= 0:
+            self.compact()
 
 
 # ============= PIL-ENHANCED EFFECTS =============
@@ -202,28 +468,78 @@ class PILWeatherEffects:
         self.glow_cache[cache_key] = py_surface
         return py_surface
     
-    def create_fog_layer(self, width, height, density=0.5, color=(200, 200, 220)):
-        """Create realistic fog using PIL"""
-        # Create base fog
-        img = Image.new('RGBA', (width, height), (*color, 0))
-        
-        # Add Perlin-like noise using multiple scales
-        for scale in [50, 100, 200]:
-            noise = Image.new('L', (width // scale, height // scale))
-            pixels = np.random.randint(0, 256, (height // scale, width // scale), dtype=np.uint8)
-            noise.putdata(pixels.flatten().tolist())
-            noise = noise.resize((width, height), Image.BILINEAR)
-            noise = noise.filter(ImageFilter.GaussianBlur(radius=20))
-            
-            # Blend with fog
-            fog_alpha = ImageEnhance.Brightness(noise).enhance(density)
-            img.paste(color, (0, 0), fog_alpha)
-        
-        # Convert to pygame
-        mode = img.mode
-        size = img.size
-        data = img.tobytes()
-        return pygame.image.fromstring(data, size, mode)
+
+
+# ============= TILEABLE FOG TEXTURES =============
+FOG_TILE_SIZES = [512, 768]  # near/far layers use different periods so the tiling doesn't line up
+FOG_OCTAVES = [(2, 0.5), (4, 0.3), (8, 0.2)]  # (lattice cells per tile, weight)
+FOG_ALPHA_STEP = 4  # density changes smaller than this don't rebuild the tile
+FOG_COLOR = (200, 200, 220)
+
+def generate_tileable_noise(size, cells, rng):
+    """Value noise on a wrapping lattice, so the result tiles seamlessly"""
+    lattice = rng.random((cells, cells), dtype=np.float32)
+    coords = np.arange(size, dtype=np.float32) * cells / size
+    i0 = coords.astype(np.int32)
+    i1 = (i0 + 1) % cells
+    t = coords - i0
+    t = t * t * (3 - 2 * t)  # smoothstep
+    
+    top = lattice[i0][:, i0] + (lattice[i0][:, i1] - lattice[i0][:, i0]) * t[None, :]
+    bottom = lattice[i1][:, i0] + (lattice[i1][:, i1] - lattice[i1][:, i0]) * t[None, :]
+    return top + (bottom - top) * t[:, None]
+
+@register_generator("fog_noise", prewarm=list(enumerate(FOG_TILE_SIZES)))
+def generate_fog_noise(variant, size):
+    """Build the 0..1 fog noise tile for a variant, laid out (x, y) like surfarray"""
+    rng = np.random.default_rng(1000 + variant)
+    noise = sum(generate_tileable_noise(size, cells, rng) * weight
+                for cells, weight in FOG_OCTAVES)
+    noise = (noise - noise.min()) / max(1e-6, noise.max() - noise.min())
+    noise = noise * noise * (3 - 2 * noise)  # push towards soft clumps and gaps
+    return np.ascontiguousarray(noise.T, dtype=np.float32)
+
+def get_fog_noise(variant, size):
+    """Get the fog noise tile for a variant (memory-mapped from the texture cache)"""
+    return texture_cache.get_array("fog_noise", variant, size)
+
+
+class FogTexture:
+    """Tileable fog layer; density is baked into the per-pixel alpha so blits stay on the fast path"""
+    def __init__(self, variant, size=512, color=FOG_COLOR):
+        self.size = size
+        self.noise = get_fog_noise(variant, size)
+        self.surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        self.surface.fill((*color, 0))
+        self.alpha = 0
+        self.scaled = None  # (scale, alpha, surface) for reduced render resolutions
+    
+    def set_density(self, alpha):
+        """Set the peak fog alpha (0-255); only rebuilds when it moves a full step"""
+        alpha = min(255, int(alpha)) // FOG_ALPHA_STEP * FOG_ALPHA_STEP
+        if alpha != self.alpha:
+            pygame.surfarray.pixels_alpha(self.surface)[:] = (self.noise * alpha).astype(np.uint8)
+            self.alpha = alpha
+    
+    def get_surface(self, scale):
+        """The tile at the given render scale (rescaled only when the scale or density changes)"""
+        if scale == 1.0:
+            return self.surface
+        if self.scaled is None or self.scaled[:2] != (scale, self.alpha):
+            size = max(1, int(self.size * scale))
+            self.scaled = (scale, self.alpha, pygame.transform.smoothscale(self.surface, (size, size)))
+        return self.scaled[2]
+    
+    def draw(self, screen, offset_x, offset_y, scale=1.0):
+        """Tile the texture over the screen, scrolled by the given offset (in logical pixels)"""
+        surface = self.get_surface(scale)
+        size = surface.get_width()
+        width, height = screen.get_size()
+        start_x = -int(offset_x * scale % size)
+        start_y = -int(offset_y * scale % size)
+        screen.blits([(surface, (x, y))
+                      for y in range(start_y, height, size)
+                      for x in range(start_x, width, size)], doreturn=False)
 
 
 # ============= OPENCV LIGHTNING EFFECTS =============
@@ -234,6 +550,13 @@ class CVLightningGenerator:
     
     def generate_lightning_texture(self, width, height, branches=3):
         """Generate lightning texture using OpenCV"""
+        img_rgba = self.generate_lightning_array(width, height, branches)
+        if img_rgba is None:
+            return None
+        return pygame.image.frombuffer(img_rgba.tobytes(), (width, height), 'RGBA')
+    
+    def generate_lightning_array(self, width, height, branches=3):
+        """Render a lightning bolt to an RGBA array (no pygame calls, safe off the main thread)"""
         if not self.cv2_available:
             return None
         
@@ -279,9 +602,98 @@ class CVLightningGenerator:
         # Apply Gaussian blur for glow
         img = cv2.GaussianBlur(img, (15, 15), 0)
         
-        # Convert to pygame surface
-        img_rgb = cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA)
-        return pygame.image.frombuffer(img_rgb.tobytes(), (width, height), 'RGBA')
+        return cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA)
+    
+    def create_procedural_bolt(self, width, height, branches=3):
+        """Cheap bolt drawn with pygame lines (no blur) for when no pre-rendered texture is ready"""
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        # Same random walk as calculate_lightning_segment, in plain Python so it never waits on a JIT compile
+        x, y = width // 2, 0
+        points = [(x, y)]
+        for _ in range(30):
+            x += random.uniform(-40, 40)
+            y += height / 30 + random.uniform(-20, 20)
+            points.append((int(x), int(y)))
+        
+        for color, thickness in (((200, 220, 255, 60), 20), ((220, 230, 255, 120), 10), ((255, 255, 255, 255), 3)):
+            pygame.draw.lines(surface, color, False, points, thickness)
+        
+        for _ in range(branches):
+            x, y = points[random.randint(5, 25)]
+            branch = [(x, y)]
+            for i in range(5):
+                x, y = x + random.uniform(-100, 100), y + i * 30 + random.uniform(-20, 20)
+                branch.append((int(x), int(y)))
+            pygame.draw.lines(surface, (200, 220, 255, 180), False, branch, 4)
+            pygame.draw.lines(surface, (255, 255, 255, 255), False, branch, 2)
+        
+        return surface
+
+
+# Distinct bolt shapes a storm picks from
+LIGHTNING_VARIANTS = 12
+
+@register_generator("lightning_bolt",
+                    prewarm=[(variant, 400, 1080) for variant in range(LIGHTNING_VARIANTS)] if CV2_AVAILABLE else [])
+def generate_lightning_bolt(variant, width, height):
+    """Render one lightning variant (the branch count cycles through 3-6)"""
+    return CVLightningGenerator().generate_lightning_array(width, height, branches=3 + variant % 4)
+
+
+class LightningTexturePool:
+    """
+    Keeps a few lightning bolts ready, loaded (or rendered on first use) by a background worker
+    (cv2 drawing and blurring release the GIL). Bounded: the worker blocks once the pool is full.
+    """
+    def __init__(self, generator, width=400, height=1080, capacity=4):
+        self.generator = generator
+        self.width = width
+        self.height = height
+        self.ready = queue.Queue(maxsize=capacity)
+        self.stop_event = threading.Event()
+        self.worker = None
+    
+    def start(self):
+        """Start filling the pool in the background (no-op without OpenCV or if already running)"""
+        if not self.generator.cv2_available or (self.worker and self.worker.is_alive()):
+            return
+        self.stop_event.clear()
+        self.worker = threading.Thread(target=self._fill, name="lightning-pool", daemon=True)
+        self.worker.start()
+    
+    def stop(self):
+        """Stop the worker and drop the bolts it had ready"""
+        self.stop_event.set()
+        if self.worker is not None:
+            self.worker.join(timeout=1.0)
+            self.worker = None
+        while True:
+            try:
+                self.ready.get_nowait()
+            except queue.Empty:
+                break
+    
+    def _fill(self):
+        while not self.stop_event.is_set():
+            # Random pre-baked variant (rendered once, then memory-mapped from the texture cache)
+            img = texture_cache.get_array("lightning_bolt", random.randrange(LIGHTNING_VARIANTS),
+                                          self.width, self.height)
+            while not self.stop_event.is_set():
+                try:
+                    self.ready.put(img, timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+    
+    def take(self):
+        """Get a ready bolt surface, or a cheap procedural one if the pool is empty"""
+        try:
+            img = self.ready.get_nowait()
+        except queue.Empty:
+            return self.generator.create_procedural_bolt(self.width, self.height, branches=3)
+        # Surfaces are only ever created on the main thread
+        return pygame.image.frombuffer(img.tobytes(), (self.width, self.height), 'RGBA')
 
 
 # ============= ENHANCED WEATHER EFFECTS CLASS =============
@@ -289,23 +701,33 @@ class EnhancedWeatherEffects:
     """Next-gen weather effects with all advanced libraries"""
     def __init__(self):
         self.batch_particles = BatchParticleSystem(max_particles=15000)
+        
+        # Rain and leaves only fall/drift, so they use a plain array integrator;
+        # the pymunk space is kept for effects that really need contacts
+        self.kinematic_particles = KinematicParticleSystem(max_particles=10000, gravity=200)
         self.physics_space = pymunk.Space()
         self.physics_space.gravity = (0, 200)
         self.physics_particles = []
         
         self.pil_effects = PILWeatherEffects()
         self.cv_lightning = CVLightningGenerator()
+        self.lightning_pool = LightningTexturePool(self.cv_lightning, 400, 1080)
         
         self.current_weather = None
         self.fog_alpha = 0
         self.fog_target = 0
-        self.fog_surface = None
+        
+        # Two tileable fog layers drifting at different speeds (near layer carries 60% of the density)
+        self.fog_layers = [FogTexture(i, size) for i, size in enumerate(FOG_TILE_SIZES)]
+        self.fog_layer_shares = [0.6, 0.4]
+        self.fog_offsets = [[0.0, 0.0], [301.0, 173.0]]
+        self.fog_velocities = [(0.0, 0.0), (0.0, 0.0)]  # px/ms in the last update
+        self.render_ahead_ms = 0.0
         self.spawn_timer = 0
         self.lightning_timer = 0
         self.lightning_surfaces = []
         
         # Rain system
-        self.raindrops = []
         self.rain_intensity = 0
         
         # Animation timers
@@ -317,17 +739,13 @@ class EnhancedWeatherEffects:
         Compatibility property that returns all active particles.
         This allows battle_system.py to access len(weather_effects.particles)
         """
-        total_count = (self.batch_particles.active_count + 
-                      len(self.physics_particles) + 
-                      len(self.raindrops) + 
-                      len(self.lightning_surfaces))
-        return [None] * total_count
+        return [None] * self.get_particle_count()
     
     def get_particle_count(self):
         """Get total number of active particles across all systems"""
         return (self.batch_particles.active_count + 
+                self.kinematic_particles.active_count + 
                 len(self.physics_particles) + 
-                len(self.raindrops) + 
                 len(self.lightning_surfaces))
         
     def set_weather(self, weather_type):
@@ -345,92 +763,54 @@ class EnhancedWeatherEffects:
         else:
             self.rain_intensity = 0
         
-        # Pre-generate fog layer with PIL
-        if self.fog_target > 0:
-            density = self.fog_target / 255.0
-            self.fog_surface = self.pil_effects.create_fog_layer(1920, 1080, density)
+        # Start rendering lightning bolts in the background before the first strike
+        if weather_type == "Stormy":
+            self.lightning_pool.start()
+        else:
+            self.lightning_pool.stop()
     
-    def spawn_advanced_rain(self, count):
-        """Spawn rain with physics simulation"""
-        for _ in range(count):
-            x = random.uniform(-200, 2120)
-            y = random.uniform(-400, 0)
-            
-            # Add to physics simulation
-            particle = PhysicsParticle(
-                self.physics_space, x, y,
-                (150, 180, 220), mass=0.1, radius=2,
-                particle_type="rain"
-            )
-            particle.body.velocity = (random.uniform(-50, 50), random.uniform(400, 600))
-            self.physics_particles.append(particle)
+    def close(self):
+        """Stop the lightning worker and drop its bolts when the battle ends"""
+        self.lightning_pool.stop()
+        self.lightning_surfaces = []
     
     def create_advanced_lightning(self):
-        """Create lightning using OpenCV"""
-        if self.cv_lightning.cv2_available:
-            lightning_surf = self.cv_lightning.generate_lightning_texture(400, 1080, branches=5)
-            if lightning_surf:
-                x_pos = random.randint(200, 1520)
-                self.lightning_surfaces.append({
-                    'surface': lightning_surf,
-                    'x': x_pos,
-                    'life': 300,
-                    'max_life': 300
-                })
-        
-        # Add explosion particles at strike point
-        strike_x = random.randint(300, 1620)
-        strike_y = random.randint(800, 1000)
-        
-        for _ in range(100):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(100, 400)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed - 200
-            
-            self.batch_particles.add_particle(
-                strike_x, strike_y, vx, vy,
-                (255, 255, 255), random.uniform(4, 10), 800
-            )
-    
-    def spawn_sunny_particles(self):
-        """Spawn sun rays and sparkles"""
-        for _ in range(10):
-            x = random.randint(0, 1920)
-            y = random.randint(0, 600)
-            self.batch_particles.add_particle(
-                x, y,
-                random.uniform(-20, 20),
-                random.uniform(-20, 20),
-                (255, 240, 100),
-                random.uniform(6, 12),
-                4000
-            )
+        """Strike with a pre-rendered bolt from the pool"""
+        self.lightning_surfaces.append({
+            'surface': self.lightning_pool.take(),
+            'x': random.randint(200, 1520),
+            'life': 300,
+            'max_life': 300
+        })
+        
+        # Explosion particles at the strike point
+        strike_point = (random.randint(300, 1620), random.randint(800, 1000))
+        burst("lightning_sparks", self.batch_particles, strike_point)
     
-    def spawn_wind_leaves(self):
-        """Spawn wind-blown leaves with physics"""
-        edge = random.choice(['left', 'right'])
-        if edge == 'left':
-            x, y = -50, random.randint(200, 800)
-            vx = random.uniform(400, 600)
-        else:
-            x, y = 1970, random.randint(200, 800)
-            vx = random.uniform(-600, -400)
-        
-        particle = PhysicsParticle(
-            self.physics_space, x, y,
-            random.choice([(255, 200, 0), (255, 150, 0), (200, 100, 0)]),
-            mass=0.5, radius=8, particle_type="leaf"
-        )
-        particle.body.velocity = (vx, random.uniform(-100, 100))
-        particle.body.angular_velocity = random.uniform(-10, 10)
-        self.physics_particles.append(particle)
+    def spawn_weather_particles(self):
+        """Fire the current weather's emitter once its interval has elapsed"""
+        emitter_name = WEATHER_EMITTERS.get(self.current_weather)
+        if emitter_name is None:
+            return
+        
+        emitter = get_emitter(emitter_name)
+        if self.spawn_timer > emitter.interval:
+            target = self.kinematic_particles if emitter.system == "kinematic" else self.batch_particles
+            count = max(1, int(emitter.burst_count * quality_governor.get("spawn_scale")))
+            emitter.emit(target, count=count)
+            self.spawn_timer = 0
     
     def update(self, dt):
         """Update all weather effects"""
+        self.render_ahead_ms = 0.0
         self.animation_time += dt
         self.spawn_timer += dt
         
+        # Follow the quality level; particles above a lowered cap are left to die off
+        particle_cap = quality_governor.get("particle_cap")
+        for system in (self.batch_particles, self.kinematic_particles):
+            system.particle_cap = int(system.max_particles * particle_cap)
+        
         # Smooth fog transition with pytweening
         if abs(self.fog_alpha - self.fog_target) > 1:
             progress = min(1.0, dt / 1000.0)
@@ -449,255 +829,110 @@ class EnhancedWeatherEffects:
             wind_x = wind_strength * 250
             wind_y = wind_strength * 100
         
+        # Scroll fog layers (pixels/second; the far layer drifts slower)
+        self.fog_velocities = [(-(25 + wind_x * 0.2) * speed / 1000.0, -(4 + wind_y * 0.1) * speed / 1000.0)
+                               for speed in (1.0, 0.5)]
+        for offset, (velocity_x, velocity_y) in zip(self.fog_offsets, self.fog_velocities):
+            offset[0] += velocity_x * dt
+            offset[1] += velocity_y * dt
+        
         # Update batch particle system
         gravity = 0.5 if self.current_weather != "Sunny" else 0.05
         self.batch_particles.update(dt, wind_x, wind_y, gravity)
         
-        # Update physics particles
-        self.physics_space.step(dt / 1000.0)
-        self.physics_particles = [p for p in self.physics_particles if p.update(dt)]
-        
-        # Remove off-screen physics particles
-        self.physics_particles = [
-            p for p in self.physics_particles
-            if -100 < p.body.position.x < 2020 and -100 < p.body.position.y < 1200
-        ]
+        # Update rain and leaves
+        self.kinematic_particles.update(dt)
+        
+        # Update physics particles (contact effects only; skip the space entirely when idle)
+        if self.physics_particles:
+            self.physics_space.step(dt / 1000.0)
+            alive = []
+            for p in self.physics_particles:
+                if p.update(dt) and -100 < p.body.position.x < 2020 and -100 < p.body.position.y < 1200:
+                    alive.append(p)
+                else:
+                    # Dead bodies have to leave the space or every later step still pays for them
+                    self.physics_space.remove(p.body, p.shape)
+            self.physics_particles = alive
         
         # Weather-specific spawning
-        if self.current_weather == "Rainy" and self.spawn_timer > 30:
-            self.spawn_advanced_rain(50)
-            self.spawn_timer = 0
-        elif self.current_weather == "Stormy":
-            if self.spawn_timer > 20:
-                self.spawn_advanced_rain(80)
-                self.spawn_timer = 0
-            
+        self.spawn_weather_particles()
+        if self.current_weather == "Stormy":
             self.lightning_timer += dt
             if self.lightning_timer > random.randint(1000, 2500):
                 self.create_advanced_lightning()
                 self.lightning_timer = 0
-        elif self.current_weather == "Sunny" and self.spawn_timer > 80:
-            self.spawn_sunny_particles()
-            self.spawn_timer = 0
-        elif self.current_weather == "Windy" and self.spawn_timer > 150:
-            self.spawn_wind_leaves()
-            self.spawn_timer = 0
-        elif self.current_weather == "Clear" and self.spawn_timer > 200:
-            for _ in range(5):
-                self.batch_particles.add_particle(
-                    random.randint(0, 1920),
-                    random.randint(0, 1080),
-                    random.uniform(-1, 1),
-                    random.uniform(-1, 1),
-                    (240, 240, 255),
-                    random.uniform(2, 4),
-                    3000
-                )
-            self.spawn_timer = 0
-        elif self.current_weather == "Misty" and self.spawn_timer > 100:
-            for _ in range(10):
-                self.batch_particles.add_particle(
-                    random.randint(-100, 2020),
-                    random.randint(300, 1080),
-                    random.uniform(-10, 10),
-                    random.uniform(-5, 5),
-                    (220, 230, 240),
-                    random.uniform(30, 60),
-                    8000
-                )
-            self.spawn_timer = 0
         
         # Update lightning surfaces
         for lightning in self.lightning_surfaces:
             lightning['life'] -= dt
         self.lightning_surfaces = [l for l in self.lightning_surfaces if l['life'] > 0]
     
-    def draw(self, screen):
-        """Draw all advanced weather effects"""
+    def get_lightning_surface(self, lightning, scale):
+        """The strike's bolt at the given render scale (scaled once per strike)"""
+        if scale == 1.0:
+            return lightning['surface']
+        scaled = lightning.get('scaled')
+        if scaled is None or scaled[0] != scale:
+            width, height = lightning['surface'].get_size()
+            scaled = (scale, pygame.transform.scale(lightning['surface'], (int(width * scale), int(height * scale))))
+            lightning['scaled'] = scaled
+        return scaled[1]
+    
+    def set_render_ahead(self, ms):
+        """Draw everything ms past the last update (the fixed-timestep loop's leftover time)"""
+        self.render_ahead_ms = ms
+        self.batch_particles.render_ahead_ms = ms
+        self.kinematic_particles.render_ahead_ms = ms
+    
+    def draw(self, screen, scale=1.0):
+        """
+        Draw all advanced weather effects
+        scale is the size of screen relative to the logical 1920x1080 canvas (render scale)
+        """
         # Draw batch particles
-        self.batch_particles.draw(screen)
+        self.batch_particles.draw(screen, scale)
+        
+        # Draw rain and leaves
+        self.kinematic_particles.draw(screen, scale)
         
         # Draw physics particles
-        for particle in self.physics_particles:
-            particle.draw(screen)
+        ahead = self.render_ahead_ms
+        screen.blits([particle.get_blit(scale, ahead) for particle in self.physics_particles], doreturn=False)
         
         # Draw lightning
         for lightning in self.lightning_surfaces:
-            alpha = int(255 * (lightning['life'] / lightning['max_life']))
-            lightning['surface'].set_alpha(alpha)
-            screen.blit(lightning['surface'], (lightning['x'], 0))
+            life = max(0, lightning['life'] - ahead)
+            alpha = int(255 * (life / lightning['max_life']))
+            surface = self.get_lightning_surface(lightning, scale)
+            surface.set_alpha(alpha)
+            screen.blit(surface, (int(lightning['x'] * scale), 0))
             
             # Flash effect
-            if lightning['life'] > lightning['max_life'] * 0.8:
-                flash_alpha = int(150 * (lightning['life'] / lightning['max_life']))
-                flash_surf = pygame.Surface((1920, 1080), pygame.SRCALPHA)
-                flash_surf.fill((240, 245, 255, flash_alpha))
-                screen.blit(flash_surf, (0, 0))
-        
-        # Draw fog layer
-        if self.fog_alpha > 0 and self.fog_surface:
-            self.fog_surface.set_alpha(int(self.fog_alpha))
-            screen.blit(self.fog_surface, (0, 0))
-
-
-# ============= WEATHER CLASS (UNCHANGED INTERFACE) =============
-class Weather:
-    """Weather system class - maintains same interface"""
-    def __init__(self):
-        self.current_weather = None
-        self.duration = 0
-        self.weather_types = {
-            "Clear": {
-                "boost_types": ["Human"], 
-                "boost_percentage": 15,
-                "message": "The weather is clear and calm.",
-                "color": LIGHT_GRAY
-            },
-            "Sunny": {
-                "boost_types": ["Light", "Star"], 
-                "boost_percentage": 30,
-                "message": "Brilliant sunshine floods the battlefield!",
-                "color": YELLOW
-            },
-            "Rainy": {
-                "boost_types": ["Oil", "Crude Oil", "Grass"], 
-                "boost_percentage": 35,
-                "message": "Torrential rain pounds the battlefield!",
-                "color": BLUE
-            },
-            "Windy": {
-                "boost_types": ["Imagination", "Catgirl"], 
-                "boost_percentage": 20,
-                "message": "Fierce winds howl across the battlefield!",
-                "color": CYAN
-            },
-            "Stormy": {
-                "boost_types": ["Bonk", "Mod"], 
-                "boost_percentage": 40,
-                "message": "A violent storm rages with thunder and lightning!",
-                "color": PURPLE
-            },
-            "Misty": {
-                "boost_types": ["Miwiwi", "Miwawa"], 
-                "boost_percentage": 28,
-                "message": "Dense mist shrouds the battlefield!",
-                "color": GRAY
-            }
-        }
-        self.change_weather()
-    
-    def change_weather(self):
-        """Change weather with time-of-day restrictions"""
-        import datetime
-        
-        old_weather = self.current_weather
-        
-        # Get current hour to determine if it's night
-        current_hour = datetime.datetime.now().hour
-        is_night = current_hour >= 22 or current_hour < 6
-        
-        # Create list of available weather types
-        available_weather = list(self.weather_types.keys())
-        
-        # Remove Sunny from options during night time (10 PM - 6 AM)
-        if is_night and "Sunny" in available_weather:
-            available_weather.remove("Sunny")
-            print("Night time detected - Sunny weather excluded")
-        
-        # Choose random weather from available options
-        self.current_weather = random.choice(available_weather)
-        self.duration = random.randint(3, 6)
-        
-        return old_weather != self.current_weather
-    
-    def get_boost_multiplier(self, move_type):
-        if move_type in self.weather_types[self.current_weather]["boost_types"]:
-            boost_percentage = self.weather_types[self.current_weather]["boost_percentage"]
-            return 1.0 + (boost_percentage / 100.0)
-        return 1.0
-    
-    def get_weather_info(self):
-        weather_data = self.weather_types[self.current_weather]
-        boosted_types = ", ".join(weather_data["boost_types"])
-        boost_percent = weather_data["boost_percentage"]
-        return {
-            "name": self.current_weather,
-            "duration": self.duration,
-            "boosted_types": boosted_types,
-            "boost_percent": boost_percent,
-            "message": weather_data["message"],
-            "color": weather_data["color"]
-        }
-    
-    def update_turn(self):
-        if self.duration > 0:
-            self.duration -= 1
-            if self.duration <= 0:
-                return self.change_weather()
-        return False
-
-
-# ============= LIGHTWEIGHT PARTICLE FOR BACKWARD COMPATIBILITY =============
-class Particle:
-    """Lightweight particle for general use (backward compatible)"""
-    def __init__(self, x, y, color, velocity_x, velocity_y, life=1000, particle_type="default"):
-        self.pos = np.array([x, y], dtype=np.float32)
-        self.vel = np.array([velocity_x, velocity_y], dtype=np.float32)
-        self.color = color
-        self.life = life
-        self.max_life = life
-        self.particle_type = particle_type
-        self.size = 3.0
-        self.rotation = 0.0
-        self.rotation_speed = random.uniform(-5, 5)
-        
-        self.x = x
-        self.y = y
-        self.vx = velocity_x
-        self.vy = velocity_y
-        
-    def update(self, dt, wind=None, gravity=0.5):
-        """Update particle position"""
-        dt_factor = dt / 16.67
-        
-        if wind is None:
-            wind = np.array([0, 0], dtype=np.float32)
-        elif not isinstance(wind, np.ndarray):
-            wind = np.array([0, 0], dtype=np.float32)
-        
-        self.vel[1] += gravity * dt_factor
-        self.pos += (self.vel + wind) * dt_factor
-        self.rotation += self.rotation_speed * dt_factor
-        
-        self.x, self.y = self.pos[0], self.pos[1]
-        self.vx, self.vy = self.vel[0], self.vel[1]
-        
-        self.life -= dt
-        return self.life > 0
-    
-    def draw(self, screen):
-        """Draw the particle"""
-        alpha = int(255 * (self.life / self.max_life))
-        size = max(1, int(self.size * (self.life / self.max_life)))
-        
-        particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(particle_surf, (*self.color, alpha), (size, size), size)
-        screen.blit(particle_surf, (int(self.x - size), int(self.y - size)))
-    
-    def get_alpha(self):
-        return int(255 * (self.life / self.max_life))
-    
-    def get_size(self):
-        return max(1, int(self.size * (self.life / self.max_life)))
+            if life > lightning['max_life'] * 0.8:
+                flash_alpha = int(150 * (life / lightning['max_life']))
+                surface_pool.blit_fill(screen, (240, 245, 255, flash_alpha))
+        
+        # Draw fog layers (on lower quality levels the near layer carries the whole density)
+        if self.fog_alpha >= 1:
+            layer_count = quality_governor.get("fog_layers")
+            shares = self.fog_layer_shares if layer_count > 1 else [sum(self.fog_layer_shares)]
+            for layer, share, (offset_x, offset_y), (velocity_x, velocity_y) in zip(
+                    self.fog_layers[:layer_count], shares, self.fog_offsets, self.fog_velocities):
+                layer.set_density(self.fog_alpha * share * 2)
+                if layer.alpha > 0:
+                    layer.draw(screen, offset_x + velocity_x * ahead, offset_y + velocity_y * ahead, scale)
 
 
 WeatherEffects = EnhancedWeatherEffects
 
-print("=" * 60)
-print("Enhanced Weather System Loaded Successfully!")
-print("- Numba JIT: Available" if 'jit' in dir() else "- Numba JIT: NOT AVAILABLE")
-print("- Pymunk: Available" if 'pymunk' in dir() else "- Pymunk: NOT AVAILABLE")
-print("- PIL: Available" if 'Image' in dir() else "- PIL: NOT AVAILABLE")
-print("- OpenCV: Available" if CV2_AVAILABLE else "- OpenCV: NOT AVAILABLE")
-print("- Pytweening: Available" if 'pytweening' in dir() else "- Pytweening: NOT AVAILABLE")
-print("=" * 60)
\ No newline at end of file
+# ============= WARM-UP =============
+def warm_up():
+    """
+    Compile the Numba kernels and load the fog noise before the first battle needs them
+    Safe to run off the main thread (no display calls). Returns the kernel compile time.
+    """
+    compile_time = compile_kernels()
+    for variant, size in enumerate(FOG_TILE_SIZES):
+        get_fog_noise(variant, size)
+    return compile_time
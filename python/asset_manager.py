@@ -0,0 +1,200 @@
+"""
+Sprite Asset Manager
+Loads every character sprite once, converts it to the display format and packs all
+the size variants the game blits (select screen, character cards, battle) into one
+atlas, so draw loops only blit. The atlas is rebuilt when the display mode changes.
+"""
+
+import os
+import math
+import random
+import pygame
+from python.color import GRAY, BLACK
+from python.fullscreen_toggle import display_manager
+from python.texture_cache import texture_cache, register_generator, surface_to_array
+
+# Sprite sizes used everywhere regardless of resolution
+SELECT_SPRITE_SIZE = 120
+BATTLE_SPRITE_SIZE = 80
+
+
+def card_sprite_size(screen_width, screen_height):
+    """Sprite size on a character select card (cards are 18.75% x 25.9% of the screen)"""
+    button_width = int(screen_width * 0.1875)
+    button_height = int(screen_height * 0.259)
+    return min(button_width // 3, button_height // 4)
+
+
+def fallback_sprite_params():
+    """(size, color) for every character's fallback sprite at the fixed sizes"""
+    from python.character_data import characters
+    card_size = card_sprite_size(*display_manager.get_size())
+    return sorted({(size, tuple(char["color"])) for char in characters.values()
+                   for size in (SELECT_SPRITE_SIZE, BATTLE_SPRITE_SIZE, card_size)})
+
+
+@register_generator("fallback_sprite", prewarm=fallback_sprite_params)
+def generate_fallback_sprite(size, fallback_color=GRAY):
+    """Colored rectangle with a vertical gradient and border for missing sprite files"""
+    surface = pygame.Surface((size, size))
+    for y in range(size):
+        shade = int(fallback_color[0] * (0.7 + 0.3 * y / size))
+        color = (shade, shade, shade) if fallback_color == GRAY else fallback_color
+        pygame.draw.line(surface, color, (0, y), (size, y))
+
+    pygame.draw.rect(surface, BLACK, (0, 0, size, size), 2)
+    return surface_to_array(surface)
+
+
+def build_fallback_sprite(size, fallback_color=GRAY):
+    """Fallback sprite surface (generated once, then loaded from the texture cache)"""
+    return texture_cache.get_surface("fallback_sprite", size, tuple(fallback_color))
+
+
+@register_generator("background", prewarm=[()])
+def generate_background():
+    """Procedural sky gradient with soft stars (used when mikamon_background.png is missing)"""
+    background = pygame.Surface((1920, 1080))
+
+    for y in range(1080):
+        # Blue to purple gradient with some variation
+        t = y / 1080
+        r = int(135 + math.sin(t * math.pi) * 50)
+        g = int(206 - t * 50)
+        b = int(250 - t * 50)
+        color = (max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b)))
+        pygame.draw.line(background, color, (0, y), (1920, y))
+
+    # Fixed seed so a cleared cache regenerates the same sky
+    rng = random.Random(1080)
+    for i in range(20):
+        x = rng.randint(0, 1920)
+        y = rng.randint(0, 1080)
+        size = rng.randint(5, 15)
+        alpha = rng.randint(30, 80)
+        # Draw stars
+        star_surface = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
+        pygame.draw.circle(star_surface, (255, 255, 255, alpha), (size, size), size)
+        background.blit(star_surface, (x, y))
+
+    return surface_to_array(background)
+
+
+def read_background(filename="mikamon_background.png"):
+    """Read the background image (or the cached procedural one) without converting it; thread-safe"""
+    try:
+        if os.path.exists(filename):
+            image = pygame.image.load(filename)
+            return pygame.transform.scale(image, (1920, 1080))
+    except pygame.error:
+        pass
+    return texture_cache.get_surface("background")
+
+
+class SpriteSet:
+    """Dict-style view of one sprite size (sprites[name]) that always reads the current atlas"""
+
+    def __init__(self, manager, size):
+        self.manager = manager
+        self.size = size
+
+    def __getitem__(self, name):
+        return self.manager.get(name, self.size)
+
+    def __contains__(self, name):
+        return name in self.manager.sprite_info
+
+
+class AssetManager:
+    """Character sprite atlas with pre-built size variants"""
+
+    def __init__(self):
+        self.sprite_info = {}   # name -> (sprite file, fallback color)
+        self.image_cache = {}   # sprite file -> loaded image (None if missing)
+        self.atlas = None
+        self.atlas_rects = {}   # (name, size) -> Rect in the atlas
+        self.variants = {}      # (name, size) -> atlas subsurface
+        self.sizes = set()
+
+    def load_images(self, characters):
+        """
+        Read every sprite file and fallback texture without touching the display
+        (safe on a loading thread; rebuild() then converts them on the main thread)
+        """
+        for name, char in characters.items():
+            sprite_file = char["sprite_file"]
+            self.sprite_info[name] = (sprite_file, char["color"])
+            if sprite_file not in self.image_cache:
+                self.image_cache[sprite_file] = self._load_image(sprite_file)
+        
+        for name, (sprite_file, fallback_color) in self.sprite_info.items():
+            if self.image_cache.get(sprite_file) is None:
+                for size in self.get_variant_sizes():
+                    texture_cache.get_array("fallback_sprite", size, tuple(fallback_color))
+    
+    def get_variant_sizes(self):
+        """Sprite sizes kept in the atlas for the current display size"""
+        screen_width, screen_height = display_manager.get_size()
+        return {SELECT_SPRITE_SIZE, BATTLE_SPRITE_SIZE, card_sprite_size(screen_width, screen_height)}
+
+    def _load_image(self, filename):
+        try:
+            if os.path.exists(filename):
+                return pygame.image.load(filename)
+        except pygame.error:
+            pass
+        return None
+
+    def _render_variant(self, name, size):
+        sprite_file, fallback_color = self.sprite_info[name]
+        image = self.image_cache.get(sprite_file)
+        if image is None:
+            return build_fallback_sprite(size, fallback_color)
+        return pygame.transform.scale(image, (size, size))
+
+    def rebuild(self):
+        """Convert and pack every size variant into a fresh atlas (one row per size)"""
+        self.sizes = self.get_variant_sizes()
+        names = list(self.sprite_info)
+        if not names:
+            return
+
+        sizes = sorted(self.sizes, reverse=True)
+        width = max(1, max(sizes) * len(names))
+        height = max(1, sum(sizes))
+        atlas = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+
+        self.atlas_rects = {}
+        self.variants = {}
+        y = 0
+        for size in sizes:
+            for i, name in enumerate(names):
+                rect = pygame.Rect(i * size, y, size, size)
+                atlas.blit(self._render_variant(name, size), rect)
+                self.atlas_rects[(name, size)] = rect
+            y += size
+
+        self.atlas = atlas
+        for key, rect in self.atlas_rects.items():
+            self.variants[key] = atlas.subsurface(rect)
+        print(f"Sprite atlas built: {len(names)} characters x {len(sizes)} sizes ({width}x{height})")
+
+    def get(self, name, size):
+        """Get a sprite variant; sizes outside the atlas are converted once and cached"""
+        key = (name, size)
+        sprite = self.variants.get(key)
+        if sprite is None:
+            sprite = self._render_variant(name, size).convert_alpha()
+            self.variants[key] = sprite
+        return sprite
+
+    def sprite_set(self, size):
+        """Dict-style sprite lookup for one size"""
+        return SpriteSet(self, size)
+
+
+# Global asset manager instance
+asset_manager = AssetManager()
+
+# Display format and card sizes can change with the display mode
+display_manager.add_mode_change_callback(lambda size: asset_manager.rebuild())
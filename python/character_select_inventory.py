@@ -2,6 +2,8 @@ import pygame
 from python.color import WHITE, BLACK, GRAY, DARK_GRAY, RED, DARK_RED, GOLD, BLUE, DARK_BLUE, GREEN, PURPLE, CYAN
 from python.shadowed_text_and_buttons import draw_text_with_shadow, draw_gradient_button
 from python.pygame1 import FONT, SMALL_FONT, BIG_FONT
+from python.fullscreen_toggle import display_manager
+from python.surface_pool import surface_pool
 
 # Global scroll position for character select inventory
 char_select_inv_scroll = 0
@@ -12,13 +14,11 @@ def draw_character_select_inventory(player_inventory, screen_width, screen_heigh
     
     inv_width = int(screen_width * 0.3125)  # About 600px at 1920px
     inv_height = int(screen_height * 0.463)  # About 500px at 1080px
-    inv_surface = pygame.Surface((inv_width, inv_height), pygame.SRCALPHA)
-    inv_surface.fill((0, 0, 0, 200))
     inv_x = (screen_width - inv_width) // 2
     inv_y = (screen_height - inv_height) // 2
     
     from python.pygame1 import SCREEN
-    SCREEN.blit(inv_surface, (inv_x, inv_y))
+    surface_pool.blit_fill(SCREEN, (0, 0, 0, 200), (inv_x, inv_y, inv_width, inv_height))
     pygame.draw.rect(SCREEN, GOLD, (inv_x, inv_y, inv_width, inv_height), 4)
     
     # Title
@@ -29,7 +29,7 @@ def draw_character_select_inventory(player_inventory, screen_width, screen_heigh
     
     # Close button at top right
     close_inv_rect = pygame.Rect(inv_x + inv_width - 120, inv_y + 15, 100, 40)
-    mouse_pos = pygame.mouse.get_pos()
+    mouse_pos = display_manager.get_mouse_pos()
     draw_gradient_button("CLOSE", close_inv_rect, DARK_RED, RED, 
                         close_inv_rect.collidepoint(mouse_pos), FONT)
     
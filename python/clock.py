@@ -1,5 +1,7 @@
 import time
+import pygame
 from python.pygame1 import SCREEN, FONT
+from python.digit_atlas import digit_atlas
 
 def draw_real_time_clock(show_clock=True):
     """Draw clock only if enabled in settings"""
@@ -7,6 +9,16 @@ def draw_real_time_clock(show_clock=True):
         return
     
     current_time_str = time.strftime("%H:%M:%S")
-    clock_surface = FONT.render(current_time_str, True, (255, 255, 255))
-    clock_rect = clock_surface.get_rect(topright=(SCREEN.get_width() - 20, 10))
-    SCREEN.blit(clock_surface, clock_rect)
\ No newline at end of file
+    clock_width = digit_atlas.measure(current_time_str, FONT)
+    digit_atlas.draw(SCREEN, current_time_str, SCREEN.get_width() - 20 - clock_width, 10, FONT, (255, 255, 255))
+
+def ms_until_next_second():
+    """How long until the clock shows a new time (for idle screens that sleep in between)"""
+    return 1000 - int(time.time() * 1000) % 1000 + 5
+
+def clock_widget(show_clock=True):
+    """(rect, state, draw) for registering the clock with the UI layer; the state changes every second"""
+    current_time_str = time.strftime("%H:%M:%S") if show_clock else ""
+    clock_width = digit_atlas.measure(current_time_str, FONT) if show_clock else 0
+    rect = pygame.Rect(SCREEN.get_width() - 20 - clock_width, 10, clock_width, FONT.get_height())
+    return rect, current_time_str, lambda: draw_real_time_clock(show_clock)
@@ -1,7 +1,7 @@
 import pygame, math
 from python.pygame1 import SCREEN, SMALL_FONT
 from python.color import BLACK, WHITE, CYAN, GREEN, YELLOW, RED, ORANGE, GRAY, PURPLE, PINK, BLUE
-from python.shadowed_text_and_buttons import draw_text_with_shadow
+from python.shadowed_text_and_buttons import draw_number_with_shadow
 
 def draw_energy_bar(x, y, current_energy, max_energy, width=200):
     """Enhanced energy bar with smooth animations and particle effects"""
@@ -93,11 +93,11 @@ def draw_energy_bar(x, y, current_energy, max_energy, width=200):
         text_color = PURPLE
     
     energy_text = f"MP: {int(current_energy)}/{int(max_energy)}"
-    draw_text_with_shadow(energy_text, x + width + 10, y - 2, text_color, SMALL_FONT)
+    draw_number_with_shadow(energy_text, x + width + 10, y - 2, text_color, SMALL_FONT)
     
     # Percentage indicator
     percentage_text = f"{int(energy_percentage * 100)}%"
-    draw_text_with_shadow(percentage_text, x + width // 2 - 15, y - 2, WHITE, SMALL_FONT, shadow_offset=1)
+    draw_number_with_shadow(percentage_text, x + width // 2 - 15, y - 2, WHITE, SMALL_FONT, shadow_offset=1)
 
 
 def draw_animated_health_bar(x, y, current_hp, max_hp, width=250, animate_time=0):
@@ -223,11 +223,11 @@ def draw_animated_health_bar(x, y, current_hp, max_hp, width=250, animate_time=0
         text_color = RED
     
     hp_text = f"{int(current_hp)}/{int(max_hp)}"
-    draw_text_with_shadow(hp_text, x + width + 15, y + 3, text_color, SMALL_FONT, shadow_offset=2)
+    draw_number_with_shadow(hp_text, x + width + 15, y + 3, text_color, SMALL_FONT, shadow_offset=2)
     
     # HP percentage
     percentage_text = f"{int(health_percentage * 100)}%"
-    draw_text_with_shadow(percentage_text, x + width // 2 - 15, y + 1, WHITE, SMALL_FONT, shadow_offset=2)
+    draw_number_with_shadow(percentage_text, x + width // 2 - 15, y + 1, WHITE, SMALL_FONT, shadow_offset=2)
     
     # Critical health warning
     if health_percentage < 0.25:
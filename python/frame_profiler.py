@@ -0,0 +1,187 @@
+"""
+Frame Profiler Overlay
+F3 toggles an overlay with frame time, FPS and a rolling per-section breakdown of the
+battle loop, plus particle and surface-allocation counts. Sections are laps: mark(name)
+closes the running section and opens the next one, so a loop only needs one call at the
+start of each stage. While the overlay is off, mark() and section() return immediately.
+"""
+
+import time
+from collections import deque
+import pygame
+from python.color import WHITE, GOLD, GRAY, GREEN, YELLOW, RED
+from python.pygame1 import SMALL_FONT
+
+HISTORY_FRAMES = 120
+REFRESH_MS = 250
+PANEL_WIDTH = 460
+BAR_WIDTH = 120
+LINE_HEIGHT = 20
+
+_Surface = pygame.Surface
+
+
+class CountingSurface(_Surface):
+    """pygame.Surface stand-in (installed only while profiling) that counts allocations"""
+    allocations = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        CountingSurface.allocations += 1
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.add(self.name, time.perf_counter_ns() - self.start)
+        return False
+
+
+class _NullSection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_SECTION = _NullSection()
+
+
+class FrameProfiler:
+    """Per-frame section timings with a rolling history"""
+    def __init__(self):
+        self.enabled = False
+        self.current = {}        # section -> ns this frame (insertion order = draw order)
+        self.open_section = None
+        self.open_start = 0
+        self.counters = {}       # label -> value for the last frame
+        self.history = deque(maxlen=HISTORY_FRAMES)  # (frame ns, {section: ns})
+        self.frame_start = None
+        self.panel = None
+        self.last_refresh = 0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.current = {}
+        self.open_section = None
+        self.history.clear()
+        self.frame_start = None
+        self.panel = None
+        # Count explicit pygame.Surface(...) allocations only while profiling
+        pygame.Surface = CountingSurface if self.enabled else _Surface
+        CountingSurface.allocations = 0
+        print(f"Frame profiler {'on' if self.enabled else 'off'}")
+
+    def reset(self):
+        """Switch the overlay off (restoring pygame.Surface) when leaving the battle"""
+        if self.enabled:
+            self.toggle()
+
+    def handle_event(self, event):
+        """Toggle on F3; returns True if the event was used"""
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.toggle()
+            return True
+        return False
+
+    def add(self, name, ns):
+        self.current[name] = self.current.get(name, 0) + ns
+
+    def mark(self, name):
+        """Close the running section and start timing name (time adds up across repeats)"""
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        if self.open_section is not None:
+            self.add(self.open_section, now - self.open_start)
+        self.open_section = name
+        self.open_start = now
+
+    def section(self, name):
+        """Time a nested block: with frame_profiler.section("..."): ..."""
+        if not self.enabled:
+            return NULL_SECTION
+        return _Section(self, name)
+
+    def count(self, label, value):
+        """Show a per-frame counter (e.g. live particles) on the overlay"""
+        if self.enabled:
+            self.counters[label] = value
+
+    def end_frame(self):
+        """Close the running section and push this frame into the history"""
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        if self.open_section is not None:
+            self.add(self.open_section, now - self.open_start)
+            self.open_section = None
+        if self.frame_start is not None:
+            self.history.append((now - self.frame_start, self.current))
+        self.frame_start = now
+        self.current = {}
+        self.counters["Surfaces allocated"] = CountingSurface.allocations
+        CountingSurface.allocations = 0
+
+    def build_panel(self):
+        """Render the overlay text from the rolling history"""
+        frames = len(self.history)
+        frame_ns = [frame for frame, sections in self.history]
+        average_ms = sum(frame_ns) / frames / 1e6
+        worst_ms = max(frame_ns) / 1e6
+
+        totals = {}
+        for frame, sections in self.history:
+            for name, ns in sections.items():
+                totals[name] = totals.get(name, 0) + ns
+        section_ms = [(name, ns / frames / 1e6) for name, ns in totals.items()]
+
+        # (label, value, color); values line up in a column left of the bars
+        lines = [("FRAME PROFILER (F3)", f"{1000 / average_ms:.0f} FPS", GOLD),
+                 ("Frame avg / max", f"{average_ms:.1f} / {worst_ms:.1f} ms", WHITE)]
+        bars = []
+        for name, ms in section_ms:
+            color = RED if ms > 8 else YELLOW if ms > 2 else GREEN
+            lines.append((name, f"{ms:.2f} ms", color))
+            bars.append((len(lines) - 1, min(1.0, ms / max(average_ms, 1e-6)), color))
+        for label, value in self.counters.items():
+            lines.append((label, str(value), GRAY))
+
+        # Plain Surface so the overlay doesn't count its own allocations
+        panel = _Surface((PANEL_WIDTH, 10 + LINE_HEIGHT * len(lines)), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+        value_x = PANEL_WIDTH - BAR_WIDTH - 20
+        for i, (label, value, color) in enumerate(lines):
+            y = 5 + i * LINE_HEIGHT
+            panel.blit(SMALL_FONT.render(label, True, color), (10, y))
+            if value:
+                value_text = SMALL_FONT.render(value, True, color)
+                panel.blit(value_text, (value_x - value_text.get_width(), y))
+        for line, fraction, color in bars:
+            width = max(1, int(BAR_WIDTH * fraction))
+            pygame.draw.rect(panel, color, (PANEL_WIDTH - BAR_WIDTH - 10, 10 + line * LINE_HEIGHT, width, 10))
+        return panel
+
+    def draw(self, screen):
+        """Draw the overlay in the top-right corner (refreshed a few times per second)"""
+        if not self.enabled or not self.history:
+            return
+        now = pygame.time.get_ticks()
+        if self.panel is None or now - self.last_refresh >= REFRESH_MS:
+            self.panel = self.build_panel()
+            self.last_refresh = now
+        screen.blit(self.panel, (screen.get_width() - PANEL_WIDTH - 10, 10))
+
+
+# Global frame profiler instance
+frame_profiler = FrameProfiler()
@@ -1,16 +1,32 @@
 import pygame
 import sys
+import math
+
+# Every scene is drawn at this resolution and scaled to the window once per frame
+LOGICAL_SIZE = (1920, 1080)
 
 class DisplayManager:
     """Manages display settings and fullscreen toggling"""
-    def __init__(self, default_width=1920, default_height=1020):
+    def __init__(self, default_width=1920, default_height=1020, logical_size=LOGICAL_SIZE):
         self.default_width = default_width
         self.default_height = default_height
         self.is_fullscreen = False
+        self.window = None
         self.screen = None
         self.fullscreen_size = None
         self.windowed_size = (default_width, default_height)
         
+        # Logical canvas (logical_size=None draws straight to the window instead)
+        self.logical_size = logical_size
+        self.canvas = None
+        # smoothscale looks better for non-integer scale factors but costs ~16 ms per frame at 1080p
+        self.smooth_scaling = False
+        self.viewport = None
+        self.viewport_surface = None
+        
+        # Called with the new window size after every display mode change
+        self.mode_change_callbacks = []
+        
         # Initialize display
         self.initialize_display()
     
@@ -26,33 +42,131 @@ class DisplayManager:
             self.fullscreen_size = (1920, 1080)  # Fallback
         
         # Start in windowed mode
-        self.screen = pygame.display.set_mode(self.windowed_size)
+        window = pygame.display.set_mode(self.windowed_size)
+        if self.logical_size:
+            self.canvas = pygame.Surface(self.logical_size, 0, window)
+        self.set_window(window)
         pygame.display.set_caption("Mikamon: Catgirl Chronicles")
         
         return self.screen
     
+    def set_window(self, window):
+        """Adopt a new window surface and fit the logical canvas into it"""
+        self.window = window
+        if self.canvas is None:
+            self.screen = window
+            return
+        
+        self.screen = self.canvas
+        window_width, window_height = window.get_size()
+        logical_width, logical_height = self.logical_size
+        scale = min(window_width / logical_width, window_height / logical_height)
+        if scale >= 1:
+            scale = int(scale)  # integer upscaling keeps pixels crisp
+        
+        viewport = pygame.Rect(0, 0, int(logical_width * scale), int(logical_height * scale))
+        viewport.center = (window_width // 2, window_height // 2)
+        self.viewport = viewport
+        self.viewport_surface = window.subsurface(viewport)
+        window.fill((0, 0, 0))
+    
+    def present(self, rects=None):
+        """
+        Scale the logical canvas into the window (letterboxed) and flip
+        With rects (logical canvas rects) only those regions are scaled and updated
+        """
+        if rects is not None:
+            self.present_rects(rects)
+            return
+        if self.canvas is not None:
+            self.scale_canvas()
+        pygame.display.flip()
+    
+    def scale_canvas(self):
+        """Copy the whole logical canvas into the window viewport"""
+        if self.viewport.size == self.logical_size:
+            self.viewport_surface.blit(self.canvas, (0, 0))
+        elif self.smooth_scaling:
+            pygame.transform.smoothscale(self.canvas, self.viewport.size, self.viewport_surface)
+        else:
+            pygame.transform.scale(self.canvas, self.viewport.size, self.viewport_surface)
+    
+    def present_rects(self, rects):
+        """Send only the given canvas regions to the window (pygame.display.update)"""
+        if self.canvas is None:
+            pygame.display.update(rects)
+            return
+        
+        canvas_rect = self.canvas.get_rect()
+        viewport = self.viewport
+        scale_x = viewport.width / self.logical_size[0]
+        scale_y = viewport.height / self.logical_size[1]
+        # Regions only scale exactly like the whole frame at integer factors; otherwise
+        # scale the whole canvas as usual and just upload less
+        exact = (not self.smooth_scaling and scale_x == scale_y and scale_x == int(scale_x))
+        if not exact:
+            self.scale_canvas()
+        window_rects = []
+        for rect in rects:
+            rect = pygame.Rect(rect).clip(canvas_rect)
+            if not rect:
+                continue
+            # Round outwards so neighbouring regions never leave a gap
+            left = viewport.x + int(rect.left * scale_x)
+            top = viewport.y + int(rect.top * scale_y)
+            right = viewport.x + min(viewport.width, math.ceil(rect.right * scale_x))
+            bottom = viewport.y + min(viewport.height, math.ceil(rect.bottom * scale_y))
+            target = pygame.Rect(left, top, right - left, bottom - top)
+            if viewport.size == self.logical_size:
+                self.window.blit(self.canvas, target, rect)
+            elif exact:
+                self.window.blit(pygame.transform.scale(self.canvas.subsurface(rect), target.size), target)
+            window_rects.append(target)
+        pygame.display.update(window_rects)
+    
+    def to_logical(self, pos):
+        """Map a window position (mouse, event.pos) to logical canvas coordinates"""
+        if self.canvas is None:
+            return pos
+        viewport = self.viewport
+        return (
+            int((pos[0] - viewport.x) * self.logical_size[0] / viewport.width),
+            int((pos[1] - viewport.y) * self.logical_size[1] / viewport.height)
+        )
+    
+    def get_mouse_pos(self):
+        """Mouse position in logical canvas coordinates"""
+        return self.to_logical(pygame.mouse.get_pos())
+    
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode"""
         if self.is_fullscreen:
             # Switch to windowed
-            self.screen = pygame.display.set_mode(self.windowed_size)
+            self.set_window(pygame.display.set_mode(self.windowed_size))
             self.is_fullscreen = False
             pygame.display.set_caption("Mikamon: Catgirl Chronicles")
             print(f"Switched to windowed mode: {self.windowed_size}")
         else:
             # Switch to fullscreen
-            self.screen = pygame.display.set_mode(self.fullscreen_size, pygame.FULLSCREEN)
+            self.set_window(pygame.display.set_mode(self.fullscreen_size, pygame.FULLSCREEN))
             self.is_fullscreen = True
             print(f"Switched to fullscreen mode: {self.fullscreen_size}")
         
+        for callback in self.mode_change_callbacks:
+            callback(self.window.get_size())
+        
         return self.screen
     
+    def add_mode_change_callback(self, callback):
+        """Register callback(size) to run after the display mode changes"""
+        self.mode_change_callbacks.append(callback)
+    
     def get_screen(self):
-        """Get current screen surface"""
+        """Get the surface scenes draw to (the logical canvas when enabled)"""
         return self.screen
     
     def get_size(self):
-        """Get current screen size"""
+        """Get current screen size (the logical size when the canvas is enabled)"""
         return self.screen.get_size() if self.screen else self.windowed_size
     
     def get_display_info(self):
@@ -60,6 +174,7 @@ class DisplayManager:
         return {
             'is_fullscreen': self.is_fullscreen,
             'current_size': self.get_size(),
+            'window_size': self.window.get_size() if self.window else self.windowed_size,
             'windowed_size': self.windowed_size,
             'fullscreen_size': self.fullscreen_size
         }
@@ -253,6 +368,7 @@ def draw_display_debug_info(screen, font, x=10, y=10):
     debug_lines = [
         f"Display Mode: {'Fullscreen' if info['is_fullscreen'] else 'Windowed'}",
         f"Current: {info['current_size'][0]}x{info['current_size'][1]}",
+        f"Window: {info['window_size'][0]}x{info['window_size'][1]}",
         f"Windowed: {info['windowed_size'][0]}x{info['windowed_size'][1]}",
         f"Fullscreen: {info['fullscreen_size'][0]}x{info['fullscreen_size'][1]}",
         "Toggle: F11, Alt+Enter, Ctrl+F"
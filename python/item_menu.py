@@ -1,7 +1,9 @@
 import pygame
 from python.color import WHITE, BLACK, GRAY, DARK_GRAY, RED, DARK_RED, GOLD, BLUE, DARK_BLUE
 from python.pygame1 import SCREEN, FONT, SMALL_FONT, BIG_FONT
+from python.fullscreen_toggle import display_manager
 from python.shadowed_text_and_buttons import draw_text_with_shadow, draw_gradient_button
+from python.surface_pool import surface_pool
 
 # Global scroll position for item menu
 item_scroll_position = 0
@@ -10,11 +12,9 @@ def draw_item_menu(inventory, current_category="All"):
     """Draw the item selection menu with scrolling support"""
     global item_scroll_position
     
-    menu_surface = pygame.Surface((800, 600), pygame.SRCALPHA)
-    menu_surface.fill((0, 0, 0, 200))
     menu_x = (1920 - 800) // 2
     menu_y = (1080 - 600) // 2
-    SCREEN.blit(menu_surface, (menu_x, menu_y))
+    surface_pool.blit_fill(SCREEN, (0, 0, 0, 200), (menu_x, menu_y, 800, 600))
     
     # Border
     pygame.draw.rect(SCREEN, GOLD, (menu_x, menu_y, 800, 600), 4)
@@ -38,7 +38,7 @@ def draw_item_menu(inventory, current_category="All"):
         else:
             color1, color2 = GRAY, DARK_GRAY
         
-        hover = tab_rect.collidepoint(pygame.mouse.get_pos())
+        hover = tab_rect.collidepoint(display_manager.get_mouse_pos())
         draw_gradient_button(category, tab_rect, color1, color2, hover, SMALL_FONT)
     
     # Item list area
@@ -96,7 +96,7 @@ def draw_item_menu(inventory, current_category="All"):
                     item_buttons.append((item_rect, item))
                     
                     # Item background based on rarity
-                    hover = item_rect.collidepoint(pygame.mouse.get_pos())
+                    hover = item_rect.collidepoint(display_manager.get_mouse_pos())
                     base_color = item.color
                     if hover:
                         base_color = tuple(min(255, c + 40) for c in base_color)
@@ -159,7 +159,7 @@ def draw_item_menu(inventory, current_category="All"):
     # Close button
     close_rect = pygame.Rect(menu_x + 350, menu_y + 540, 100, 40)
     draw_gradient_button("CLOSE", close_rect, DARK_RED, RED, 
-                        close_rect.collidepoint(pygame.mouse.get_pos()), FONT)
+                        close_rect.collidepoint(display_manager.get_mouse_pos()), FONT)
     
     return category_buttons, item_buttons, close_rect
 
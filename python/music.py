@@ -1,4 +1,5 @@
 import os, sys, pygame
+from python.startup_profiler import startup_profiler
 
 # Global variables
 title_music = None
@@ -65,6 +66,7 @@ def find_music_directories():
 
     return unique_dirs
 
+@startup_profiler.timed()
 def find_music_files():
     directories = find_music_directories()
 
@@ -0,0 +1,308 @@
+"""
+Unified Particle Pool
+One preallocated struct-of-arrays pool for battle, item, attack animation and menu
+particles. Systems get a ParticleView onto the pool instead of keeping their own
+Python lists of particle objects, and the whole pool is stepped with one vectorized update.
+"""
+
+import numpy as np
+from python.glow_atlas import glow_atlas
+
+# ============= BEHAVIOUR FLAGS =============
+FADE = 1           # alpha follows remaining life
+SHRINK = 2         # size follows remaining life
+GRAVITY = 4        # kind gravity pulls velocity down every frame
+DRAG = 8           # kind drag damps velocity every frame
+HOMING = 16        # accelerates toward its target as the effect progresses
+SWIRL = 32         # swirls around its path, tightening as the effect progresses
+LINEAR_FADE = 64   # alpha drops by fade_rate per ms regardless of life
+
+# Sprite shapes (index stored per particle)
+SHAPES = ("circle", "halo", "glow", "cross")
+SHAPE_INDEX = {name: i for i, name in enumerate(SHAPES)}
+
+# ============= PARTICLE KINDS =============
+PARTICLE_KINDS = {
+    "spark": {      # hit sparks, MP sparkles, victory confetti
+        "flags": FADE | SHRINK | GRAVITY,
+        "gravity": 0.5,
+        "drag": 1.0,
+        "min_size": 1,
+        "shape": "circle"
+    },
+    "anim": {       # attack animation trails and impacts
+        "flags": FADE | SHRINK | GRAVITY,
+        "gravity": 0.2,
+        "drag": 1.0,
+        "min_size": 2,
+        "shape": "circle"
+    },
+    "item": {       # item use effects (opaque, shrink as they float away)
+        "flags": SHRINK | DRAG,
+        "gravity": 0.0,
+        "drag": 0.98,
+        "min_size": 1,
+        "shape": "circle"
+    },
+    "special": {    # special/ultimate attack orbs
+        "flags": FADE | SHRINK | HOMING,
+        "gravity": 0.0,
+        "drag": 1.0,
+        "min_size": 0,
+        "shape": "halo"
+    },
+    "menu": {       # main menu background motes
+        "flags": LINEAR_FADE,
+        "gravity": 0.0,
+        "drag": 1.0,
+        "min_size": 1,
+        "shape": "circle"
+    }
+}
+
+KIND_NAMES = list(PARTICLE_KINDS)
+KIND_INDEX = {name: i for i, name in enumerate(KIND_NAMES)}
+KIND_GRAVITY = np.array([PARTICLE_KINDS[k]["gravity"] for k in KIND_NAMES], dtype=np.float32)
+KIND_DRAG = np.array([PARTICLE_KINDS[k]["drag"] for k in KIND_NAMES], dtype=np.float32)
+KIND_MIN_SIZE = np.array([PARTICLE_KINDS[k]["min_size"] for k in KIND_NAMES], dtype=np.int32)
+
+# Homing/swirl strengths (tuned at 60 FPS)
+HOMING_STRENGTH = 0.0001
+SWIRL_RADIUS = 30
+SWIRL_SPEED = 0.01
+
+
+class ParticlePool:
+    """Preallocated struct-of-arrays particle storage with free-list allocation"""
+
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+
+        # Motion
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.target_x = np.zeros(capacity, dtype=np.float32)
+        self.target_y = np.zeros(capacity, dtype=np.float32)
+
+        # Lifetime
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.age = np.zeros(capacity, dtype=np.float32)
+        self.span = np.ones(capacity, dtype=np.float32)  # effect duration for homing/swirl
+
+        # Appearance
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.alpha0 = np.zeros(capacity, dtype=np.float32)
+        self.fade_rate = np.zeros(capacity, dtype=np.float32)
+        self.shape = np.zeros(capacity, dtype=np.uint8)
+
+        # Bookkeeping
+        self.kind = np.zeros(capacity, dtype=np.uint8)
+        self.flags = np.zeros(capacity, dtype=np.uint16)
+        self.group = np.full(capacity, -1, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        # Free list (stack of unused slots)
+        self.free_slots = np.arange(capacity - 1, -1, -1, dtype=np.int32)
+        self.free_count = capacity
+        self.next_group = 0
+
+        # Drawing runs this far (ms) past the last update along each particle's velocity
+        # (set by a fixed-timestep loop after stepping; every update starts it over at 0)
+        self.render_ahead_ms = 0.0
+
+    def view(self, kind):
+        """Create a new view (its own particle group) for the given kind"""
+        group = self.next_group
+        self.next_group += 1
+        return ParticleView(self, kind, group)
+
+    def allocate(self, count):
+        """Pop up to count free slots"""
+        count = min(count, self.free_count)
+        slots = self.free_slots[self.free_count - count:self.free_count].copy()
+        self.free_count -= count
+        return slots
+
+    def release(self, slots):
+        """Return slots to the free list"""
+        if len(slots) == 0:
+            return
+        self.alive[slots] = False
+        self.group[slots] = -1
+        self.free_slots[self.free_count:self.free_count + len(slots)] = slots
+        self.free_count += len(slots)
+
+    def active_count(self):
+        return self.capacity - self.free_count
+
+    def update(self, dt):
+        """Step every live particle in one vectorized pass"""
+        self.render_ahead_ms = 0.0
+        idx = np.flatnonzero(self.alive)
+        if len(idx) == 0:
+            return
+
+        dt_factor = dt / 16.67
+        flags = self.flags[idx]
+        kind = self.kind[idx]
+
+        self.age[idx] += dt
+        self.life[idx] -= dt
+
+        vx = self.vx[idx]
+        vy = self.vy[idx]
+        x = self.x[idx]
+        y = self.y[idx]
+
+        gravity = (flags & GRAVITY) != 0
+        if gravity.any():
+            vy[gravity] += KIND_GRAVITY[kind[gravity]] * dt_factor
+
+        drag = (flags & DRAG) != 0
+        if drag.any():
+            damping = KIND_DRAG[kind[drag]] ** dt_factor
+            vx[drag] *= damping
+            vy[drag] *= damping
+
+        progress = np.minimum(1.0, self.age[idx] / self.span[idx])
+
+        homing = (flags & HOMING) != 0
+        if homing.any():
+            pull = HOMING_STRENGTH * progress[homing] * dt_factor
+            vx[homing] += (self.target_x[idx[homing]] - x[homing]) * pull
+            vy[homing] += (self.target_y[idx[homing]] - y[homing]) * pull
+
+        x += vx * dt_factor
+        y += vy * dt_factor
+
+        swirl = (flags & SWIRL) != 0
+        if swirl.any():
+            angle = self.age[idx[swirl]] * SWIRL_SPEED
+            radius = SWIRL_RADIUS * (1 - progress[swirl]) * 0.1 * dt_factor
+            x[swirl] += np.cos(angle + vx[swirl]) * radius
+            y[swirl] += np.sin(angle + vy[swirl]) * radius
+
+        self.vx[idx] = vx
+        self.vy[idx] = vy
+        self.x[idx] = x
+        self.y[idx] = y
+
+        self.release(idx[self.life[idx] <= 0])
+
+
+class ParticleView:
+    """A particle group in the pool, used in place of a list of particle objects"""
+
+    def __init__(self, pool, kind, group):
+        self.pool = pool
+        self.kind = kind
+        self.group = group
+        self.kind_config = PARTICLE_KINDS[kind]
+
+    def _slots(self):
+        pool = self.pool
+        return np.flatnonzero(pool.alive & (pool.group == self.group))
+
+    def __len__(self):
+        return len(self._slots())
+
+    def emit(self, x, y, vx, vy, color, life, size=None, alpha=255, shape=None,
+             target=None, span=None, fade_rate=0.0, extra_flags=0):
+        """
+        Spawn particles; x, y, vx, vy, size, life and alpha may be scalars or arrays
+        Returns the number of particles actually spawned (the pool may be full)
+        """
+        count = int(np.broadcast(x, y, vx, vy, life, 0 if size is None else size, alpha).size)
+        pool = self.pool
+        slots = pool.allocate(count)
+        count = len(slots)
+        if count == 0:
+            return 0
+
+        def take(value):
+            value = np.asarray(value, dtype=np.float32)
+            return value if value.ndim == 0 else value[:count]
+
+        pool.x[slots] = take(x)
+        pool.y[slots] = take(y)
+        pool.vx[slots] = take(vx)
+        pool.vy[slots] = take(vy)
+        pool.life[slots] = take(life)
+        pool.max_life[slots] = np.maximum(1.0, take(life))
+        pool.age[slots] = 0
+        pool.span[slots] = take(span if span is not None else life)
+        pool.size[slots] = take(size if size is not None else 3)
+        pool.alpha0[slots] = take(alpha)
+        pool.fade_rate[slots] = fade_rate
+
+        colors = np.asarray(color, dtype=np.uint8)
+        pool.color[slots] = colors[:count] if colors.ndim == 2 else colors[:3]
+
+        if target is not None:
+            pool.target_x[slots] = target[0]
+            pool.target_y[slots] = target[1]
+
+        pool.shape[slots] = SHAPE_INDEX[shape or self.kind_config["shape"]]
+        pool.kind[slots] = KIND_INDEX[self.kind]
+        pool.flags[slots] = self.kind_config["flags"] | extra_flags
+        pool.group[slots] = self.group
+        pool.alive[slots] = True
+        return count
+
+    def clear(self):
+        """Kill every particle in this view"""
+        self.pool.release(self._slots())
+
+    def get_blits(self):
+        """Atlas sprites and positions for every particle in this view"""
+        slots = self._slots()
+        if len(slots) == 0:
+            return []
+
+        pool = self.pool
+        flags = pool.flags[slots]
+        life_ratio = np.clip(pool.life[slots] / pool.max_life[slots], 0.0, 1.0)
+
+        alpha = pool.alpha0[slots].copy()
+        fade = (flags & FADE) != 0
+        alpha[fade] *= life_ratio[fade]
+        linear = (flags & LINEAR_FADE) != 0
+        alpha[linear] -= pool.age[slots[linear]] * pool.fade_rate[slots[linear]]
+
+        size = pool.size[slots].copy()
+        shrink = (flags & SHRINK) != 0
+        size[shrink] *= life_ratio[shrink]
+        size = np.maximum(KIND_MIN_SIZE[pool.kind[slots]], size.astype(np.int32))
+
+        visible = (alpha > 0) & (size > 0)
+        if not visible.all():
+            slots, alpha, size = slots[visible], alpha[visible], size[visible]
+
+        xs = pool.x[slots]
+        ys = pool.y[slots]
+        if pool.render_ahead_ms:
+            ahead = pool.render_ahead_ms / 16.67
+            xs = xs + pool.vx[slots] * ahead
+            ys = ys + pool.vy[slots] * ahead
+        xs = xs.tolist()
+        ys = ys.tolist()
+        colors = pool.color[slots].tolist()
+        shapes = pool.shape[slots].tolist()
+        alphas = alpha.astype(np.int32).tolist()
+        sizes = size.tolist()
+
+        get_blit = glow_atlas.get_blit
+        return [get_blit(colors[i], xs[i], ys[i], sizes[i], alphas[i], SHAPES[shapes[i]])
+                for i in range(len(slots))]
+
+    def draw(self, surface):
+        """Draw every particle in this view with a single blits call"""
+        surface.blits(self.get_blits(), doreturn=False)
+
+
+# Global particle pool instance
+particle_pool = ParticlePool()
@@ -1,9 +1,13 @@
 import pygame
 from python.fullscreen_toggle import display_manager
-pygame.init()
-SCREEN = display_manager.get_screen()
-pygame.display.set_caption("Mikamon: Catgirl Chronicles")
-FONT = pygame.font.SysFont("Arial", 24)
-SMALL_FONT = pygame.font.SysFont("Arial", 18)
-BIG_FONT = pygame.font.SysFont("Arial", 36, bold=True)
+from python.startup_profiler import startup_profiler
+with startup_profiler.phase("pygame.init"):
+    pygame.init()
+with startup_profiler.phase("display init"):
+    SCREEN = display_manager.get_screen()
+    pygame.display.set_caption("Mikamon: Catgirl Chronicles")
+with startup_profiler.phase("system fonts"):
+    FONT = pygame.font.SysFont("Arial", 24)
+    SMALL_FONT = pygame.font.SysFont("Arial", 18)
+    BIG_FONT = pygame.font.SysFont("Arial", 36, bold=True)
 CLOCK = pygame.time.Clock()
\ No newline at end of file
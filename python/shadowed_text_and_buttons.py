@@ -1,5 +1,6 @@
 from python.color import DARK_GRAY, BLACK, WHITE
 from python.pygame1 import SCREEN, FONT
+from python.digit_atlas import digit_atlas
 import pygame
 def draw_text_with_shadow(text, x, y, color=BLACK, font=None, shadow_offset=2):
     if font is None:
@@ -12,9 +13,20 @@ def draw_text_with_shadow(text, x, y, color=BLACK, font=None, shadow_offset=2):
     SCREEN.blit(render, (x, y))
     return render.get_rect(topleft=(x, y))
 
-def draw_gradient_button(text, rect, color1, color2, hover=False, font=None):
+def draw_number_with_shadow(text, x, y, color=BLACK, font=None, shadow_offset=2):
+    """Same as draw_text_with_shadow but composed from the digit atlas (for values that change often)"""
     if font is None:
         font = FONT
+    shadow_sequence = digit_atlas.layout(text, font, DARK_GRAY, x + shadow_offset, y + shadow_offset)[0]
+    sequence, width, height = digit_atlas.layout(text, font, color, x, y)
+    SCREEN.blits(shadow_sequence + sequence, doreturn=False)
+    return pygame.Rect(x, y, width, height)
+
+def draw_gradient_button(text, rect, color1, color2, hover=False, font=None, surface=None):
+    if font is None:
+        font = FONT
+    if surface is None:
+        surface = SCREEN
     
     # Create gradient surface
     gradient = pygame.Surface((rect.width, rect.height))
@@ -30,8 +42,8 @@ def draw_gradient_button(text, rect, color1, color2, hover=False, font=None):
         b = int(color1[2] * (1-t) + color2[2] * t)
         pygame.draw.line(gradient, (r, g, b), (0, y), (rect.width, y))
     
-    SCREEN.blit(gradient, rect.topleft)
-    pygame.draw.rect(SCREEN, BLACK, rect, 2)
+    surface.blit(gradient, rect.topleft)
+    pygame.draw.rect(surface, BLACK, rect, 2)
     
     text_render = font.render(text, True, WHITE)
     shadow_render = font.render(text, True, DARK_GRAY)
@@ -39,5 +51,5 @@ def draw_gradient_button(text, rect, color1, color2, hover=False, font=None):
     text_x = rect.x + (rect.width - text_rect.width) // 2
     text_y = rect.y + (rect.height - text_rect.height) // 2
     
-    SCREEN.blit(shadow_render, (text_x + 1, text_y + 1))
-    SCREEN.blit(text_render, (text_x, text_y))
\ No newline at end of file
+    surface.blit(shadow_render, (text_x + 1, text_y + 1))
+    surface.blit(text_render, (text_x, text_y))
\ No newline at end of file
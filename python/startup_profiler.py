@@ -0,0 +1,174 @@
+"""
+Startup Timeline Profiler
+Opt-in wall-clock timeline of everything between process start and the first main menu
+frame: module imports, pygame/display init, the music scan, asset and texture loading and
+the loading screen jobs. Enable it with the --profile-startup flag or MIKAMON_PROFILE_STARTUP=1.
+When the first menu frame is shown it prints a flame-style text report and writes
+startup_trace.json (open it in chrome://tracing or https://ui.perfetto.dev).
+
+Only the standard library is imported here, so the profiler can be started before pygame.
+"""
+
+import os
+import sys
+import json
+import time
+import builtins
+import threading
+
+TRACE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "startup_trace.json")
+
+# Imports and textures faster than this are left out of the text report (they stay in the trace)
+REPORT_MIN_MS = 5.0
+REPORT_BAR_WIDTH = 40
+
+
+class _Span:
+    """Context manager recording one timeline event"""
+    def __init__(self, profiler, name, category):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        self.depth = self.profiler.push()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.pop()
+        self.profiler.record(self.name, self.category, self.start, time.perf_counter(), self.depth)
+        return False
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class StartupProfiler:
+    """Collects nested timeline events until the first menu frame"""
+    def __init__(self):
+        self.enabled = "--profile-startup" in sys.argv or os.environ.get("MIKAMON_PROFILE_STARTUP") == "1"
+        self.origin = time.perf_counter()
+        self.events = []  # (name, category, start, end, depth, thread id)
+        self.local = threading.local()
+        self.original_import = None
+        self.finished = False
+
+    def push(self):
+        depth = getattr(self.local, "depth", 0)
+        self.local.depth = depth + 1
+        return depth
+
+    def pop(self):
+        self.local.depth -= 1
+
+    def record(self, name, category, start, end, depth):
+        if not self.finished:
+            self.events.append((name, category, start, end, depth, threading.get_ident()))
+
+    def phase(self, name, category="phase"):
+        """Time a block: with startup_profiler.phase("load assets"): ..."""
+        if not self.enabled or self.finished:
+            return NULL_SPAN
+        return _Span(self, name, category)
+
+    def timed(self, name=None, category="phase"):
+        """Decorator form of phase() for functions called during startup"""
+        def decorator(function):
+            label = name or function.__name__
+            def wrapper(*args, **kwargs):
+                with self.phase(label, category):
+                    return function(*args, **kwargs)
+            wrapper.__name__ = function.__name__
+            wrapper.__doc__ = function.__doc__
+            return wrapper
+        return decorator
+
+    def start(self):
+        """Begin timing imports (call as early as possible in the entry script)"""
+        if not self.enabled or self.original_import is not None:
+            return
+        self.original_import = builtins.__import__
+        original_import = self.original_import
+        modules = sys.modules
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            # Only first-time absolute imports do any work worth timing
+            if level or name in modules or self.finished:
+                return original_import(name, globals, locals, fromlist, level)
+            with _Span(self, name, "import"):
+                return original_import(name, globals, locals, fromlist, level)
+
+        builtins.__import__ = timed_import
+        print("Startup profiler enabled")
+
+    def finish(self):
+        """Stop recording and write the report (only the first call does anything)"""
+        if not self.enabled or self.finished:
+            return
+        end = time.perf_counter()
+        self.record("startup (to first menu frame)", "total", self.origin, end, -1)
+        self.finished = True
+        if self.original_import is not None:
+            builtins.__import__ = self.original_import
+        print(self.get_text_report())
+        self.write_trace()
+
+    def get_text_report(self):
+        """Indented tree per thread (main thread first) with durations and proportional bars"""
+        main_thread = threading.main_thread().ident
+        events = sorted(self.events, key=lambda e: (e[5] != main_thread, e[5], e[2], e[4]))
+
+        # Runs of the same event at the same depth (e.g. one texture per sprite) become one line
+        rows = []  # [name, category, depth, thread, start, seconds, count]
+        for name, category, start, end, depth, thread in events:
+            last = rows[-1] if rows else None
+            if last and last[:4] == [name, category, depth, thread]:
+                last[5] += end - start
+                last[6] += 1
+            else:
+                rows.append([name, category, depth, thread, start, end - start, 1])
+
+        total = max((row[5] for row in rows), default=0) or 1e-9
+        lines = ["=== STARTUP TIMELINE ==="]
+        for name, category, depth, thread, start, seconds, count in rows:
+            ms = seconds * 1000
+            if category not in ("phase", "job", "total", "background") and ms < REPORT_MIN_MS:
+                continue
+            label = f"{name} x{count}" if count > 1 else name
+            if thread != main_thread:
+                label = f"(background) {label}"
+            bar = "#" * max(1, int(REPORT_BAR_WIDTH * seconds / total))
+            offset = (start - self.origin) * 1000
+            lines.append(f"{offset:8.0f} ms {ms:8.1f} ms  {'  ' * (depth + 1)}{label} [{category}] {bar}")
+        return "\n".join(lines)
+
+    def get_trace(self):
+        """Chrome trace event format (complete events, microseconds)"""
+        trace_events = []
+        for name, category, start, end, depth, thread in self.events:
+            trace_events.append({
+                "name": name, "cat": category, "ph": "X", "pid": os.getpid(), "tid": thread,
+                "ts": (start - self.origin) * 1e6, "dur": (end - start) * 1e6
+            })
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path=TRACE_FILE):
+        try:
+            with open(path, "w") as f:
+                json.dump(self.get_trace(), f)
+            print(f"Startup trace written to {path}")
+        except OSError as e:
+            print(f"Could not write startup trace ({e})")
+
+
+# Global startup profiler instance
+startup_profiler = StartupProfiler()
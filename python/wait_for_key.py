@@ -1,17 +1,29 @@
 from python.pygame1 import SCREEN, FONT, CLOCK
-from python.clock import draw_real_time_clock
+from python.fullscreen_toggle import display_manager
+from python.clock import clock_widget, ms_until_next_second
+from python.frame_pacer import frame_pacer
+from python.ui_layer import ui_layer
 from python.shadowed_text_and_buttons import draw_text_with_shadow
 from python.color import YELLOW
 import pygame, sys
+
+PROMPT_TEXT = "Press ESC to continue..."
+
 def wait_for_key():
     """Wait for ESC key with visual feedback"""
     waiting = True
     blink_timer = 0
     
+    # Whatever the caller left on screen stays as the static layer; only the prompt and clock change
+    frozen = SCREEN.copy()
+    ui_layer.leave()
+    
     while waiting:
         blink_timer += CLOCK.get_time()
+        ui_layer.begin("wait_for_key", lambda: SCREEN.blit(frozen, (0, 0)))
         
         for event in pygame.event.get():
+            ui_layer.handle_event(event)
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -24,8 +36,12 @@ def wait_for_key():
         if (blink_timer // 500) % 2:
             screen_width, screen_height = SCREEN.get_size()
             center_x = screen_width // 2
-            draw_text_with_shadow("Press ESC to continue...", center_x - 120, 500, YELLOW, FONT, 2)
+            prompt_rect = pygame.Rect((center_x - 120, 500), FONT.size(PROMPT_TEXT)).inflate(4, 4)
+            ui_layer.widget("prompt", prompt_rect, True,
+                            lambda: draw_text_with_shadow(PROMPT_TEXT, center_x - 120, 500, YELLOW, FONT, 2))
+        
+        ui_layer.widget("clock", *clock_widget())
+        ui_layer.present()
         
-        draw_real_time_clock()
-        pygame.display.flip()
-        CLOCK.tick(60)
\ No newline at end of file
+        # Nothing animates here: sleep until a key, the next blink or the next clock second
+        frame_pacer.tick(animating=False, wake_after=min(500 - blink_timer % 500, ms_until_next_second()))
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""
+Background Weather Loader
+python.weather pulls in Numba, pymunk, PIL, pytweening and OpenCV, and its Numba kernels
+take seconds to compile on a cold cache. The loader imports it and compiles the kernels
+on a loading-screen worker (or a thread of its own) while the player is in the menus; battles wait for it
+briefly and fall back to effect-free weather if it is still not ready.
+"""
+
+import time
+import threading
+import importlib
+from python.startup_profiler import startup_profiler
+
+# How long a battle waits for the weather effects before starting without them (seconds)
+WEATHER_WAIT_TIMEOUT = 5.0
+
+
+class NullWeatherEffects:
+    """Stand-in with the WeatherEffects interface that draws nothing"""
+    def __init__(self):
+        self.current_weather = None
+        self.fog_alpha = 0
+
+    @property
+    def particles(self):
+        return []
+
+    def get_particle_count(self):
+        return 0
+
+    def set_weather(self, weather_type):
+        self.current_weather = weather_type
+
+    def update(self, dt):
+        pass
+
+    def set_render_ahead(self, ms):
+        pass
+
+    def close(self):
+        pass
+
+    def draw(self, screen, scale=1.0):
+        pass
+
+
+class WeatherLoader:
+    """Imports and warms up python.weather on a background thread"""
+    def __init__(self):
+        self.module = None
+        self.error = None
+        self.load_time = None
+        self.ready = threading.Event()
+        self.started = False
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def _claim(self):
+        """True for the one caller that gets to run the load"""
+        with self.lock:
+            if self.started:
+                return False
+            self.started = True
+            return True
+
+    def start(self):
+        """Start loading on a thread of its own (does nothing once loading has started)"""
+        if self._claim():
+            self.thread = threading.Thread(target=self._load, name="weather-loader", daemon=True)
+            self.thread.start()
+
+    def load(self):
+        """Load on the calling thread, e.g. a loading worker (does nothing once loading has started)"""
+        if self._claim():
+            self._load()
+
+    def _load(self):
+        start = time.perf_counter()
+        try:
+            with startup_profiler.phase("import python.weather", "background"):
+                module = importlib.import_module("python.weather")
+            with startup_profiler.phase("weather warm-up", "background"):
+                compile_time = module.warm_up()
+            self.module = module
+            self.load_time = time.perf_counter() - start
+            backends = "with OpenCV" if module.CV2_AVAILABLE else "without OpenCV"
+            print(f"Weather effects ready in {self.load_time:.2f}s "
+                  f"(kernels {compile_time:.2f}s, {backends})")
+        except Exception as e:
+            self.error = e
+            print(f"Weather effects unavailable ({e}); battles run without them")
+        finally:
+            self.ready.set()
+
+    def is_ready(self):
+        return self.ready.is_set()
+
+    def wait(self, timeout=WEATHER_WAIT_TIMEOUT):
+        """Block until loading finishes (starting it if needed); True if the effects are usable"""
+        self.start()
+        self.ready.wait(timeout)
+        return self.module is not None
+
+    def create_effects(self, timeout=WEATHER_WAIT_TIMEOUT):
+        """A new WeatherEffects, or a NullWeatherEffects if loading failed or timed out"""
+        if not self.wait(timeout):
+            if self.error is None:
+                print(f"Weather effects still loading after {timeout:g}s; this battle runs without them")
+            return NullWeatherEffects()
+        return self.module.WeatherEffects()
+
+
+# Global weather loader instance
+weather_loader = WeatherLoader()
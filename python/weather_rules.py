@@ -0,0 +1,103 @@
+"""
+Weather Rules
+Battle-side weather state (type, duration, type boosts). Kept apart from python.weather so
+battles never have to wait for the heavy effects stack to know the weather.
+"""
+
+import random
+from python.color import GRAY, BLUE, PURPLE, LIGHT_GRAY, YELLOW, CYAN
+
+class Weather:
+    """Weather system class - maintains same interface"""
+    def __init__(self):
+        self.current_weather = None
+        self.duration = 0
+        self.weather_types = {
+            "Clear": {
+                "boost_types": ["Human"], 
+                "boost_percentage": 15,
+                "message": "The weather is clear and calm.",
+                "color": LIGHT_GRAY
+            },
+            "Sunny": {
+                "boost_types": ["Light", "Star"], 
+                "boost_percentage": 30,
+                "message": "Brilliant sunshine floods the battlefield!",
+                "color": YELLOW
+            },
+            "Rainy": {
+                "boost_types": ["Oil", "Crude Oil", "Grass"], 
+                "boost_percentage": 35,
+                "message": "Torrential rain pounds the battlefield!",
+                "color": BLUE
+            },
+            "Windy": {
+                "boost_types": ["Imagination", "Catgirl"], 
+                "boost_percentage": 20,
+                "message": "Fierce winds howl across the battlefield!",
+                "color": CYAN
+            },
+            "Stormy": {
+                "boost_types": ["Bonk", "Mod"], 
+                "boost_percentage": 40,
+                "message": "A violent storm rages with thunder and lightning!",
+                "color": PURPLE
+            },
+            "Misty": {
+                "boost_types": ["Miwiwi", "Miwawa"], 
+                "boost_percentage": 28,
+                "message": "Dense mist shrouds the battlefield!",
+                "color": GRAY
+            }
+        }
+        self.change_weather()
+    
+    def change_weather(self):
+        """Change weather with time-of-day restrictions"""
+        import datetime
+        
+        old_weather = self.current_weather
+        
+        # Get current hour to determine if it's night
+        current_hour = datetime.datetime.now().hour
+        is_night = current_hour >= 22 or current_hour < 6
+        
+        # Create list of available weather types
+        available_weather = list(self.weather_types.keys())
+        
+        # Remove Sunny from options during night time (10 PM - 6 AM)
+        if is_night and "Sunny" in available_weather:
+            available_weather.remove("Sunny")
+            print("Night time detected - Sunny weather excluded")
+        
+        # Choose random weather from available options
+        self.current_weather = random.choice(available_weather)
+        self.duration = random.randint(3, 6)
+        
+        return old_weather != self.current_weather
+    
+    def get_boost_multiplier(self, move_type):
+        if move_type in self.weather_types[self.current_weather]["boost_types"]:
+            boost_percentage = self.weather_types[self.current_weather]["boost_percentage"]
+            return 1.0 + (boost_percentage / 100.0)
+        return 1.0
+    
+    def get_weather_info(self):
+        weather_data = self.weather_types[self.current_weather]
+        boosted_types = ", ".join(weather_data["boost_types"])
+        boost_percent = weather_data["boost_percentage"]
+        return {
+            "name": self.current_weather,
+            "duration": self.duration,
+            "boosted_types": boosted_types,
+            "boost_percent": boost_percent,
+            "message": weather_data["message"],
+            "color": weather_data["color"]
+        }
+    
+    def update_turn(self):
+        if self.duration > 0:
+            self.duration -= 1
+            if self.duration <= 0:
+                return self.change_weather()
+        return False